@@ -5,10 +5,28 @@ Script de build simple pour la nouvelle architecture
 
 import os
 import shutil
+import sqlite3
 import subprocess
 import sys
 
 
+def snapshot_database(src, dst):
+    """Copie coherente de la BD SQLite, y compris les pages encore dans le WAL.
+
+    shutil.copy2 ne copierait que le fichier principal: en mode WAL, les derniers
+    commits sont dans db.db-wal tant qu'aucun checkpoint n'a eu lieu.
+    """
+    source = sqlite3.connect(src)
+    try:
+        target = sqlite3.connect(dst)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
 def main():
     """Build l'application avec la nouvelle structure."""
     print("LEAGUE STATS COACH - BUILD (nouvelle architecture)")
@@ -21,7 +39,14 @@ def main():
             print(f"Nettoye: {dir_name}")
 
     # Build avec PyInstaller using LeagueStatsCoach.spec
-    # La BD SQLite locale (data/db.db) est embarquee dans l'executable
+    # La BD SQLite locale (data/db.db) est embarquee dans l'executable:
+    # on vide d'abord le WAL dans le fichier principal
+    if os.path.exists("data/db.db"):
+        conn = sqlite3.connect("data/db.db")
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
     print("\nConstruction de l'executable avec LeagueStatsCoach.spec...")
 
     cmd = [sys.executable, "-m", "PyInstaller", "--clean", "LeagueStatsCoach.spec"]
@@ -51,7 +76,7 @@ def main():
 
     # Copier la base de données explicitement à côté de l'exe
     if os.path.exists("data/db.db"):
-        shutil.copy2("data/db.db", f"{release_dir}/db.db")
+        snapshot_database("data/db.db", f"{release_dir}/db.db")
         print("Base de donnees copiee (data/db.db -> release/db.db)")
     else:
         print("ATTENTION: data/db.db introuvable - l'exe ne fonctionnera pas!")
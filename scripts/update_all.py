@@ -108,8 +108,11 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--workers",
         type=int,
-        default=scraping_config.DEFAULT_MAX_WORKERS,
-        help=f"Parallel Selenium workers (default: {scraping_config.DEFAULT_MAX_WORKERS})",
+        default=None,
+        help=(
+            "Parallel Selenium workers (default: LEAGUESTATS_WORKERS or "
+            f"{scraping_config.DEFAULT_MAX_WORKERS}, capped to the host)"
+        ),
     )
     parser.add_argument(
         "--skip-synergies", action="store_true", help="Scrape matchups only (faster diagnostic run)"
@@ -150,7 +153,7 @@ def main() -> int:
 
     logger.info("=" * 80)
     logger.info(
-        "update_all starting — patch=%s, workers=%d, synergies=%s (log: %s)",
+        "update_all starting — patch=%s, workers=%s, synergies=%s (log: %s)",
         args.patch,
         args.workers,
         not args.skip_synergies,
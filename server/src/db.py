@@ -177,10 +177,27 @@ class Synergy(Base):
 # ========================================
 
 # Thread-local storage for engines (each thread/event loop gets its own engine)
+import asyncio
 import threading
 
 _thread_local = threading.local()
 
+# Event loop running in a daemon thread, shared by every sync Database wrapper
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get (starting it on first use) the event loop of the sync Database wrapper."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever, name="db-event-loop", daemon=True
+            ).start()
+    return _background_loop
+
 
 def get_engine() -> AsyncEngine:
     """Get or create async database engine (thread-local).
@@ -313,6 +330,12 @@ async def close_all_connections() -> None:
         await _thread_local.engine.dispose()
         _thread_local.engine = None
 
+    # The sync Database wrapper has its own engine on the background loop
+    if _background_loop is not None and asyncio.get_running_loop() is not _background_loop:
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(close_all_connections(), _background_loop)
+        )
+
 
 # ========================================
 # SYNCHRONOUS DATABASE WRAPPER
@@ -342,12 +365,15 @@ class Database:
     def _run_async(self, coro):
         """Run an async coroutine synchronously.
 
-        This method always uses asyncio.run() in a thread pool to ensure
-        isolation from any existing event loops. This is necessary because:
+        The coroutine runs on the shared background event loop (see
+        _get_background_loop), never on the caller's loop. This is necessary because:
         1. FastAPI TestClient runs in an event loop
         2. Multiple tests share the same Database instance
         3. We need clean separation between async contexts
 
+        The loop thread keeps its engine, so queries reuse pooled connections
+        instead of opening a new thread, event loop and connection per call.
+
         Args:
             coro: Async coroutine to execute
 
@@ -355,12 +381,8 @@ class Database:
             Result of the coroutine execution
         """
         import asyncio
-        import concurrent.futures
 
-        # Always run in a thread pool to isolate from existing event loops
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            future = pool.submit(asyncio.run, coro)
-            return future.result()
+        return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
 
     def get_champion_id(self, name: str) -> Optional[int]:
         """Get champion ID by name.
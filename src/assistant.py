@@ -129,7 +129,7 @@ class Assistant:
         - Reverse cache: champion as enemy -> pickers (for ban recommendations)
 
         Performance impact:
-        - First call: ~20ms per champion (2x queries)
+        - First call: ~10ms per champion (1 query for both directions)
         - Reverse lookups: ~99% faster (0 SQL queries after warm-up)
 
         Args:
@@ -143,14 +143,13 @@ class Assistant:
         reverse_cached = 0
 
         for champion in champion_pool:
-            # Direct cache: champion -> enemies
-            matchups = self.db.get_champion_matchups_for_draft(champion)
+            # Direct (champion -> enemies) and reverse (champion as enemy -> pickers)
+            # come back from a single query
+            matchups, reverse_matchups = self.db.get_matchups_bidirectional(champion)
             if matchups:
                 self._matchups_cache[champion] = matchups
                 direct_cached += 1
 
-            # Reverse cache: champion as enemy -> pickers
-            reverse_matchups = self.db.get_reverse_matchups_for_draft(champion)
             if reverse_matchups:
                 self._reverse_cache[champion] = reverse_matchups
                 reverse_cached += 1
@@ -482,7 +481,7 @@ class Assistant:
 
         print("[INFO] Calculating global champion scores...")
 
-        champions_scored = 0
+        score_rows = []
         all_champions = list(self.db.get_all_champion_names().values())
 
         for champion in all_champions:
@@ -547,17 +546,17 @@ class Assistant:
                         print(f"  [ERROR] {champion}: Could not get champion ID")
                     continue
 
-                self.db.save_champion_scores(
-                    champion_id=champion_id,
-                    avg_delta2=avg_delta2,
-                    variance=variance,
-                    coverage=coverage,
-                    peak_impact=peak_impact,
-                    volatility=volatility,
-                    target_ratio=target_ratio,
+                score_rows.append(
+                    (
+                        champion_id,
+                        avg_delta2,
+                        variance,
+                        coverage,
+                        peak_impact,
+                        volatility,
+                        target_ratio,
+                    )
                 )
-
-                champions_scored += 1
                 if self.verbose:
                     print(
                         f"  [OK] {champion}: avg_delta2={avg_delta2:.3f}, variance={variance:.3f}, coverage={coverage:.3f}"
@@ -567,6 +566,8 @@ class Assistant:
                 print(f"  [ERROR] {champion}: {e}")
                 continue
 
+        # One transaction for all champions instead of a commit per champion
+        champions_scored = self.db.save_champion_scores_bulk(score_rows)
         print(f"[SUCCESS] Scored {champions_scored}/{len(all_champions)} champions")
         return champions_scored
 
@@ -6,9 +6,13 @@ false positives on legitimate pages that are simply slow to load.
 
 When a challenge is detected, waits up to CLOUDFLARE_WAIT_SECONDS for the
 JS challenge to auto-resolve and redirect to the real page before raising.
+
+Also detects rate-limit pages (HTTP 429 / Cloudflare error 1015) so the
+scraper can back off instead of hammering the site again.
 """
 
 import logging
+import re
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -44,12 +48,81 @@ _CF_TITLES = (
 )
 
 
+# Titles of rate-limit pages: Cloudflare 1015 ("Access denied | <site> used
+# Cloudflare to restrict access") and plain HTTP 429 responses.
+_RATE_LIMIT_TITLES = ("access denied", "too many requests", "rate limited", "429")
+
+# Body markers confirming a rate-limit page (the title alone is too generic).
+_RATE_LIMIT_MARKERS = ("error 1015", "being rate limited", "too many requests")
+
+# "Retry-After: 30", "retry after 30 seconds", "try again in 30 seconds"
+_RETRY_AFTER_RE = re.compile(r"(?:retry[- ]after|try again in)[:\s]+(\d+)", re.IGNORECASE)
+
+
 class CloudflareException(Exception):
     """Raised when Cloudflare protection page is detected."""
 
     pass
 
 
+class RateLimitedException(Exception):
+    """Raised when the site answered with a rate-limit page.
+
+    Attributes:
+        retry_after: Seconds the server asked us to wait, if it said so.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def detect_rate_limit(driver: webdriver.Firefox, url: str = "") -> None:
+    """
+    Detects rate-limit pages (HTTP 429 / Cloudflare error 1015).
+
+    Selenium does not expose response headers, so the Retry-After hint is
+    read from the page text when the server spells it out.
+
+    Args:
+        driver: Active Firefox WebDriver instance.
+        url: URL that was loaded, used for logging purposes only.
+
+    Raises:
+        RateLimitedException: When the current page is a rate-limit page.
+    """
+    try:
+        title = driver.title.lower().strip()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("cloudflare_detector: could not read page title: %s", exc)
+        return
+
+    if not any(marker in title for marker in _RATE_LIMIT_TITLES):
+        return
+
+    try:
+        text = driver.execute_script("return document.body ? document.body.innerText : '';")
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("cloudflare_detector: could not read page text: %s", exc)
+        return
+    if not isinstance(text, str):
+        return
+
+    text = text.lower()
+    if not (any(marker in text for marker in _RATE_LIMIT_MARKERS) or "429" in title):
+        return
+
+    match = _RETRY_AFTER_RE.search(text)
+    retry_after = float(match.group(1)) if match else None
+    logger.warning(
+        "cloudflare_detector: rate limited (title=%r, retry_after=%s, url=%s)",
+        title,
+        retry_after,
+        url,
+    )
+    raise RateLimitedException(f"Rate limited: title={title!r}, url={url}", retry_after=retry_after)
+
+
 def detect_cloudflare(
     driver: webdriver.Firefox, url: str = "", wait_timeout: int | None = None
 ) -> None:
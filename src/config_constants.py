@@ -19,6 +19,10 @@ class ScrapingConfig:
     # Page interaction delays
     PAGE_LOAD_DELAY: float = 2.0
     SCROLL_DELAY: float = 2.0
+    # Upper bounds for the explicit waits that replace those delays in Parser
+    # (each wait returns as soon as the page/scroll is actually ready)
+    PAGE_LOAD_TIMEOUT: float = 15.0
+    SCROLL_TIMEOUT: float = 5.0
 
     # Cloudflare handling
     # How long to wait for the CF JS challenge to auto-resolve.
@@ -26,6 +30,17 @@ class ScrapingConfig:
     # a Managed Challenge (CAPTCHA) instead of auto-resolving.
     CLOUDFLARE_WAIT_SECONDS: int = 120
 
+    # Retry backoff for failed champion scrapes: jittered exponential backoff
+    # (2s, 4s, 8s... capped) so workers failing together do not retry in lockstep.
+    RETRY_BACKOFF_MAX: float = 60.0
+    RETRY_JITTER: float = 2.0
+    # Minimum wait after a rate-limit page that carries no Retry-After hint
+    RATE_LIMIT_MIN_WAIT: float = 30.0
+    # Page loads allowed per second across all parallel workers, with bursts of up
+    # to REQUEST_BURST (token bucket). 0 disables the client-side pacing.
+    REQUESTS_PER_SECOND: float = 4.0
+    REQUEST_BURST: int = 8
+
     # Random delay ranges (replace fixed delays with ranges for anti-detection)
     PAGE_LOAD_DELAY_MIN: float = 1.5
     PAGE_LOAD_DELAY_MAX: float = 3.5
@@ -44,11 +59,55 @@ class ScrapingConfig:
 
     # Scroll distance for horizontal matchup carousel
     MATCHUP_CAROUSEL_SCROLL_X: int = 460
+    # After scrolling a carousel row, wait (at most CAROUSEL_SETTLE_TIMEOUT) until its
+    # item count and scroll offset are unchanged between two polls
+    CAROUSEL_SETTLE_TIMEOUT: float = 2.0
+    CAROUSEL_SETTLE_POLL: float = 0.1
+
+    # How each carousel frame is read (one WebDriver round-trip either way):
+    #   "page_source": serialize the page and parse it locally with lxml
+    #   "script": extract the raw fields in-browser with a single execute_script
+    CAROUSEL_EXTRACTION: str = "page_source"
 
     # Parallel scraping configuration
     DEFAULT_MAX_WORKERS: int = 5  # Optimal for i5-14600KF (20 threads, 50% usage)
-    FIREFOX_STARTUP_DELAY: float = 1.0  # Minimal delay for Firefox initialization
+    # ParallelParser caps its worker count so each Firefox instance gets this much
+    # available RAM and no more browsers run than there are CPU cores.
+    # LEAGUESTATS_WORKERS (env) overrides DEFAULT_MAX_WORKERS when no count is given.
+    MEMORY_PER_WORKER_BYTES: int = 1_500_000_000
+    # Run all ParallelParser workers as tabs of a single Firefox instead of one
+    # browser each: far less RAM, but page loads are serialized on that browser.
+    SHARED_BROWSER: bool = False
+    # Seconds ParallelParser waits for its webdrivers to quit (closed concurrently)
+    PARSER_CLOSE_TIMEOUT: float = 10.0
+    # Opt-in: scraped pages are cached on disk and reused by ParallelParser for this
+    # many seconds, so a rerun after a crash resumes instead of restarting (e.g.
+    # 12 * 3600; keep it under a day so the daily auto-update scrapes fresh data).
+    # 0 (default) disables it: a full refresh always reloads every page.
+    # Empty directory = "scrape_cache" next to the database.
+    SCRAPE_CACHE_TTL: int = 0
+    SCRAPE_CACHE_DIR: str = ""
+    # Headless browsers kept alive by Parser.close() for reuse by the next Parser
+    # (quit by ParallelParser.close() or at interpreter exit). 0 (default) disables
+    # pooling: close() always quits.
+    BROWSER_POOL_SIZE: int = 0
+    FIREFOX_STARTUP_DELAY: float = 1.0  # Window manager settle delay (GUI mode only)
     HEADLESS: bool = True  # Run Firefox in headless mode (no GUI, better performance)
+    # Worker processes for carousel HTML parsing in ParallelParser (0 = parse in the
+    # scraping thread). Lets lxml parsing of N workers run without GIL contention.
+    PARSE_PROCESSES: int = 0
+    # Scraped rows are buffered and inserted this many at a time (one executemany +
+    # one commit per batch instead of one commit per champion).
+    DB_WRITE_BATCH_SIZE: int = 500
+    # "eager" returns from webdriver.get() on DOMContentLoaded instead of waiting for
+    # every image/ad to finish loading. Matchup rows are awaited explicitly anyway.
+    PAGE_LOAD_STRATEGY: str = "eager"
+    # Don't download/decode images: only DOM text is scraped. Stylesheets stay
+    # enabled because the carousel scrolling and lazy-loading depend on layout.
+    BLOCK_IMAGES: bool = True
+    # Firefox tracking protection: ad/analytics/tracker requests are never made,
+    # which shortens page loads (the scraped stats come from lolalytics itself).
+    BLOCK_TRACKERS: bool = True
 
     # ── Multi-lane scraping (Horizon 1) ──────────────────────────────────────
     # LoLalytics lane identifiers, as used in ?lane= URLs and stored in the
@@ -66,6 +125,12 @@ class ScrapingConfig:
     LANE_DISCOVERY_USER_AGENT: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:127.0) Gecko/20100101 Firefox/127.0"
     )
+    # Single-matchup pages can be fetched the same way (Parser.get_matchup_data_on_patch),
+    # falling back to the browser when the stats are not in the SSR HTML. Opt-in:
+    # LoLalytics often answers plain clients with a Cloudflare challenge.
+    MATCHUP_HTTP_FIRST: bool = False
+    MATCHUP_HTTP_TIMEOUT: int = 20
+    MATCHUP_HTTP_MAX_WORKERS: int = 8
 
     # Firefox profile path for Cloudflare bypass via cf_clearance cookie reuse.
     # Set to an existing Firefox profile that has already solved CF challenges on
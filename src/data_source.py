@@ -143,6 +143,22 @@ class DataSource(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_matchups_bidirectional(
+        self, champion_name: str
+    ) -> Tuple[List["MatchupDraft"], List["MatchupDraft"]]:
+        """
+        Direct and reverse draft matchups of a champion in a single round-trip.
+
+        Args:
+            champion_name: Name of the champion
+
+        Returns:
+            Tuple (direct, reverse): champion as picker -> enemies, and champion as
+            enemy -> pickers (same rows as the two per-direction draft queries)
+        """
+        pass
+
     @abstractmethod
     def get_matchup_delta2(self, champion_name: str, enemy_name: str) -> Optional[float]:
         """
@@ -232,6 +248,19 @@ class DataSource(ABC):
         """
         pass
 
+    @abstractmethod
+    def preload_delta2_cache(self) -> Tuple[int, int]:
+        """
+        Load all matchup and synergy delta2 values once for a long-lived session.
+
+        Afterwards get_matchup_delta2() and get_synergy_delta2() answer from memory
+        instead of running one query per pair.
+
+        Returns:
+            Tuple (matchup_pairs, synergy_pairs) loaded
+        """
+        pass
+
     # ==================== Champion Scores ====================
 
     @abstractmethod
@@ -293,6 +322,19 @@ class DataSource(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_champion_scores_bulk(self, rows: List[tuple]) -> int:
+        """Save or update scores of many champions in a single transaction.
+
+        Args:
+            rows: List of tuples (champion_id, avg_delta2, variance, coverage,
+                  peak_impact, volatility, target_ratio)
+
+        Returns:
+            Number of rows saved
+        """
+        pass
+
     # ==================== Ban Recommendations ====================
 
     @abstractmethod
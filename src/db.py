@@ -13,9 +13,12 @@ class Database:
 
     def connect(self) -> None:
         try:
-            self.connection = sqlite3.connect(self.path)
+            # The draft/scoring paths cycle through more distinct queries than the
+            # default 128-entry statement cache holds; keep them all compiled
+            self.connection = sqlite3.connect(self.path, cached_statements=256)
             # Enable foreign key constraints
             self.connection.execute("PRAGMA foreign_keys = ON")
+            self._configure_journal()
             print("Connection to SQLite DB successful")
             # Ensure indexes exist for optimal performance (only if tables exist)
             try:
@@ -26,6 +29,20 @@ class Database:
         except Error as e:
             print(f"The error '{e}' occurred")
 
+    def _configure_journal(self) -> None:
+        """Use WAL so UI reads are not blocked by score recalculation or scraping writes.
+
+        WAL is persistent in the database file; synchronous=NORMAL is safe with WAL
+        (a power loss may only drop the last commits) and avoids an fsync per commit.
+        """
+        try:
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+            self.connection.execute("PRAGMA temp_store = MEMORY")
+        except Error as e:
+            # e.g. read-only database directory: keep the default rollback journal
+            print(f"[WARNING] Could not enable WAL journal: {e}")
+
     def close(self) -> None:
         if self.connection is not None:
             self.connection.close()
@@ -545,8 +562,10 @@ class Database:
             for name, champ_id in all_champions:
                 # Add official name (exact case) - now these are Riot keys like "DrMundo"
                 cache[name] = champ_id
-                # Add lowercase version for flexible matching
-                cache[name.lower()] = champ_id
+                # Add lowercase version for flexible matching (unless it is the same key)
+                lower = name.lower()
+                if lower != name:
+                    cache[lower] = champ_id
 
             return cache
         except Exception as e:
@@ -687,6 +706,50 @@ class Database:
             print(f"The error '{e}' occurred")
             return []
 
+    def get_matchups_bidirectional(
+        self, champion_name: str
+    ) -> Tuple[List[MatchupDraft], List[MatchupDraft]]:
+        """
+        Direct and reverse draft matchups of a champion in a single query.
+
+        Same rows as get_champion_matchups_for_draft() and get_reverse_matchups_for_draft()
+        (each side keeps its own filter), but the champion is resolved once and both sides
+        come back from one UNION ALL, tagged 'F' (forward) or 'R' (reverse).
+
+        Args:
+            champion_name: Name of the champion
+
+        Returns:
+            Tuple (direct, reverse) of MatchupDraft lists. Empty lists if champion not found.
+        """
+        champ_id = self.get_champion_id(champion_name)
+        if champ_id is None:
+            return [], []
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT 'F', c.name, m.delta2, m.pickrate, m.games
+                FROM matchups m
+                JOIN champions c ON m.enemy = c.id
+                WHERE m.champion = ? AND m.pickrate > 0.5
+                UNION ALL
+                SELECT 'R', c.name, m.delta2, m.pickrate, m.games
+                FROM matchups m
+                JOIN champions c ON m.champion = c.id
+                WHERE m.enemy = ? AND m.pickrate >= 0.5 AND m.games >= 200
+            """,
+                (champ_id, champ_id),
+            )
+            direct, reverse = [], []
+            for side, *row in cursor.fetchall():
+                (direct if side == "F" else reverse).append(MatchupDraft.from_tuple(row))
+            return direct, reverse
+        except Error as e:
+            print(f"The error '{e}' occurred")
+            return [], []
+
     def add_matchups_batch(
         self,
         matchup_data: List[tuple],
@@ -885,6 +948,39 @@ class Database:
             print(f"[ERROR] Failed to load bulk matchups: {e}")
             return {}
 
+    def get_all_matchup_delta2_aggregated(self) -> dict:
+        """
+        Load every get_matchup_delta2() answer in a single SQL query.
+
+        Unlike get_all_matchups_bulk() (one row per pair, last lane wins), lanes are
+        aggregated the same way as get_matchup_delta2(): weighted average by games.
+
+        Returns:
+            Dict mapping (champion_name.lower(), enemy_name.lower()) -> delta2
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """
+                SELECT c1.name, c2.name, SUM(m.delta2 * m.games), SUM(m.games)
+                FROM matchups m
+                JOIN champions c1 ON m.champion = c1.id
+                JOIN champions c2 ON m.enemy = c2.id
+                WHERE m.pickrate >= 0.5
+                AND m.games >= 200
+                GROUP BY m.champion, m.enemy
+            """
+            )
+            return {
+                (champion_name.lower(), enemy_name.lower()): total_weighted / total_games
+                for champion_name, enemy_name, total_weighted, total_games in cursor.fetchall()
+                if total_games
+            }
+
+        except Exception as e:
+            print(f"[ERROR] Failed to load aggregated matchups: {e}")
+            return {}
+
     # ========== Synergies Methods ==========
 
     def add_synergy(
@@ -991,6 +1087,7 @@ class Database:
         self,
         synergies: List[Tuple[str, str, float, float, float, float, int]],
         lane: Optional[str] = None,
+        champion_cache: Optional[Dict[str, int]] = None,
     ) -> None:
         """Batch insert synergies for performance.
 
@@ -998,14 +1095,20 @@ class Database:
             synergies: List of tuples (champion, ally, winrate, delta1, delta2, pickrate, games)
             lane: Optional lane tag applied to every row of the batch
                   (one batch = one champion scraped on one lane). None = legacy/default lane.
+            champion_cache: Optional pre-built cache of champion name->ID mappings.
+                  Without it, each row costs two get_champion_id() queries.
         """
         cursor = self.connection.cursor()
         try:
             # Convert champion/ally names to IDs
             synergy_data = []
             for champion, ally, winrate, delta1, delta2, pickrate, games in synergies:
-                champ_id = self.get_champion_id(champion)
-                ally_id = self.get_champion_id(ally)
+                if champion_cache is not None:
+                    champ_id = champion_cache.get(champion) or champion_cache.get(champion.lower())
+                    ally_id = champion_cache.get(ally) or champion_cache.get(ally.lower())
+                else:
+                    champ_id = self.get_champion_id(champion)
+                    ally_id = self.get_champion_id(ally)
                 if champ_id and ally_id:
                     synergy_data.append(
                         (champ_id, ally_id, winrate, delta1, delta2, pickrate, games, lane)
@@ -1046,12 +1149,15 @@ class Database:
     def get_synergy_delta2(self, champion_name: str, ally_name: str) -> Optional[float]:
         """Get delta2 value for a specific champion-ally synergy.
 
+        Aggregates multi-lane synergy data using weighted average by games,
+        like get_matchup_delta2().
+
         Args:
             champion_name: Name of the champion
             ally_name: Name of the allied champion
 
         Returns:
-            delta2 value if synergy exists, None otherwise
+            Weighted average delta2 value if synergy exists, None otherwise
         """
         champ_id = self.get_champion_id(champion_name)
         ally_id = self.get_champion_id(ally_name)
@@ -1063,7 +1169,7 @@ class Database:
             cursor = self.connection.cursor()
             cursor.execute(
                 """
-                SELECT delta2
+                SELECT delta2, games
                 FROM synergies
                 WHERE champion = ? AND ally = ?
                 AND pickrate >= 0.5
@@ -1072,12 +1178,16 @@ class Database:
                 (champ_id, ally_id),
             )
 
-            result = cursor.fetchone()
-            if result:
-                return float(result[0])
-            else:
+            rows = cursor.fetchall()
+            if not rows:
                 return None
 
+            # Weighted average by games: SUM(delta2 * games) / SUM(games)
+            total_weighted = sum(row[0] * row[1] for row in rows)
+            total_games = sum(row[1] for row in rows)
+
+            return total_weighted / total_games if total_games > 0 else None
+
         except Exception as e:
             print(f"[ERROR] Database error getting synergy {champion_name} with {ally_name}: {e}")
             return None
@@ -1122,6 +1232,39 @@ class Database:
             print(f"[ERROR] Failed to load bulk synergies: {e}")
             return {}
 
+    def get_all_synergy_delta2_aggregated(self) -> dict:
+        """
+        Load every get_synergy_delta2() answer in a single SQL query.
+
+        Unlike get_all_synergies_bulk() (one row per pair, last lane wins), lanes are
+        aggregated the same way as get_synergy_delta2(): weighted average by games.
+
+        Returns:
+            Dict mapping (champion_name.lower(), ally_name.lower()) -> delta2
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """
+                SELECT c1.name, c2.name, SUM(s.delta2 * s.games), SUM(s.games)
+                FROM synergies s
+                JOIN champions c1 ON s.champion = c1.id
+                JOIN champions c2 ON s.ally = c2.id
+                WHERE s.pickrate >= 0.5
+                AND s.games >= 200
+                GROUP BY s.champion, s.ally
+            """
+            )
+            return {
+                (champion_name.lower(), ally_name.lower()): total_weighted / total_games
+                for champion_name, ally_name, total_weighted, total_games in cursor.fetchall()
+                if total_games
+            }
+
+        except Exception as e:
+            print(f"[ERROR] Failed to load aggregated synergies: {e}")
+            return {}
+
     # ========== db_meta Methods (data freshness monitoring) ==========
 
     def set_meta(self, key: str, value: str) -> None:
@@ -1194,6 +1337,35 @@ class Database:
         except Error as e:
             print(f"Error saving champion scores for ID {champion_id}: {e}")
 
+    def save_champion_scores_bulk(self, rows: List[tuple]) -> int:
+        """
+        Save or update scores of many champions in a single transaction.
+
+        Args:
+            rows: List of tuples (champion_id, avg_delta2, variance, coverage,
+                  peak_impact, volatility, target_ratio)
+
+        Returns:
+            Number of rows saved (0 on error, nothing is written)
+        """
+        if not rows:
+            return 0
+
+        try:
+            with self.connection:
+                self.connection.executemany(
+                    """
+                    INSERT OR REPLACE INTO champion_scores
+                    (id, avg_delta2, variance, coverage, peak_impact, volatility, target_ratio)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+            return len(rows)
+        except Error as e:
+            print(f"Error saving champion scores: {e}")
+            return 0
+
     def get_champion_scores(self, champion_id: int) -> Optional[Dict[str, float]]:
         """Get champion scores by champion ID."""
         cursor = self.connection.cursor()
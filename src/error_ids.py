@@ -99,9 +99,11 @@ ERR_COOKIE_001 = ErrorID(
     "ERR_COOKIE_001",
     ErrorCategory.COOKIE,
     ErrorSeverity.ERROR,
-    "Cookie banner ID selector failed with unexpected error",
+    "Cookie banner probe script failed with unexpected error",
 )
 
+# ERR_COOKIE_002..004 are no longer logged: the ID/CSS/XPath strategies now run in a
+# single probe script (ERR_COOKIE_001). Codes are kept so they are never reused.
 ERR_COOKIE_002 = ErrorID(
     "ERR_COOKIE_002",
     ErrorCategory.COOKIE,
@@ -4,7 +4,7 @@ Pipeline:
     1. Refresh champions from the Riot API, reset matchups/synergies tables
     2. Discover the lanes played by each champion (>10% of its games),
        via cheap HTTP requests (src/lane_discovery.py)
-    3. Scrape matchups then synergies once per (lane, champions) group,
+    3. Scrape matchups and synergies in one pass per (lane, champions) group,
        tagging every row with its lane (migration b7e41c9a3f02)
 
 Champions whose lane discovery failed fall back to the legacy behavior:
@@ -110,20 +110,21 @@ def scrape_all_multilane(
         "synergies": {},
     }
 
-    # ── 3. Matchups, one parallel pass per lane group ────────────────────────
+    # ── 3. Matchups (+ synergies), one parallel pass per lane group ─────────
+    # Both live on the same champion page: scraping them in one pass loads
+    # each (champion, lane) page once instead of once per phase.
     for lane, champs in groups.items():
-        stats["matchups"][lane or "default"] = parser.parse_champions_by_role(
-            db, champs, lane, normalize_func, init_tables=False
-        )
-
-    # ── 4. Synergies, same groups ────────────────────────────────────────────
-    if include_synergies:
-        for lane, champs in groups.items():
-            stats["synergies"][lane or "default"] = parser.parse_synergies_by_role(
+        label = lane or "default"
+        if include_synergies:
+            stats["matchups"][label], stats["synergies"][label] = (
+                parser.parse_matchups_and_synergies_by_role(db, champs, lane, normalize_func)
+            )
+        else:
+            stats["matchups"][label] = parser.parse_champions_by_role(
                 db, champs, lane, normalize_func, init_tables=False
             )
 
-    # ── 5. Aggregated counters ───────────────────────────────────────────────
+    # ── 4. Aggregated counters ───────────────────────────────────────────────
     all_phase_stats = list(stats["matchups"].values()) + list(stats["synergies"].values())
     stats["success"] = sum(s.get("success", 0) for s in all_phase_stats)
     stats["failed"] = sum(s.get("failed", 0) for s in all_phase_stats)
@@ -27,21 +27,26 @@ Usage:
         parallel_parser.close()
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock, local, current_thread
-from time import sleep
-from typing import List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from threading import Lock, local
+from time import monotonic, sleep
+from typing import Dict, List, Optional, Tuple
 import logging
+import os
+import random
 import threading
 import sys
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import psutil
+
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 from tqdm import tqdm
 from selenium.common.exceptions import WebDriverException, TimeoutException
 
-from .parser import Parser
+from .parser import Parser, champion_url
 from .db import Database
-from .cloudflare_detector import CloudflareException
+from .scrape_cache import ScrapeCache
+from .cloudflare_detector import CloudflareException, RateLimitedException
 from .config_constants import scraping_config
 
 # Configure logging
@@ -50,9 +55,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Thread-local storage for parser instances (one parser per thread)
-thread_local = local()
-
 
 def _is_headless_mode() -> bool:
     """
@@ -67,38 +69,200 @@ def _is_headless_mode() -> bool:
     return sys.stdout is None or not hasattr(sys.stdout, "write")
 
 
+def resolve_max_workers(requested: Optional[int] = None) -> int:
+    """Pick a worker count that fits this machine.
+
+    An explicit count is honoured (with a warning when it exceeds the host). The
+    default (the LEAGUESTATS_WORKERS environment variable, else
+    ScrapingConfig.DEFAULT_MAX_WORKERS) is capped by the CPU count and by the
+    available memory, so that each Firefox instance keeps MEMORY_PER_WORKER_BYTES
+    of headroom instead of thrashing a small host.
+
+    Args:
+        requested: Explicit worker count, or None for the configured default
+
+    Returns:
+        Number of worker threads to use (at least 1)
+    """
+    cpu_cap = os.cpu_count() or 4
+    memory_cap = psutil.virtual_memory().available // scraping_config.MEMORY_PER_WORKER_BYTES
+    cap = max(1, min(cpu_cap, memory_cap))
+    host = f"{cpu_cap} CPUs, {memory_cap} Firefox instances in available memory"
+
+    if requested is not None:
+        if requested > cap:
+            logger.warning(f"Requested {requested} workers but this host supports {cap} ({host})")
+        return max(1, requested)
+
+    requested = scraping_config.DEFAULT_MAX_WORKERS
+    env_workers = os.environ.get("LEAGUESTATS_WORKERS")
+    if env_workers:
+        try:
+            requested = int(env_workers)
+        except ValueError:
+            logger.warning(
+                f"Invalid LEAGUESTATS_WORKERS={env_workers!r}, using the default {requested}"
+            )
+
+    if requested > cap:
+        logger.warning(f"Using {cap} workers instead of {requested} ({host})")
+        return cap
+    return max(1, requested)
+
+
+_jittered_backoff = wait_exponential_jitter(
+    initial=2, max=scraping_config.RETRY_BACKOFF_MAX, jitter=scraping_config.RETRY_JITTER
+)
+
+
+def _wait_before_retry(retry_state) -> float:
+    """tenacity wait strategy for champion scrapes.
+
+    Honours the server's Retry-After hint when a rate-limit page carried one,
+    waits at least RATE_LIMIT_MIN_WAIT on a bare rate-limit page, and otherwise
+    falls back to jittered exponential backoff. The jitter keeps the workers
+    that were throttled together from retrying in lockstep.
+    """
+    backoff = _jittered_backoff(retry_state)
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, RateLimitedException):
+        if exc.retry_after:
+            return exc.retry_after + random.uniform(0, scraping_config.RETRY_JITTER)
+        return max(backoff, scraping_config.RATE_LIMIT_MIN_WAIT)
+    return backoff
+
+
+def normalize_champion_names(champion_names: List[str], normalize_func) -> Dict[str, str]:
+    """Map each champion name to its URL slug, computed once before scraping.
+
+    Workers and their retries then only look the slug up. Two champions sharing
+    a slug would scrape the same page, so collisions are logged.
+    """
+    normalized = {champion: normalize_func(champion) for champion in champion_names}
+    owners: Dict[str, str] = {}
+    for champion, slug in normalized.items():
+        if slug in owners:
+            logger.warning(f"{champion} and {owners[slug]} both normalize to '{slug}'")
+        else:
+            owners[slug] = champion
+    return normalized
+
+
+def _completed_batches(futures):
+    """Yield the futures in batches, each batch holding every future that finished
+    since the previous one (concurrent.futures.wait with FIRST_COMPLETED).
+
+    Callers update their progress bar once per batch instead of once per future.
+    """
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        yield done
+
+
+class TokenBucket:
+    """Thread-safe token bucket pacing page loads across all scraping workers.
+
+    Tokens refill at `rate` per second up to `capacity` (the allowed burst);
+    acquire() blocks until a token is available. A rate <= 0 disables pacing.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            sleep(wait)
+
+
+# Exceptions worth retrying a champion scrape for
+_RETRYABLE_EXCEPTIONS = (
+    WebDriverException,
+    TimeoutException,
+    CloudflareException,
+    RateLimitedException,
+)
+
+
 class ParallelParser:
     """High-performance parallel web scraper for champion matchup data.
 
     Attributes:
         max_workers (int): Number of concurrent scraping threads
         parsers (List[Parser]): Pool of Parser instances (one per thread)
-        db_lock (Lock): Thread-safe lock for database writes
+        db_lock (Lock): Thread-safe lock for the buffered database writes
+        _tls (local): Per-instance thread-local storage holding each worker's Parser
         executor (ThreadPoolExecutor): Thread pool for parallel execution
+        _parse_pool (ProcessPoolExecutor): Optional HTML parsing processes
+            (ScrapingConfig.PARSE_PROCESSES > 0)
     """
 
-    def __init__(self, max_workers: int = 10, patch_version: str = None, headless: bool = False):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        patch_version: str = None,
+        headless: Optional[bool] = None,
+    ):
         """Initialize parallel parser with worker pool.
 
         Args:
-            max_workers: Number of concurrent threads (default: 10)
-                        Recommended range: 8-12 for optimal I/O performance
+            max_workers: Number of concurrent threads. None uses LEAGUESTATS_WORKERS or
+                        ScrapingConfig.DEFAULT_MAX_WORKERS, capped to what the host can
+                        run (see resolve_max_workers)
             patch_version: Optional patch version (e.g. "15.24"). If None, uses config.CURRENT_PATCH
             headless: If True, run Firefox in headless mode (no GUI).
                      Essential for Task Scheduler, pythonw.exe, or CI/CD.
-                     Default: False (normal GUI mode).
+                     None uses ScrapingConfig.HEADLESS.
         """
         from .config import config
 
-        self.max_workers = max_workers
+        self.max_workers = resolve_max_workers(max_workers)
         self.patch_version = patch_version or config.CURRENT_PATCH
-        self.headless = headless
+        self.headless = scraping_config.HEADLESS if headless is None else headless
         self.parsers: List[Parser] = []
         self.db_lock = Lock()
+        # Scraped rows waiting to be inserted, keyed by lane (see _write_*_thread_safe)
+        self._pending_matchups: Dict[Optional[str], List[Tuple]] = {}
+        self._pending_synergies: Dict[Optional[str], List[Tuple]] = {}
+        self._parsers_lock = Lock()
+        self._tls = local()
+        # Shared by all workers so page loads hit lolalytics.com at a steady pace
+        self.rate_limiter = TokenBucket(
+            scraping_config.REQUESTS_PER_SECOND, scraping_config.REQUEST_BURST
+        )
+        # Reruns on the same patch reuse recently scraped pages (None = disabled)
+        self.scrape_cache: Optional[ScrapeCache] = None
+        if scraping_config.SCRAPE_CACHE_TTL > 0:
+            cache_dir = scraping_config.SCRAPE_CACHE_DIR or os.path.join(
+                os.path.dirname(config.DATABASE_PATH), "scrape_cache"
+            )
+            self.scrape_cache = ScrapeCache(cache_dir, scraping_config.SCRAPE_CACHE_TTL)
+
+        # Optional process pool for carousel HTML parsing, shared by all parsers.
+        # Scraper threads block on the result without holding the GIL, so lxml
+        # parsing no longer serializes the workers.
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        if scraping_config.PARSE_PROCESSES > 0:
+            self._parse_pool = ProcessPoolExecutor(max_workers=scraping_config.PARSE_PROCESSES)
         self.executor: Optional[ThreadPoolExecutor] = None
 
         logger.info(
-            f"ParallelParser initialized with {max_workers} workers, patch={self.patch_version}, headless={headless}"
+            f"ParallelParser initialized with {self.max_workers} workers, patch={self.patch_version}, headless={self.headless}"
         )
 
     def _cleanup_existing_resources(self) -> None:
@@ -110,12 +274,9 @@ class ParallelParser:
         leaving zombie Firefox + geckodriver processes running.
 
         Thread-local safety note:
-            After shutdown(wait=True), all threads of the old executor are guaranteed dead
-            before this method returns. The new executor will therefore always create fresh
-            threads that have no thread_local.parser attribute, so _get_parser() will
-            correctly instantiate new Parser objects instead of reusing stale closed ones.
-            There is no risk of a recycled thread picking up a closed parser from
-            thread_local storage.
+            The thread-local storage is replaced along with the parsers, so even a
+            recycled thread cannot pick up a closed parser: its next _get_parser() call
+            finds no cached instance and creates a fresh Parser.
         """
         if self.executor is not None:
             logger.info("Shutting down existing executor before creating a new one...")
@@ -125,51 +286,135 @@ class ParallelParser:
 
         if self.parsers:
             logger.info(f"Closing {len(self.parsers)} existing parser(s)...")
-            for parser in self.parsers:
-                try:
-                    parser.close()
-                except Exception as e:
-                    logger.error(f"Error closing parser during cleanup: {e}")
-            self.parsers.clear()
+            self._close_parsers()
             logger.info("All existing parsers closed and cleared")
 
+        self._tls = local()
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        """Return the worker thread pool, creating it if there is none.
+
+        The pool lives until close() or _cleanup_existing_resources(). Its threads
+        keep their thread-local Parser between parse calls.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    def _close_parsers(self) -> None:
+        """Close every parser concurrently and forget them.
+
+        Each webdriver.quit() takes seconds of browser teardown, so they run in
+        parallel. A driver still quitting after PARSER_CLOSE_TIMEOUT is left to
+        finish in the background rather than blocking shutdown.
+        """
+        if not self.parsers:
+            return
+
+        def close_parser(parser: Parser) -> None:
+            try:
+                parser.close()
+            except Exception as e:
+                logger.error(f"Error closing parser: {e}")
+
+        closer = ThreadPoolExecutor(
+            max_workers=len(self.parsers), thread_name_prefix="parser-close"
+        )
+        futures = [closer.submit(close_parser, parser) for parser in self.parsers]
+        _, hung = wait(futures, timeout=scraping_config.PARSER_CLOSE_TIMEOUT)
+        closer.shutdown(wait=False)
+        if hung:
+            logger.warning(
+                f"{len(hung)} parser(s) still closing after "
+                f"{scraping_config.PARSER_CLOSE_TIMEOUT}s, not waiting for them"
+            )
+        self.parsers.clear()
+
     def _get_parser(self) -> Parser:
         """Get or create a Parser instance for current thread.
 
-        Uses thread-local storage to ensure ONE parser per thread, not per champion.
-        This prevents creating multiple Firefox windows per thread.
+        Uses per-instance thread-local storage to ensure ONE parser per thread, not
+        per champion: each worker pays the Firefox + geckodriver startup cost once and
+        reuses the same webdriver for every champion assigned to it.
 
         Returns:
             Parser: Thread-local parser instance with dedicated webdriver
         """
-        # Check if this thread already has a parser
-        if not hasattr(thread_local, "parser"):
+        parser = getattr(self._tls, "parser", None)
+        if parser is None:
             # Create new parser for this thread (first time only)
-            thread_local.parser = Parser(headless=self.headless)
-            self.parsers.append(thread_local.parser)
+            if scraping_config.SHARED_BROWSER:
+                # Created under the lock so only the first worker launches Firefox;
+                # the others open a tab in its browser.
+                with self._parsers_lock:
+                    owner = self.parsers[0] if self.parsers else None
+                    parser = Parser(headless=self.headless, share_driver_of=owner)
+                    self.parsers.append(parser)
+            else:
+                parser = Parser(headless=self.headless)
+                # self.parsers is only read at cleanup time, but workers append concurrently
+                with self._parsers_lock:
+                    self.parsers.append(parser)
+            parser.parse_pool = self._parse_pool
+            parser.rate_limiter = self.rate_limiter
+            self._tls.parser = parser
             logger.info(
                 f"Created new parser for {threading.current_thread().name} (headless={self.headless})"
             )
 
-        return thread_local.parser
+        return parser
+
+    def _scrape_page(
+        self, kind: str, champion_slug: str, lane: Optional[str] = None
+    ) -> List[Tuple[str, float, float, float, float, int]]:
+        """Scrape one champion page ("matchups" or "synergies"), going through the cache.
+
+        Cached rows younger than SCRAPE_CACHE_TTL are returned without touching a
+        webdriver; otherwise the page is loaded (rate limited) and non-empty
+        results are cached for the next run.
+        """
+        cache = self.scrape_cache
+        key = ScrapeCache.key(kind, champion_url(self.patch_version, champion_slug, lane))
+        if cache is not None:
+            rows = cache.get(key)
+            if rows is not None:
+                logger.info(f"Using cached {kind} for {champion_slug} ({lane or 'default'})")
+                return rows
+
+        parser = self._get_parser()
+        self.rate_limiter.acquire()
+        if kind == "synergies":
+            scrape = parser.get_champion_synergies_on_patch
+        else:
+            scrape = parser.get_champion_data_on_patch
+        if lane is None:
+            rows = scrape(self.patch_version, champion_slug)
+        else:
+            rows = scrape(self.patch_version, champion_slug, lane)
+
+        if cache is not None and rows:
+            cache.put(key, rows)
+        return rows
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((WebDriverException, TimeoutException, CloudflareException)),
+        wait=_wait_before_retry,
+        retry=retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
         reraise=True,
     )
     def _scrape_champion_with_retry(
-        self, champion: str, normalize_func
+        self, champion: str, normalized_champion: str, lane: Optional[str] = None
     ) -> List[Tuple[str, float, float, float, float, int]]:
         """Scrape champion data with automatic retry on failure.
 
-        Uses exponential backoff: 2s, 4s, 8s (max 10s) between retries.
-        Retries up to 3 times on WebDriverException or TimeoutException.
+        Uses jittered exponential backoff (2s, 4s, 8s...) between retries, or the
+        server's Retry-After delay when rate limited (see _wait_before_retry).
+        Retries up to 3 times on WebDriver, timeout, Cloudflare and rate-limit errors.
 
         Args:
             champion: Champion name to scrape
-            normalize_func: Function to normalize champion name for URL
+            normalized_champion: Champion name normalized for the URL
+            lane: Optional lane filter (None = LoLalytics default lane)
 
         Returns:
             List of matchup tuples: (enemy, winrate, delta1, delta2, pickrate, games)
@@ -178,17 +423,15 @@ class ParallelParser:
             WebDriverException: After 3 failed attempts
             TimeoutException: After 3 failed attempts
             CloudflareException: After 3 failed attempts
+            RateLimitedException: After 3 failed attempts
         """
-        parser = self._get_parser()
-
         try:
-            normalized_champion = normalize_func(champion)
-            matchups = parser.get_champion_data_on_patch(self.patch_version, normalized_champion)
+            matchups = self._scrape_page("matchups", normalized_champion, lane)
             logger.info(
                 f"Successfully scraped {champion} (patch {self.patch_version}): {len(matchups)} matchups"
             )
             return champion, matchups
-        except (WebDriverException, TimeoutException, CloudflareException) as e:
+        except _RETRYABLE_EXCEPTIONS as e:
             logger.warning(f"Retry triggered for {champion}: {e}")
             raise
         except Exception as e:
@@ -198,7 +441,11 @@ class ParallelParser:
     def _write_matchups_thread_safe(
         self, db: Database, champion: str, matchups: List[Tuple], lane: Optional[str] = None
     ) -> None:
-        """Write matchup data to database with thread-safe locking.
+        """Buffer matchup rows for the database, flushing full batches.
+
+        Rows accumulate across champions and are inserted DB_WRITE_BATCH_SIZE at a
+        time (single executemany + commit) instead of one commit per champion.
+        parse_* methods call _flush_pending_writes() once their run is over.
 
         Args:
             db: Database instance
@@ -208,38 +455,47 @@ class ParallelParser:
                   None = default/unknown lane (legacy behavior).
         """
         with self.db_lock:
-            try:
-                # Convert matchups to batch format: [(champion, enemy, winrate, d1, d2, pick, games), ...]
-                matchup_batch = [
-                    (champion, enemy, winrate, d1, d2, pick, games)
-                    for enemy, winrate, d1, d2, pick, games in matchups
-                ]
-
-                # Use batch insert (much faster - single transaction)
-                if not hasattr(self, "_champion_cache"):
-                    self._champion_cache = db.build_champion_cache()
+            # Convert matchups to batch format: [(champion, enemy, winrate, d1, d2, pick, games), ...]
+            pending = self._pending_matchups.setdefault(lane, [])
+            pending.extend(
+                (champion, enemy, winrate, d1, d2, pick, games)
+                for enemy, winrate, d1, d2, pick, games in matchups
+            )
+            if len(pending) >= scraping_config.DB_WRITE_BATCH_SIZE:
+                self._flush_matchups(db, lane)
+
+    def _flush_matchups(self, db: Database, lane: Optional[str]) -> None:
+        """Insert the buffered matchups of one lane. Caller must hold db_lock."""
+        matchup_batch = self._pending_matchups.pop(lane, [])
+        if not matchup_batch:
+            return
+        try:
+            if not hasattr(self, "_champion_cache"):
+                self._champion_cache = db.build_champion_cache()
 
-                db.add_matchups_batch(matchup_batch, self._champion_cache, lane=lane)
-            except Exception as e:
-                logger.error(f"Database write error for {champion}: {e}")
+            db.add_matchups_batch(matchup_batch, self._champion_cache, lane=lane)
+        except Exception as e:
+            logger.error(f"Database write error for {len(matchup_batch)} matchups: {e}")
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((WebDriverException, TimeoutException, CloudflareException)),
+        wait=_wait_before_retry,
+        retry=retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
         reraise=True,
     )
     def _scrape_champion_synergies_with_retry(
-        self, champion: str, normalize_func
+        self, champion: str, normalized_champion: str, lane: Optional[str] = None
     ) -> List[Tuple[str, float, float, float, float, int]]:
         """Scrape champion synergies with automatic retry on failure.
 
-        Uses exponential backoff: 2s, 4s, 8s (max 10s) between retries.
-        Retries up to 3 times on WebDriverException or TimeoutException.
+        Uses jittered exponential backoff (2s, 4s, 8s...) between retries, or the
+        server's Retry-After delay when rate limited (see _wait_before_retry).
+        Retries up to 3 times on WebDriver, timeout, Cloudflare and rate-limit errors.
 
         Args:
             champion: Champion name to scrape
-            normalize_func: Function to normalize champion name for URL
+            normalized_champion: Champion name normalized for the URL
+            lane: Optional lane filter (None = LoLalytics default lane)
 
         Returns:
             List of synergy tuples: (ally, winrate, delta1, delta2, pickrate, games)
@@ -248,19 +504,15 @@ class ParallelParser:
             WebDriverException: After 3 failed attempts
             TimeoutException: After 3 failed attempts
             CloudflareException: After 3 failed attempts
+            RateLimitedException: After 3 failed attempts
         """
-        parser = self._get_parser()
-
         try:
-            normalized_champion = normalize_func(champion)
-            synergies = parser.get_champion_synergies_on_patch(
-                self.patch_version, normalized_champion
-            )
+            synergies = self._scrape_page("synergies", normalized_champion, lane)
             logger.info(
                 f"Successfully scraped synergies for {champion} (patch {self.patch_version}): {len(synergies)} allies"
             )
             return champion, synergies
-        except (WebDriverException, TimeoutException, CloudflareException) as e:
+        except _RETRYABLE_EXCEPTIONS as e:
             logger.warning(f"Retry triggered for {champion} synergies: {e}")
             raise
         except Exception as e:
@@ -270,7 +522,9 @@ class ParallelParser:
     def _write_synergies_thread_safe(
         self, db: Database, champion: str, synergies: List[Tuple], lane: Optional[str] = None
     ) -> None:
-        """Write synergy data to database with thread-safe locking.
+        """Buffer synergy rows for the database, flushing full batches.
+
+        Same batching as _write_matchups_thread_safe().
 
         Args:
             db: Database instance
@@ -280,20 +534,35 @@ class ParallelParser:
                   None = default/unknown lane (legacy behavior).
         """
         with self.db_lock:
-            try:
-                # Convert synergies to batch format: [(champion, ally, winrate, d1, d2, pick, games), ...]
-                synergy_batch = [
-                    (champion, ally, winrate, d1, d2, pick, games)
-                    for ally, winrate, d1, d2, pick, games in synergies
-                ]
+            # Convert synergies to batch format: [(champion, ally, winrate, d1, d2, pick, games), ...]
+            pending = self._pending_synergies.setdefault(lane, [])
+            pending.extend(
+                (champion, ally, winrate, d1, d2, pick, games)
+                for ally, winrate, d1, d2, pick, games in synergies
+            )
+            if len(pending) >= scraping_config.DB_WRITE_BATCH_SIZE:
+                self._flush_synergies(db, lane)
+
+    def _flush_synergies(self, db: Database, lane: Optional[str]) -> None:
+        """Insert the buffered synergies of one lane. Caller must hold db_lock."""
+        synergy_batch = self._pending_synergies.pop(lane, [])
+        if not synergy_batch:
+            return
+        try:
+            if not hasattr(self, "_champion_cache"):
+                self._champion_cache = db.build_champion_cache()
 
-                # Use batch insert (much faster - single transaction)
-                if not hasattr(self, "_champion_cache"):
-                    self._champion_cache = db.build_champion_cache()
+            db.add_synergies_batch(synergy_batch, lane=lane, champion_cache=self._champion_cache)
+        except Exception as e:
+            logger.error(f"Database write error for {len(synergy_batch)} synergies: {e}")
 
-                db.add_synergies_batch(synergy_batch, lane=lane)
-            except Exception as e:
-                logger.error(f"Database write error for {champion} synergies: {e}")
+    def _flush_pending_writes(self, db: Database) -> None:
+        """Insert every buffered matchup/synergy row (end of a parse run)."""
+        with self.db_lock:
+            for lane in list(self._pending_matchups):
+                self._flush_matchups(db, lane)
+            for lane in list(self._pending_synergies):
+                self._flush_synergies(db, lane)
 
     def parse_all_synergies(self, db: Database, normalize_func) -> dict:
         """Parse all champion synergies in parallel with progress tracking.
@@ -333,14 +602,16 @@ class ParallelParser:
         champion_names = list(db.get_all_champion_names().values())
         logger.info(f"Starting parallel scraping of synergies for {len(champion_names)} champions")
 
+        normalized = normalize_champion_names(champion_names, normalize_func)
+
         # Close any existing executor/parsers before creating a new thread pool
         self._cleanup_existing_resources()
 
         # Create thread pool and submit tasks
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        executor = self._ensure_executor()
         futures = {
-            self.executor.submit(
-                self._scrape_champion_synergies_with_retry, champion, normalize_func
+            executor.submit(
+                self._scrape_champion_synergies_with_retry, champion, normalized[champion]
             ): champion
             for champion in champion_names
         }
@@ -355,30 +626,33 @@ class ParallelParser:
         if disable_tqdm:
             logger.info("Headless mode detected - tqdm progress bar disabled")
 
-        with tqdm(
-            total=total_champions,
-            desc="Scraping synergies",
-            unit="champ",
-            disable=disable_tqdm,
-        ) as pbar:
-            for future in as_completed(futures):
-                champion = futures[future]
-                try:
-                    champ_name, synergies = future.result()
-                    self._write_synergies_thread_safe(db, champ_name, synergies)
-                    success_count += 1
-                except Exception as e:
-                    logger.error(
-                        f"Failed to scrape synergies for {champion} after retries: {type(e).__name__}: {e}"
-                    )
-                    # Log first failure with full traceback for debugging
-                    if failed_count == 0:
-                        import traceback
-
-                        logger.error(f"First failure traceback:\n{traceback.format_exc()}")
-                    failed_count += 1
-                finally:
-                    pbar.update(1)
+        try:
+            with tqdm(
+                total=total_champions,
+                desc="Scraping synergies",
+                unit="champ",
+                disable=disable_tqdm,
+            ) as pbar:
+                for done in _completed_batches(futures):
+                    for future in done:
+                        champion = futures[future]
+                        try:
+                            champ_name, synergies = future.result()
+                            self._write_synergies_thread_safe(db, champ_name, synergies)
+                            success_count += 1
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to scrape synergies for {champion} after retries: {type(e).__name__}: {e}"
+                            )
+                            # Log first failure with full traceback for debugging
+                            if failed_count == 0:
+                                import traceback
+
+                                logger.error(f"First failure traceback:\n{traceback.format_exc()}")
+                            failed_count += 1
+                    pbar.update(len(done))
+        finally:
+            self._flush_pending_writes(db)
 
         duration = time.time() - start_time
 
@@ -433,14 +707,16 @@ class ParallelParser:
         champion_names = list(db.get_all_champion_names().values())
         logger.info(f"Starting parallel scraping of {len(champion_names)} champions from Riot API")
 
+        normalized = normalize_champion_names(champion_names, normalize_func)
+
         # Close any existing executor/parsers before creating a new thread pool
         self._cleanup_existing_resources()
 
         # Create thread pool and submit tasks
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        executor = self._ensure_executor()
         futures = {
-            self.executor.submit(
-                self._scrape_champion_with_retry, champion, normalize_func
+            executor.submit(
+                self._scrape_champion_with_retry, champion, normalized[champion]
             ): champion
             for champion in champion_names
         }
@@ -456,27 +732,30 @@ class ParallelParser:
         if disable_tqdm:
             logger.info("Headless mode detected - tqdm progress bar disabled")
 
-        with tqdm(
-            total=total_champions, desc="Scraping champions", unit="champ", disable=disable_tqdm
-        ) as pbar:
-            for future in as_completed(futures):
-                champion = futures[future]
-                try:
-                    champ_name, matchups = future.result()
-                    self._write_matchups_thread_safe(db, champ_name, matchups)
-                    success_count += 1
-                except Exception as e:
-                    logger.error(
-                        f"Failed to scrape {champion} after retries: {type(e).__name__}: {e}"
-                    )
-                    # Log first failure with full traceback for debugging
-                    if failed_count == 0:
-                        import traceback
-
-                        logger.error(f"First failure traceback:\n{traceback.format_exc()}")
-                    failed_count += 1
-                finally:
-                    pbar.update(1)
+        try:
+            with tqdm(
+                total=total_champions, desc="Scraping champions", unit="champ", disable=disable_tqdm
+            ) as pbar:
+                for done in _completed_batches(futures):
+                    for future in done:
+                        champion = futures[future]
+                        try:
+                            champ_name, matchups = future.result()
+                            self._write_matchups_thread_safe(db, champ_name, matchups)
+                            success_count += 1
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to scrape {champion} after retries: {type(e).__name__}: {e}"
+                            )
+                            # Log first failure with full traceback for debugging
+                            if failed_count == 0:
+                                import traceback
+
+                                logger.error(f"First failure traceback:\n{traceback.format_exc()}")
+                            failed_count += 1
+                    pbar.update(len(done))
+        finally:
+            self._flush_pending_writes(db)
 
         duration = time.time() - start_time
 
@@ -571,20 +850,20 @@ class ParallelParser:
 
             db.init_matchups_table()
 
-        # Close any existing executor/parsers before creating a new thread pool
-        self._cleanup_existing_resources()
+        normalized = normalize_champion_names(champion_list, normalize_func)
 
-        # Create thread pool and submit tasks
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        if init_tables:
+            # Standalone run: start from fresh browsers like parse_all_*
+            self._cleanup_existing_resources()
+
+        # Lane passes of the multi-lane pipeline share one thread pool, so each
+        # worker keeps its Firefox instead of relaunching it for every lane
+        executor = self._ensure_executor()
 
         # Modified worker function that includes lane parameter
         def scrape_with_lane(champion):
-            parser = self._get_parser()
             try:
-                normalized_champion = normalize_func(champion)
-                matchups = parser.get_champion_data_on_patch(
-                    self.patch_version, normalized_champion, lane
-                )
+                matchups = self._scrape_page("matchups", normalized[champion], lane)
                 logger.info(
                     f"Successfully scraped {champion} ({lane_label}, patch {self.patch_version}): {len(matchups)} matchups"
                 )
@@ -594,7 +873,7 @@ class ParallelParser:
                 return champion, []
 
         futures = {
-            self.executor.submit(scrape_with_lane, champion): champion for champion in champion_list
+            executor.submit(scrape_with_lane, champion): champion for champion in champion_list
         }
 
         # Track progress with tqdm
@@ -606,23 +885,26 @@ class ParallelParser:
         if disable_tqdm:
             logger.info(f"Headless mode detected - tqdm progress bar disabled for {lane_label}")
 
-        with tqdm(
-            total=len(champion_list),
-            desc=f"Scraping {lane_label}",
-            unit="champ",
-            disable=disable_tqdm,
-        ) as pbar:
-            for future in as_completed(futures):
-                champion = futures[future]
-                try:
-                    champ_name, matchups = future.result()
-                    self._write_matchups_thread_safe(db, champ_name, matchups, lane=lane)
-                    success_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to scrape {champion} ({lane_label}): {e}")
-                    failed_count += 1
-                finally:
-                    pbar.update(1)
+        try:
+            with tqdm(
+                total=len(champion_list),
+                desc=f"Scraping {lane_label}",
+                unit="champ",
+                disable=disable_tqdm,
+            ) as pbar:
+                for done in _completed_batches(futures):
+                    for future in done:
+                        champion = futures[future]
+                        try:
+                            champ_name, matchups = future.result()
+                            self._write_matchups_thread_safe(db, champ_name, matchups, lane=lane)
+                            success_count += 1
+                        except Exception as e:
+                            logger.error(f"Failed to scrape {champion} ({lane_label}): {e}")
+                            failed_count += 1
+                    pbar.update(len(done))
+        finally:
+            self._flush_pending_writes(db)
 
         duration = time.time() - start_time
 
@@ -680,20 +962,20 @@ class ParallelParser:
             # Initialize synergies table
             db.init_synergies_table()
 
-        # Close any existing executor/parsers before creating a new thread pool
-        self._cleanup_existing_resources()
+        normalized = normalize_champion_names(champion_list, normalize_func)
 
-        # Create thread pool and submit tasks
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        if init_tables:
+            # Standalone run: start from fresh browsers like parse_all_*
+            self._cleanup_existing_resources()
+
+        # Lane passes of the multi-lane pipeline share one thread pool, so each
+        # worker keeps its Firefox instead of relaunching it for every lane
+        executor = self._ensure_executor()
 
         # Modified worker function that includes lane parameter
         def scrape_synergies_with_lane(champion):
-            parser = self._get_parser()
             try:
-                normalized_champion = normalize_func(champion)
-                synergies = parser.get_champion_synergies_on_patch(
-                    self.patch_version, normalized_champion, lane
-                )
+                synergies = self._scrape_page("synergies", normalized[champion], lane)
                 logger.info(
                     f"Successfully scraped synergies for {champion} ({lane_label}, patch {self.patch_version}): {len(synergies)} allies"
                 )
@@ -703,7 +985,7 @@ class ParallelParser:
                 return champion, []
 
         futures = {
-            self.executor.submit(scrape_synergies_with_lane, champion): champion
+            executor.submit(scrape_synergies_with_lane, champion): champion
             for champion in champion_list
         }
 
@@ -718,23 +1000,28 @@ class ParallelParser:
                 f"Headless mode detected - tqdm progress bar disabled for {lane_label} synergies"
             )
 
-        with tqdm(
-            total=len(champion_list),
-            desc=f"Scraping {lane_label} synergies",
-            unit="champ",
-            disable=disable_tqdm,
-        ) as pbar:
-            for future in as_completed(futures):
-                champion = futures[future]
-                try:
-                    champ_name, synergies = future.result()
-                    self._write_synergies_thread_safe(db, champ_name, synergies, lane=lane)
-                    success_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to scrape synergies for {champion} ({lane_label}): {e}")
-                    failed_count += 1
-                finally:
-                    pbar.update(1)
+        try:
+            with tqdm(
+                total=len(champion_list),
+                desc=f"Scraping {lane_label} synergies",
+                unit="champ",
+                disable=disable_tqdm,
+            ) as pbar:
+                for done in _completed_batches(futures):
+                    for future in done:
+                        champion = futures[future]
+                        try:
+                            champ_name, synergies = future.result()
+                            self._write_synergies_thread_safe(db, champ_name, synergies, lane=lane)
+                            success_count += 1
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to scrape synergies for {champion} ({lane_label}): {e}"
+                            )
+                            failed_count += 1
+                    pbar.update(len(done))
+        finally:
+            self._flush_pending_writes(db)
 
         duration = time.time() - start_time
 
@@ -753,6 +1040,126 @@ class ParallelParser:
 
         return stats
 
+    def parse_matchups_and_synergies_by_role(
+        self,
+        db: Database,
+        champion_list: List[str],
+        lane: Optional[str],
+        normalize_func,
+    ) -> Tuple[dict, dict]:
+        """Parse matchups and synergies of a role/lane in a single parallel pass.
+
+        Matchups and synergies live on the same champion page: each worker
+        scrapes both back to back, so the synergies reuse the page its parser
+        just loaded (Parser.get_champion_synergies_on_patch) instead of loading
+        every page a second time in a separate parse_synergies_by_role pass.
+
+        Each page goes through the same retry wrappers as the single-kind passes;
+        a page whose retries are exhausted counts as failed in its own statistics.
+
+        Tables are not initialized: this is the multi-lane pipeline pass, the
+        caller resets matchups/synergies once for the whole run.
+
+        Args:
+            db: Database instance (must be connected)
+            champion_list: List of champion names for this role
+            lane: Lane name (top, jungle, middle, bottom, support) or None
+            normalize_func: Function to normalize champion names for URLs
+
+        Returns:
+            (matchup_stats, synergy_stats), each with the keys of
+            parse_champions_by_role's statistics
+        """
+        import time
+
+        start_time = time.time()
+
+        lane_label = lane or "default"
+        logger.info(
+            f"Starting parallel scraping of matchups and synergies for {len(champion_list)} "
+            f"champions for {lane_label}"
+        )
+
+        normalized = normalize_champion_names(champion_list, normalize_func)
+        executor = self._ensure_executor()
+
+        def scrape_with_retry(scrape, kind, champion):
+            """Rows of one page, or None once its retries are exhausted."""
+            try:
+                return scrape(champion, normalized[champion], lane)[1]
+            except Exception as e:
+                logger.error(f"Error scraping {kind} for {champion} ({lane_label}): {e}")
+                return None
+
+        def scrape_both(champion):
+            matchups = scrape_with_retry(self._scrape_champion_with_retry, "matchups", champion)
+            synergies = scrape_with_retry(
+                self._scrape_champion_synergies_with_retry, "synergies", champion
+            )
+            return champion, matchups, synergies
+
+        futures = {executor.submit(scrape_both, champion): champion for champion in champion_list}
+
+        counts = {"matchups": [0, 0], "synergies": [0, 0]}  # kind -> [success, failed]
+        writers = {
+            "matchups": self._write_matchups_thread_safe,
+            "synergies": self._write_synergies_thread_safe,
+        }
+
+        # Disable tqdm in headless mode (pythonw.exe, Task Scheduler)
+        disable_tqdm = _is_headless_mode()
+        if disable_tqdm:
+            logger.info(f"Headless mode detected - tqdm progress bar disabled for {lane_label}")
+
+        try:
+            with tqdm(
+                total=len(champion_list),
+                desc=f"Scraping {lane_label} matchups+synergies",
+                unit="champ",
+                disable=disable_tqdm,
+            ) as pbar:
+                for done in _completed_batches(futures):
+                    for future in done:
+                        champion = futures[future]
+                        try:
+                            _, matchups, synergies = future.result()
+                        except Exception as e:
+                            logger.error(f"Failed to scrape {champion} ({lane_label}): {e}")
+                            matchups = synergies = None
+                        for kind, rows in (("matchups", matchups), ("synergies", synergies)):
+                            if rows is None:
+                                counts[kind][1] += 1
+                            else:
+                                writers[kind](db, champion, rows, lane=lane)
+                                counts[kind][0] += 1
+                    pbar.update(len(done))
+        finally:
+            self._flush_pending_writes(db)
+
+        duration = time.time() - start_time
+
+        matchup_stats, synergy_stats = (
+            {
+                "success": counts[kind][0],
+                "failed": counts[kind][1],
+                "total": len(champion_list),
+                "lane": lane,
+                "duration": duration,
+            }
+            for kind in ("matchups", "synergies")
+        )
+
+        logger.info(
+            f"Scraping {lane} matchups+synergies completed: "
+            f"matchups {matchup_stats['success']}/{len(champion_list)} "
+            f"({matchup_stats['failed']} failed), "
+            f"synergies {synergy_stats['success']}/{len(champion_list)} "
+            f"({synergy_stats['failed']} failed), "
+            f"duration: {duration:.1f}s ({duration/60:.1f}min)"
+        )
+
+        return matchup_stats, synergy_stats
+
     def close(self) -> None:
         """Close all parser instances and clean up resources.
 
@@ -766,12 +1173,12 @@ class ParallelParser:
             self.executor.shutdown(wait=True)
             self.executor = None
 
-        # Close all parser webdrivers
-        for parser in self.parsers:
-            try:
-                parser.close()
-            except Exception as e:
-                logger.error(f"Error closing parser: {e}")
+        # Close all parser webdrivers, then quit the idle ones they left pooled
+        self._close_parsers()
+        Parser.close_pool()
+
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
 
-        self.parsers.clear()
         logger.info("All parsers closed successfully")
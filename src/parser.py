@@ -1,49 +1,470 @@
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+from functools import wraps
+from threading import Lock, RLock
 from time import sleep
-from typing import List
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
 import lxml.html
+from lxml import etree
 import logging
 
+import requests
+
 from selenium import webdriver
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     NoSuchElementException,
-    ElementNotInteractableException,
     InvalidSessionIdException,
-    StaleElementReferenceException,
+    JavascriptException,
     WebDriverException,
     TimeoutException,
 )
 
+from .cloudflare_detector import detect_rate_limit
 from .config import config
 from .config_constants import scraping_config, xpath_config
 from .error_ids import (
     ERR_COOKIE_001,
-    ERR_COOKIE_002,
-    ERR_COOKIE_003,
-    ERR_COOKIE_004,
     ERR_COOKIE_005,
     ERR_COOKIE_006,
     ERR_COOKIE_007,
 )
 
+if TYPE_CHECKING:
+    from .parallel_parser import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 
+def _has_class(name: str) -> str:
+    """XPath predicate matching one CSS class token (like By.CLASS_NAME)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Carousel XPaths, compiled once and evaluated on a local lxml tree. The row path
+# takes the tier row index as an XPath variable: _ROW_ITEMS(tree, index=2).
+_ROW_ITEMS = etree.XPath(xpath_config.MATCHUP_ROW_BASE.format(index="$index") + "/*")
+_ITEM_HREF = etree.XPath(".//a/@href")
+_ITEM_WINRATE = etree.XPath("./div[1]/span")
+_ITEM_MY1 = etree.XPath(f".//*[{_has_class('my-1')}]")
+_ITEM_GAMES = etree.XPath(f".//*[{_has_class('text-[9px]')}]")
+
+
+def _relative_to(section: str, absolute: str) -> str:
+    """Rewrite an absolute XPath below `section` relative to that section."""
+    if not absolute.startswith(section + "/"):
+        raise ValueError(f"{absolute} is not inside {section}")
+    return "." + absolute[len(section) :]
+
+
+# Single-matchup page (get_matchup_data_on_patch): only the stats section is
+# serialized in the browser, so its XPaths are evaluated relative to it.
+_MATCHUP_SECTION = "/html/body/main/div[5]"
+_MATCHUP_WINRATE = etree.XPath(_relative_to(_MATCHUP_SECTION, xpath_config.WINRATE_XPATH))
+_MATCHUP_GAMES = etree.XPath(_relative_to(_MATCHUP_SECTION, xpath_config.GAMES_XPATH))
+
+_MATCHUP_SECTION_NODE = etree.XPath(_MATCHUP_SECTION)
+
+# outerHTML of the element at XPath arguments[0], or null when it is missing
+_OUTER_HTML_JS = """
+const el = document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+return el ? el.outerHTML : null;
+"""
+
+
+def champion_url(patch: str, champion: str, lane: Optional[str] = None) -> str:
+    """Champion build page, which holds both the matchup and the synergy rows."""
+    lane_param = f"lane={lane}&" if lane else ""
+    return (
+        f"https://lolalytics.com/lol/{champion}/build/?{lane_param}tier=diamond_plus&patch={patch}"
+    )
+
+
+def matchup_url(patch: str, champion: str, enemy: str) -> str:
+    return (
+        f"https://lolalytics.com/lol/{champion}/vs/{enemy}/build/?tier=diamond_plus&patch={patch}"
+    )
+
+
+def fetch_matchup_data(
+    patch: str,
+    champion: str,
+    enemy: str,
+    session: Optional[requests.Session] = None,
+    rate_limiter: Optional["TokenBucket"] = None,
+) -> Optional[tuple]:
+    """Read (winrate, games) of one matchup from the server-rendered HTML.
+
+    LoLalytics pages are Qwik SSR (see lane_discovery), so a plain HTTP GET is
+    enough when the stats are in the raw HTML, with no browser boot and no JS
+    render. Returns None when the request fails or the stats are missing, so
+    callers can fall back to the browser. `rate_limiter` paces the request
+    with the browser page loads.
+    """
+    http = session or requests
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+    try:
+        response = http.get(
+            matchup_url(patch, champion, enemy),
+            headers={"User-Agent": scraping_config.LANE_DISCOVERY_USER_AGENT},
+            timeout=scraping_config.MATCHUP_HTTP_TIMEOUT,
+        )
+    except requests.RequestException as e:
+        logger.warning("HTTP fetch failed for %s vs %s: %s", champion, enemy, e)
+        return None
+    if response.status_code != 200:
+        logger.warning("HTTP %s for %s vs %s", response.status_code, champion, enemy)
+        return None
+
+    sections = _MATCHUP_SECTION_NODE(lxml.html.fromstring(response.text))
+    if not sections:
+        return None
+    winrate_elements = _MATCHUP_WINRATE(sections[0])
+    if not winrate_elements:
+        return None
+    try:
+        winrate = float(winrate_elements[0])
+        games_elements = _MATCHUP_GAMES(sections[0])
+        games = int(games_elements[0].replace(",", "")) if games_elements else 0
+    except ValueError:
+        return None
+    return winrate, games
+
+
+def fetch_matchups_bulk(
+    patch: str,
+    pairs: Iterable[Tuple[str, str]],
+    max_workers: Optional[int] = None,
+    session: Optional[requests.Session] = None,
+    rate_limiter: Optional["TokenBucket"] = None,
+) -> Dict[Tuple[str, str], Optional[tuple]]:
+    """fetch_matchup_data() for many (champion, enemy) pairs over one pooled session."""
+    if max_workers is None:
+        max_workers = scraping_config.MATCHUP_HTTP_MAX_WORKERS
+    if session is None:
+        with requests.Session() as own_session:
+            return fetch_matchups_bulk(patch, pairs, max_workers, own_session, rate_limiter)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            pair: executor.submit(
+                fetch_matchup_data, patch, pair[0], pair[1], session, rate_limiter
+            )
+            for pair in dict.fromkeys(pairs)
+        }
+        return {pair: future.result() for pair, future in futures.items()}
+
+
+def matchup_name_from_href(href: str) -> str:
+    """Enemy name from a matchup link (/lol/{champion}/vs/{enemy}/build/...)."""
+    return href.split("vs/")[1].split("/build")[0]
+
+
+def synergy_name_from_href(href: str) -> str:
+    """Ally name from a synergy link (/lol/{ally}/build/...)."""
+    return href.split("/lol/")[1].split("/build")[0]
+
+
+# Cookie-banner agree button candidates, probed in order by _COOKIE_BANNER_JS:
+# ID, CSS selectors, then XPath text patterns (entries starting with "//").
+_COOKIE_SELECTORS = (
+    "#didomi-notice-agree-button",
+    "button[aria-label*='agree' i]",
+    "button[aria-label*='accept' i]",
+    "button.didomi-button",
+    ".didomi-notice-agree-button",
+    "//button[contains(translate(text(), 'ACCEPT', 'accept'), 'accept')]",
+    "//button[contains(translate(text(), 'AGREE', 'agree'), 'agree')]",
+    "//button[contains(@class, 'agree')]",
+)
+
+# Clicks the first visible match of arguments[0] and returns its selector; null when
+# none matched, false when the page has no <body> at all (one RPC for every strategy).
+_COOKIE_BANNER_JS = """
+for (const sel of arguments[0]) {
+    const el = sel.startsWith("//")
+        ? document.evaluate(sel, document, null, 9, null).singleNodeValue
+        : document.querySelector(sel);
+    if (el && el.offsetParent !== null) {
+        el.click();
+        return sel;
+    }
+}
+return document.body ? null : false;
+"""
+
+# Rendered item count and horizontal scroll offset of the row container arguments[0]
+_ROW_STATE_JS = "return [arguments[0].childElementCount, arguments[0].scrollLeft];"
+
+
+# Script-side equivalent of _carousel_item_fields: returns the raw fields of every
+# entry of the row container passed as arguments[0] in a single execute_script call.
+_CAROUSEL_ROW_JS = """
+return Array.from(arguments[0].children, (item) => {
+    const link = item.querySelector("a");
+    const winrate = item.querySelector(":scope > div:first-of-type > span");
+    const games = item.getElementsByClassName("text-[9px]")[0];
+    return [
+        link ? link.getAttribute("href") : null,
+        winrate ? winrate.textContent : null,
+        Array.from(item.getElementsByClassName("my-1"), (el) => el.textContent),
+        games ? games.textContent : null,
+    ];
+});
+"""
+
+
+def _carousel_item_fields(item) -> tuple:
+    """Raw (href, winrate_text, my1_texts, games_text) of an lxml carousel entry."""
+    hrefs = _ITEM_HREF(item)
+    winrates = _ITEM_WINRATE(item)
+    games = _ITEM_GAMES(item)
+    return (
+        hrefs[0] if hrefs else None,
+        winrates[0].text_content() if winrates else None,
+        [el.text_content() for el in _ITEM_MY1(item)],
+        games[0].text_content() if games else None,
+    )
+
+
+def build_carousel_entry(fields, name_from_href: Callable[[str], str]) -> Optional[tuple]:
+    """Convert the raw fields of one carousel entry into a matchup/synergy tuple.
+
+    Args:
+        fields: (href, winrate_text, my1_texts, games_text), as read from lxml
+            or returned by _CAROUSEL_ROW_JS. Missing fields are None.
+        name_from_href: Extracts the opponent/ally name from the entry link
+
+    Returns:
+        (name, winrate, delta1, delta2, pickrate, games), or None when the
+        entry does not carry the full set of stats.
+
+    Raises:
+        IndexError, ValueError: Entry markup is incomplete or malformed
+    """
+    href, winrate_text, my1_texts, games_text = fields
+    if href is None or winrate_text is None:
+        raise IndexError("carousel entry has no link or winrate")
+    name = name_from_href(href)
+    winrate = float(winrate_text.split("%")[0])
+    if len(my1_texts) < 7:
+        logger.warning("Insufficient my-1 elements for %s (%d). Skipping.", name, len(my1_texts))
+        return None
+    delta1 = float(my1_texts[4])
+    delta2 = float(my1_texts[5])
+    pickrate = float(my1_texts[6])
+    if games_text is None:
+        raise IndexError("carousel entry has no games count")
+    games = int("".join(games_text.split()).replace(",", ""))
+    return name, winrate, delta1, delta2, pickrate, games
+
+
+def parse_carousel_item(item, name_from_href: Callable[[str], str]) -> Optional[tuple]:
+    """Extract one matchup/synergy tuple from an lxml carousel entry.
+
+    See build_carousel_entry() for return value and exceptions.
+    """
+    return build_carousel_entry(_carousel_item_fields(item), name_from_href)
+
+
+def parse_carousel_entries(
+    raw_entries, name_from_href: Callable[[str], str], kind: str = "matchup"
+) -> List[tuple]:
+    """Build tuples for a sequence of raw carousel entries, skipping malformed ones.
+
+    Args:
+        raw_entries: Iterable of (href, winrate_text, my1_texts, games_text)
+        name_from_href: Extracts the opponent/ally name from an entry link
+        kind: "matchup" or "synergy" (log messages only)
+
+    Returns:
+        List of (name, winrate, delta1, delta2, pickrate, games) in input order
+    """
+    parsed = []
+    for fields in raw_entries:
+        try:
+            data = build_carousel_entry(fields, name_from_href)
+        except (IndexError, ValueError) as e:
+            logger.warning(
+                "Failed to parse %s element: %s: %s. Skipping.", kind, type(e).__name__, e
+            )
+            continue
+        if data is not None:
+            parsed.append(data)
+    return parsed
+
+
+def parse_carousel_row(
+    tree, row_index: int, name_from_href: Callable[[str], str], kind: str = "matchup"
+) -> List[tuple]:
+    """Parse every carousel item currently rendered in one tier row.
+
+    Args:
+        tree: lxml tree of the champion page
+        row_index: Tier row index in xpath_config.MATCHUP_ROW_BASE
+        name_from_href: Extracts the opponent/ally name from an entry link
+        kind: "matchup" or "synergy" (log messages only)
+
+    Returns:
+        List of (name, winrate, delta1, delta2, pickrate, games) in DOM order,
+        malformed entries skipped.
+    """
+    items = _ROW_ITEMS(tree, index=row_index)
+    return parse_carousel_entries(map(_carousel_item_fields, items), name_from_href, kind)
+
+
+def parse_carousel_html(
+    html: str, row_index: int, name_from_href: Callable[[str], str], kind: str = "matchup"
+) -> List[tuple]:
+    """parse_carousel_row() on a serialized page.
+
+    Module-level and picklable so it can run in a ProcessPoolExecutor worker
+    (name_from_href must then be a module-level function too).
+    """
+    return parse_carousel_row(lxml.html.fromstring(html), row_index, name_from_href, kind)
+
+
+class _DriverSession:
+    """Lock and currently selected tab of a webdriver, shared by its Parsers."""
+
+    def __init__(self, active_handle: Optional[str]) -> None:
+        self.lock = RLock()
+        self.active_handle = active_handle
+        # Set once a share_driver_of Parser opened a tab: such a browser is never pooled
+        self.has_shared_tabs = False
+
+
+def _on_own_tab(method):
+    """Run a Parser method on the parser's own tab while holding the driver lock.
+
+    WebDriver sessions are not thread-safe across tabs: parsers sharing one
+    browser are serialized, and the tab is only re-selected when another
+    parser used the browser in between.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.session.lock:
+            if self.session.active_handle != self.window_handle:
+                self.webdriver.switch_to.window(self.window_handle)
+                self.session.active_handle = self.window_handle
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _quit_quietly(driver: webdriver.Firefox) -> None:
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+
+
 class Parser:
-    def __init__(self, headless: bool = False) -> None:
+    # Idle headless webdrivers left by closed Parsers, taken by the next ones so a
+    # scrape pass does not boot Firefox again (see BROWSER_POOL_SIZE).
+    _pool: List[webdriver.Firefox] = []
+    _pool_lock = Lock()
+
+    @classmethod
+    def acquire(cls) -> Optional[webdriver.Firefox]:
+        """Take a live idle webdriver from the pool, or None if there is none."""
+        while True:
+            with cls._pool_lock:
+                if not cls._pool:
+                    return None
+                driver = cls._pool.pop()
+            try:
+                # Tabs of a shared browser may have closed the current window
+                driver.switch_to.window(driver.window_handles[0])
+                return driver
+            except WebDriverException:
+                _quit_quietly(driver)  # Browser died while idle
+
+    @classmethod
+    def release(cls, driver: webdriver.Firefox) -> bool:
+        """Keep driver for a later Parser. Returns False (driver untouched) if the pool is full."""
+        with cls._pool_lock:
+            if len(cls._pool) >= scraping_config.BROWSER_POOL_SIZE:
+                return False
+            cls._pool.append(driver)
+            return True
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """Quit every idle webdriver (registered with atexit)."""
+        with cls._pool_lock:
+            drivers, cls._pool = cls._pool, []
+        for driver in drivers:
+            _quit_quietly(driver)
+
+    def __init__(self, headless: bool = False, share_driver_of: Optional["Parser"] = None) -> None:
         """Initialize Parser with optional headless mode.
 
         Args:
             headless: If True, run Firefox in headless mode (no GUI).
                      Useful for Task Scheduler, background tasks, or CI/CD.
                      Default: False (normal GUI mode with fullscreen).
+            share_driver_of: Existing Parser whose browser to reuse. A new tab is
+                     opened in it instead of launching another Firefox process;
+                     scraping calls are then serialized on that browser.
         """
+        self.headless = headless
+        # Set once the consent banner was dismissed: the choice is stored in a cookie,
+        # so later pages of this browser never show it again.
+        self.cookies_accepted = False
+        # Champion page currently loaded on its matchups tab (see get_champion_synergies_on_patch)
+        self.current_url = None
+        # (patch, champion, enemy) -> (winrate, games) already read during this session
+        self._matchup_stats: Dict[Tuple[str, str, str], tuple] = {}
+        # Optional concurrent.futures executor (set by ParallelParser) that runs the
+        # CPU-bound carousel HTML parsing outside this process, away from the GIL.
+        self.parse_pool = None
+        # Optional TokenBucket (set by ParallelParser) pacing the plain HTTP matchup
+        # fetches together with the browser page loads.
+        self.rate_limiter: Optional["TokenBucket"] = None
+        # Plain HTTP matchup fetches (opt-in), over one session kept for this parser's
+        # lifetime. Switched off after the first response without stats: LoLalytics
+        # answers every later request the same way (Cloudflare challenge, JS-only page).
+        self.http_first = scraping_config.MATCHUP_HTTP_FIRST
+        self.http_session: Optional[requests.Session] = None
+
+        if share_driver_of is not None:
+            self.webdriver = share_driver_of.webdriver
+            self.session = share_driver_of.session
+            self.owns_driver = False
+            with self.session.lock:
+                self.session.has_shared_tabs = True
+                self.webdriver.switch_to.new_window("tab")
+                self.window_handle = self.webdriver.current_window_handle
+                self.session.active_handle = self.window_handle
+            return
+
+        driver = Parser.acquire() if headless else None
+        if driver is not None:
+            self.webdriver = driver
+            self.owns_driver = True
+            self.window_handle = self.webdriver.current_window_handle
+            self.session = _DriverSession(self.window_handle)
+            return
+
         options = Options()
         options.binary_location = config.get_firefox_path()
+        options.page_load_strategy = scraping_config.PAGE_LOAD_STRATEGY
+        if scraping_config.BLOCK_IMAGES:
+            options.set_preference("permissions.default.image", 2)
+        if scraping_config.BLOCK_TRACKERS:
+            options.set_preference("privacy.trackingprotection.enabled", True)
+            options.set_preference("privacy.trackingprotection.socialtracking.enabled", True)
+        options.set_preference("dom.webnotifications.enabled", False)
+        # Nothing scraped needs video or GPU rendering
+        options.set_preference("media.autoplay.default", 5)  # Block all autoplay
+        options.set_preference("webgl.disabled", True)
 
         if headless:
             # Headless mode for background execution (Task Scheduler, pythonw.exe)
@@ -58,8 +479,12 @@ class Parser:
             # Normal mode with window manager integration (Komorebi)
             options.add_argument("--start-maximized")
 
-        self.webdriver = webdriver.Firefox(options=options)
-        self.headless = headless
+        # keep_alive reuses one pooled HTTP connection to geckodriver for every
+        # command instead of opening a new TCP socket per find_element/get_attribute.
+        self.webdriver = webdriver.Firefox(options=options, keep_alive=True)
+        self.owns_driver = True
+        self.window_handle = self.webdriver.current_window_handle
+        self.session = _DriverSession(self.window_handle)
 
         # Fullscreen only in GUI mode (not needed in headless)
         if not headless:
@@ -70,118 +495,127 @@ class Parser:
                 print(f"[DEBUG] Fullscreen failed, falling back to maximize: {e}")
                 self.webdriver.maximize_window()
 
-        # Minimal delay for Firefox initialization
-        # NOTE: Komorebi should have Firefox in float_rules to avoid window manager interference
-        sleep(scraping_config.FIREFOX_STARTUP_DELAY)
+            # Let the window manager settle the fullscreen window. Headless needs no
+            # delay: webdriver.Firefox() only returns once the session is ready.
+            # NOTE: Komorebi should have Firefox in float_rules to avoid window manager interference
+            sleep(scraping_config.FIREFOX_STARTUP_DELAY)
 
     def close(self) -> None:
-        self.webdriver.quit()
+        if self.http_session is not None:
+            self.http_session.close()
+            self.http_session = None
+        if self.owns_driver:
+            # GUI browsers are never pooled (an idle visible window would linger), nor
+            # browsers whose borrowed tabs may still be closing
+            pooled = (
+                self.headless
+                and not self.session.has_shared_tabs
+                and Parser.release(self.webdriver)
+            )
+            if not pooled:
+                self.webdriver.quit()
+            return
+        # Shared browser: only close this parser's tab
+        with self.session.lock:
+            try:
+                self.webdriver.switch_to.window(self.window_handle)
+                self.webdriver.close()
+            except WebDriverException:
+                pass  # Browser already quit by its owner
+            self.session.active_handle = None
+
+    def _wait_for_page_ready(self) -> None:
+        """Wait until the champion page shell is in the DOM.
+
+        Replaces a fixed PAGE_LOAD_DELAY: returns as soon as <main> exists, and
+        on timeout lets the caller go on (rate-limit/section checks follow).
+        """
+        try:
+            WebDriverWait(self.webdriver, scraping_config.PAGE_LOAD_TIMEOUT).until(
+                EC.presence_of_element_located((By.TAG_NAME, "main"))
+            )
+        except TimeoutException:
+            logger.warning("Page not ready after %ss", scraping_config.PAGE_LOAD_TIMEOUT)
+
+    def _scroll_to_matchup_section(self) -> None:
+        """Scroll to MATCHUP_SCROLL_Y and wait for the scroll to land.
+
+        MATCHUP_SCROLL_Y must place the section (~Y=2200) inside the viewport to
+        trigger its lazy-loading. Short pages may never reach the target, so a
+        timeout is not an error.
+        """
+        target = scraping_config.MATCHUP_SCROLL_Y
+        self.webdriver.execute_script(f"window.scrollTo(0, {target})")
+        try:
+            WebDriverWait(self.webdriver, scraping_config.SCROLL_TIMEOUT).until(
+                lambda d: (d.execute_script("return window.scrollY") or 0) >= target
+            )
+        except TimeoutException:
+            pass
+
+    def _wait_for_row_to_settle(self, container) -> None:
+        """Wait until a carousel row stops changing after a scroll.
+
+        Polls the row's item count and scroll offset every CAROUSEL_SETTLE_POLL
+        seconds and returns once two consecutive reads agree, instead of a fixed
+        sleep. A timeout is not an error: the row is then read as it is.
+        """
+        last: List[Optional[list]] = []
+
+        def settled(driver) -> bool:
+            state = driver.execute_script(_ROW_STATE_JS, container)
+            if state is not None and last and state == last[-1]:
+                return True
+            last.append(state)
+            return False
+
+        try:
+            WebDriverWait(
+                self.webdriver,
+                scraping_config.CAROUSEL_SETTLE_TIMEOUT,
+                poll_frequency=scraping_config.CAROUSEL_SETTLE_POLL,
+            ).until(settled)
+        except TimeoutException:
+            pass
 
     def _accept_cookies(self) -> None:
         """Accept cookies banner using dynamic element detection.
 
         Tries multiple strategies in order:
-        1. Find button by ID (didomi-notice-agree-button)
-        2. Find button by CSS selector (common patterns)
-        3. Find button by text content
+        1-3. Probe the agree button by ID, CSS selectors and XPath text patterns,
+             all in one execute_script round-trip (_COOKIE_BANNER_JS)
         4. Fallback to hardcoded coordinates (Bug #1 legacy method)
+
+        Once a DOM strategy dismissed the banner, later calls return immediately
+        instead of probing every strategy again on each page.
         """
-        # Strategy 1: Find by ID (most reliable)
-        try:
-            cookie_button = self.webdriver.find_element(By.ID, "didomi-notice-agree-button")
-            cookie_button.click()
-            logger.info("Cookie banner dismissed via ID selector")
+        if self.cookies_accepted:
             return
-        except NoSuchElementException:
-            # Expected - element not found, try next strategy
-            pass
-        except ElementNotInteractableException:
-            ERR_COOKIE_004.log(logger, "Cookie button found but not clickable via ID selector")
-            pass
+
+        matched = None
+        try:
+            matched = self.webdriver.execute_script(_COOKIE_BANNER_JS, list(_COOKIE_SELECTORS))
+        except JavascriptException as e:
+            ERR_COOKIE_001.log(logger, f"Cookie banner probe script failed: {e.msg}", exc_info=e)
         except (InvalidSessionIdException, WebDriverException) as e:
             # CRITICAL: WebDriver crashed - cannot continue
             ERR_COOKIE_007.log(
                 logger,
-                f"FATAL: WebDriver session lost in ID strategy: {type(e).__name__}",
+                f"FATAL: WebDriver session lost in cookie banner probe: {type(e).__name__}",
                 exc_info=e,
             )
             raise  # Re-raise to abort scraping
         except Exception as e:
             ERR_COOKIE_001.log(
-                logger, f"Unexpected error in ID strategy: {type(e).__name__}: {e}", exc_info=e
+                logger,
+                f"Unexpected error in cookie banner probe: {type(e).__name__}: {e}",
+                exc_info=e,
             )
-            pass
 
-        # Strategy 2: Find by CSS selector (button with specific text)
-        selectors = [
-            "button[aria-label*='agree' i]",
-            "button[aria-label*='accept' i]",
-            "button.didomi-button",
-            ".didomi-notice-agree-button",
-        ]
-        for selector in selectors:
-            try:
-                cookie_button = self.webdriver.find_element(By.CSS_SELECTOR, selector)
-                cookie_button.click()
-                logger.info(f"Cookie banner dismissed via CSS selector: {selector}")
-                return
-            except NoSuchElementException:
-                # Expected - try next selector
-                continue
-            except ElementNotInteractableException:
-                ERR_COOKIE_004.log(
-                    logger, f"Cookie button found but not clickable via CSS: {selector}"
-                )
-                continue
-            except (InvalidSessionIdException, WebDriverException) as e:
-                # CRITICAL: WebDriver crashed - cannot continue
-                ERR_COOKIE_007.log(
-                    logger,
-                    f"FATAL: WebDriver session lost in CSS strategy: {type(e).__name__}",
-                    exc_info=e,
-                )
-                raise  # Re-raise to abort scraping
-            except Exception as e:
-                ERR_COOKIE_002.log(
-                    logger,
-                    f"Unexpected error in CSS strategy ({selector}): {type(e).__name__}: {e}",
-                    exc_info=e,
-                )
-                continue
-
-        # Strategy 3: Find button by XPath with text content
-        xpath_patterns = [
-            "//button[contains(translate(text(), 'ACCEPT', 'accept'), 'accept')]",
-            "//button[contains(translate(text(), 'AGREE', 'agree'), 'agree')]",
-            "//button[contains(@class, 'agree')]",
-        ]
-        for xpath in xpath_patterns:
-            try:
-                cookie_button = self.webdriver.find_element(By.XPATH, xpath)
-                cookie_button.click()
-                logger.info(f"Cookie banner dismissed via XPath")
-                return
-            except NoSuchElementException:
-                # Expected - try next XPath
-                continue
-            except ElementNotInteractableException:
-                ERR_COOKIE_004.log(logger, f"Cookie button found but not clickable via XPath")
-                continue
-            except (InvalidSessionIdException, WebDriverException) as e:
-                # CRITICAL: WebDriver crashed - cannot continue
-                ERR_COOKIE_007.log(
-                    logger,
-                    f"FATAL: WebDriver session lost in XPath strategy: {type(e).__name__}",
-                    exc_info=e,
-                )
-                raise  # Re-raise to abort scraping
-            except Exception as e:
-                ERR_COOKIE_003.log(
-                    logger,
-                    f"Unexpected error in XPath strategy: {type(e).__name__}: {e}",
-                    exc_info=e,
-                )
-                continue
+        if isinstance(matched, str):
+            self.cookies_accepted = True
+            logger.info(f"Cookie banner dismissed via selector: {matched}")
+            return
 
         # Skip coordinate-based fallbacks in headless mode
         # Reason: LoLalytics cookie banner likely doesn't appear in headless,
@@ -194,71 +628,112 @@ class Parser:
             )
 
             # Verify page is actually loaded and not stuck on cookie banner
-            try:
-                self.webdriver.find_element(By.TAG_NAME, "body")
-                logger.info("Page structure verified - cookie banner handled successfully")
-            except NoSuchElementException:
+            # (the probe returns false when the document has no <body>)
+            if matched is False:
                 ERR_COOKIE_005.log(
-                    logger,
-                    "CRITICAL: Page failed to load despite cookie banner attempts",
-                    exc_info=True,
+                    logger, "CRITICAL: Page failed to load despite cookie banner attempts"
                 )
+            else:
+                logger.info("Page structure verified - cookie banner handled successfully")
             return
 
         # Strategy 4: Fallback to hardcoded coordinates (Bug #1 legacy)
         # GUI mode only - coordinates are screen-dependent
         try:
             self.webdriver.execute_script(
-                f"""
-                var event = new MouseEvent('click', {{
-                    view: window,
-                    bubbles: true,
-                    cancelable: true,
-                    clientX: {scraping_config.COOKIE_CLICK_X},
-                    clientY: {scraping_config.COOKIE_CLICK_Y}
-                }});
-                document.elementFromPoint({scraping_config.COOKIE_CLICK_X}, {scraping_config.COOKIE_CLICK_Y}).dispatchEvent(event);
-            """
+                "document.elementFromPoint(arguments[0], arguments[1]).click();",
+                scraping_config.COOKIE_CLICK_X,
+                scraping_config.COOKIE_CLICK_Y,
             )
             logger.info("Cookie banner dismissed via JavaScript coordinates click")
         except Exception as e:
-            # Final fallback to ActionChains
             ERR_COOKIE_006.log(
                 logger,
-                f"JavaScript coordinate click failed, trying ActionChains: {type(e).__name__}",
+                f"JavaScript coordinate click failed: {type(e).__name__}",
                 exc_info=e,
             )
-            try:
-                actions = ActionChains(self.webdriver)
-                actions.move_by_offset(
-                    scraping_config.COOKIE_CLICK_X, scraping_config.COOKIE_CLICK_Y
-                ).click().perform()
-                actions = ActionChains(self.webdriver)
-                actions.move_by_offset(
-                    -scraping_config.COOKIE_CLICK_X, -scraping_config.COOKIE_CLICK_Y
-                ).perform()
-                logger.info("Cookie banner dismissed via ActionChains coordinates click")
-            except Exception as e2:
-                ERR_COOKIE_006.log(
-                    logger,
-                    f"ActionChains coordinate click also failed: {type(e2).__name__}",
-                    exc_info=e2,
-                )
-                # Give up gracefully - page may still load
+            # Give up gracefully - page may still load
 
     def get_matchup_data(self, champion: str, enemy: str) -> float:
         return self.get_matchup_data_on_patch(config.CURRENT_PATCH, champion, enemy)
 
     def get_matchup_data_on_patch(self, patch: str, champion: str, enemy: str) -> tuple:
-        """Get matchup data for specific champions and patch with error handling."""
-        url = f"https://lolalytics.com/lol/{champion}/vs/{enemy}/build/?tier=diamond_plus&patch={patch}"
+        """Get matchup data for specific champions and patch with error handling.
+
+        With http_first, tries a plain HTTP fetch first and only loads the page in
+        the browser when the server-rendered HTML does not carry the stats.
+        """
+        key = (patch, champion, enemy)
+        if key in self._matchup_stats:
+            return self._matchup_stats[key]
+        stats = None
+        if self.http_first:
+            stats = fetch_matchup_data(
+                patch, champion, enemy, self._http_session(), self.rate_limiter
+            )
+            if stats is None:
+                self._disable_http_first()
+        if stats is None:
+            stats = self._browse_matchup_data(patch, champion, enemy)
+        if stats[0] is not None:
+            self._matchup_stats[key] = stats
+        return stats
+
+    def get_matchups_bulk(
+        self, patch: str, pairs: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], tuple]:
+        """get_matchup_data_on_patch() for many (champion, enemy) pairs.
+
+        With http_first, the pages are fetched concurrently over HTTP; only pairs
+        missing from the server-rendered HTML are loaded one by one in the browser.
+        """
+        pairs = list(dict.fromkeys(pairs))
+        results = {
+            pair: self._matchup_stats[(patch, *pair)]
+            for pair in pairs
+            if (patch, *pair) in self._matchup_stats
+        }
+        fetched: Dict[Tuple[str, str], Optional[tuple]] = dict.fromkeys(
+            pair for pair in pairs if pair not in results
+        )
+        if self.http_first and fetched:
+            fetched = fetch_matchups_bulk(
+                patch, list(fetched), session=self._http_session(), rate_limiter=self.rate_limiter
+            )
+            if None in fetched.values():
+                self._disable_http_first()
+        for (champion, enemy), stats in fetched.items():
+            if stats is None:
+                stats = self._browse_matchup_data(patch, champion, enemy)
+            results[champion, enemy] = stats
+            if stats[0] is not None:
+                self._matchup_stats[patch, champion, enemy] = stats
+        return results
+
+    def _http_session(self) -> requests.Session:
+        if self.http_session is None:
+            self.http_session = requests.Session()
+        return self.http_session
+
+    def _disable_http_first(self) -> None:
+        logger.info("Matchup stats missing from the HTML, using the browser for this run")
+        self.http_first = False
+
+    @_on_own_tab
+    def _browse_matchup_data(self, patch: str, champion: str, enemy: str) -> tuple:
+        """Matchup (winrate, games) read from the page rendered in the browser."""
+        url = matchup_url(patch, champion, enemy)
 
         try:
+            # Navigating away: the champion page is no longer loaded for synergies
+            self.current_url = None
             self.webdriver.get(url)
-            tree = lxml.html.fromstring(self.webdriver.page_source)
+            # Transfer the stats section only, not the whole serialized page
+            html = self.webdriver.execute_script(_OUTER_HTML_JS, _MATCHUP_SECTION)
+            tree = lxml.html.fromstring(html) if html else None
 
             # Try to extract winrate with fallback paths
-            winrate_elements = tree.xpath(xpath_config.WINRATE_XPATH)
+            winrate_elements = _MATCHUP_WINRATE(tree) if tree is not None else []
             if not winrate_elements:
                 print(f"Warning: Could not find winrate for {champion} vs {enemy}")
                 return None, None
@@ -266,7 +741,7 @@ class Parser:
             winrate = float(winrate_elements[0])
 
             # Try to extract games with fallback paths
-            games_elements = tree.xpath(xpath_config.GAMES_XPATH)
+            games_elements = _MATCHUP_GAMES(tree)
             if not games_elements:
                 print(f"Warning: Could not find games count for {champion} vs {enemy}")
                 return winrate, 0
@@ -284,23 +759,21 @@ class Parser:
     def get_champion_data(self, champion: str, lane: str = None) -> List[tuple]:
         return self.get_champion_data_on_patch(config.CURRENT_PATCH, champion, lane)
 
+    @_on_own_tab
     def get_champion_data_on_patch(
         self, patch: str, champion: str, lane: str = None
     ) -> List[tuple]:
-        result = []
-
-        if lane:
-            url = f"https://lolalytics.com/lol/{champion}/build/?lane={lane}&tier=diamond_plus&patch={patch}"
-        else:
-            url = f"https://lolalytics.com/lol/{champion}/build/?tier=diamond_plus&patch={patch}"
+        url = champion_url(patch, champion, lane)
 
+        # Only a successfully scraped page may be reused by the synergies pass: not a
+        # rate-limit/Cloudflare page, nor a previous page if get() fails
+        self.current_url = None
         self.webdriver.get(url)
-        sleep(scraping_config.PAGE_LOAD_DELAY)
+        self._wait_for_page_ready()
+        detect_rate_limit(self.webdriver, url)
 
         # Scroll to trigger lazy-loading of the matchup section.
-        # MATCHUP_SCROLL_Y must place the section (~Y=2200) inside the viewport.
-        self.webdriver.execute_script(f"window.scrollTo(0, {scraping_config.MATCHUP_SCROLL_Y})")
-        sleep(scraping_config.SCROLL_DELAY)
+        self._scroll_to_matchup_section()
 
         self._accept_cookies()
 
@@ -315,79 +788,59 @@ class Parser:
             try:
                 section = self.webdriver.find_element(By.XPATH, "/html/body/main/div[6]")
                 self.webdriver.execute_script("arguments[0].scrollIntoView(true);", section)
-                sleep(2)
                 WebDriverWait(self.webdriver, 5).until(
                     EC.presence_of_element_located((By.XPATH, first_row_path))
                 )
             except (TimeoutException, NoSuchElementException):
                 logger.warning("Matchup section never rendered for %s. Returning empty.", champion)
-                return result
+                return []
+
+        rows = self._scrape_carousel_rows(champion, range(2, 7), matchup_name_from_href, "matchup")
+        self.current_url = url
+        return rows
+
+    def _scrape_carousel_rows(
+        self, champion: str, row_indexes: range, name_from_href, kind: str
+    ) -> List[tuple]:
+        """Collect all entries of the matchup/synergy tier rows on the current page.
 
-        for row_idx in range(2, 7):
+        Each tier row is a horizontal carousel: entries are read, the carousel is
+        scrolled right, and the row is re-read until pickrates drop below
+        MIN_PICKRATE or scrolling reveals nothing new.
+
+        Every carousel frame costs a single round-trip to geckodriver (see
+        _read_carousel_frame) instead of ~6 find_element/get_attribute commands
+        per entry.
+        """
+        result = []
+        # Carousel passes re-read already collected items; a set keeps dedup O(1)
+        seen = set()
+
+        for row_idx in row_indexes:
             path = xpath_config.MATCHUP_ROW_BASE.format(index=row_idx)
 
             # Bring this tier row into the center of the viewport
             try:
                 container = self.webdriver.find_element(By.XPATH, path)
             except NoSuchElementException:
-                logger.warning("Matchup row %d missing for %s.", row_idx, champion)
+                logger.warning("%s row %d missing for %s.", kind.capitalize(), row_idx, champion)
                 continue
             self.webdriver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center'});", container
             )
-            sleep(0.3)
+            self._wait_for_row_to_settle(container)
 
             pickrate = float("inf")
 
             while True:
-                # Refresh elements each pass (carousel may add items after scroll)
-                row = self.webdriver.find_elements(By.XPATH, f"{path}/*")
+                # Re-read the DOM each pass (carousel may add items after scroll)
                 prev_count = len(result)
 
-                for elem_idx, elem in enumerate(row, start=1):
-                    try:
-                        champ = (
-                            elem.find_element(By.TAG_NAME, "a")
-                            .get_dom_attribute("href")
-                            .split("vs/")[1]
-                            .split("/build")[0]
-                        )
-                        winrate = float(
-                            elem.find_element(By.XPATH, f"{path}/div[{elem_idx}]/div[1]/span")
-                            .get_attribute("innerHTML")
-                            .split("%")[0]
-                        )
-                        my1_elements = elem.find_elements(By.CLASS_NAME, "my-1")
-                        if len(my1_elements) < 7:
-                            logger.warning(
-                                "Insufficient my-1 elements for %s matchup (%d). Skipping.",
-                                champ,
-                                len(my1_elements),
-                            )
-                            continue
-                        delta1 = float(my1_elements[4].get_attribute("innerHTML"))
-                        delta2 = float(my1_elements[5].get_attribute("innerHTML"))
-                        pickrate = float(my1_elements[6].get_attribute("innerHTML"))
-                        games = int(
-                            "".join(
-                                elem.find_element(By.CLASS_NAME, r"text-\[9px\]")
-                                .get_attribute("innerHTML")
-                                .split()
-                            ).replace(",", "")
-                        )
-                        if not self.contains(
-                            result, champ, winrate, delta1, delta2, pickrate, games
-                        ):
-                            result.append((champ, winrate, delta1, delta2, pickrate, games))
-                    except StaleElementReferenceException:
-                        break  # row became stale mid-pass; re-fetch on next iteration
-                    except (IndexError, ValueError, NoSuchElementException) as e:
-                        logger.warning(
-                            "Failed to parse matchup element: %s: %s. Skipping.",
-                            type(e).__name__,
-                            e,
-                        )
-                        continue
+                for entry in self._read_carousel_frame(container, row_idx, name_from_href, kind):
+                    pickrate = entry[4]
+                    if entry not in seen:
+                        seen.add(entry)
+                        result.append(entry)
 
                 # Stop if we have low-pickrate data or the carousel added nothing new
                 if pickrate < config.MIN_PICKRATE or len(result) == prev_count:
@@ -399,25 +852,29 @@ class Parser:
                     container,
                     scraping_config.MATCHUP_CAROUSEL_SCROLL_X,
                 )
-                sleep(0.5)
+                self._wait_for_row_to_settle(container)
 
         return result
 
-    def contains(self, list, champ, winrate, d1, d2, pick, games) -> bool:
-        ctns = False
-        for i in range(len(list)):
-            l_champ, l_winrate, l_delta1, l_delta2, l_pickrate, l_games = list[i]
-            if (
-                l_champ == champ
-                and l_winrate == winrate
-                and l_delta1 == d1
-                and l_delta2 == d2
-                and l_pickrate == pick
-                and l_games == games
-            ):
-                ctns = True
-                break
-        return ctns
+    def _read_carousel_frame(
+        self, container, row_idx: int, name_from_href, kind: str
+    ) -> List[tuple]:
+        """Read every entry currently rendered in one carousel row.
+
+        ScrapingConfig.CAROUSEL_EXTRACTION selects how the single round-trip is made:
+        "page_source" parses the serialized page with lxml, "script" walks the row
+        in the browser and returns the raw fields as one JSON array.
+        """
+        if scraping_config.CAROUSEL_EXTRACTION == "script":
+            raw_entries = self.webdriver.execute_script(_CAROUSEL_ROW_JS, container)
+            return parse_carousel_entries(raw_entries or [], name_from_href, kind)
+
+        html = self.webdriver.page_source
+        if self.parse_pool is not None:
+            return self.parse_pool.submit(
+                parse_carousel_html, html, row_idx, name_from_href, kind
+            ).result()
+        return parse_carousel_html(html, row_idx, name_from_href, kind)
 
     def get_champion_synergies(self, champion: str, lane: str = None) -> List[tuple]:
         """Parse champion synergies (WITH allies) from LoLalytics.
@@ -438,6 +895,7 @@ class Parser:
         """
         return self.get_champion_synergies_on_patch(config.CURRENT_PATCH, champion, lane)
 
+    @_on_own_tab
     def get_champion_synergies_on_patch(
         self, patch: str, champion: str, lane: str = None
     ) -> List[tuple]:
@@ -451,17 +909,19 @@ class Parser:
         Returns:
             List of tuples (ally_name, winrate, delta1, delta2, pickrate, games)
         """
-        result = []
 
-        # Build URL (same as matchups)
-        if lane:
-            url = f"https://lolalytics.com/lol/{champion}/build/?lane={lane}&tier=diamond_plus&patch={patch}"
+        # Same page as the matchups: when get_champion_data_on_patch just loaded
+        # it, only the tab needs switching
+        url = champion_url(patch, champion, lane)
+        if self.current_url == url:
+            logger.info("Reusing loaded page for %s synergies", champion)
         else:
-            url = f"https://lolalytics.com/lol/{champion}/build/?tier=diamond_plus&patch={patch}"
-
-        self.webdriver.get(url)
-        sleep(scraping_config.PAGE_LOAD_DELAY)
-        self._accept_cookies()
+            self.webdriver.get(url)
+            self._wait_for_page_ready()
+            detect_rate_limit(self.webdriver, url)
+            self._accept_cookies()
+        # The page leaves its matchups tab below
+        self.current_url = None
 
         # Click "Synergies" / "Common Teammates" tab
         try:
@@ -482,8 +942,7 @@ class Parser:
             return []
 
         # Scroll to trigger lazy-loading, then wait for the first synergy row
-        self.webdriver.execute_script(f"window.scrollTo(0, {scraping_config.MATCHUP_SCROLL_Y})")
-        sleep(scraping_config.SCROLL_DELAY)
+        self._scroll_to_matchup_section()
 
         first_row_path = xpath_config.MATCHUP_ROW_BASE.format(index=2)
         try:
@@ -495,7 +954,6 @@ class Parser:
             try:
                 section = self.webdriver.find_element(By.XPATH, "/html/body/main/div[6]")
                 self.webdriver.execute_script("arguments[0].scrollIntoView(true);", section)
-                sleep(2)
                 WebDriverWait(self.webdriver, 5).until(
                     EC.presence_of_element_located((By.XPATH, first_row_path))
                 )
@@ -504,74 +962,8 @@ class Parser:
                 return []
 
         # Parse synergies (4 tier rows, not 5 like matchups)
-        for row_idx in range(2, 6):
-            path = xpath_config.MATCHUP_ROW_BASE.format(index=row_idx)
+        return self._scrape_carousel_rows(champion, range(2, 6), synergy_name_from_href, "synergy")
 
-            try:
-                container = self.webdriver.find_element(By.XPATH, path)
-            except NoSuchElementException:
-                logger.warning("Synergy row %d missing for %s.", row_idx, champion)
-                continue
-            self.webdriver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center'});", container
-            )
-            sleep(0.3)
-
-            pickrate = float("inf")
-
-            while True:
-                row = self.webdriver.find_elements(By.XPATH, f"{path}/*")
-                prev_count = len(result)
-
-                for elem_idx, elem in enumerate(row, start=1):
-                    try:
-                        href = elem.find_element(By.TAG_NAME, "a").get_dom_attribute("href")
-                        ally = href.split("/lol/")[1].split("/build")[0]
-                        winrate = float(
-                            elem.find_element(By.XPATH, f"{path}/div[{elem_idx}]/div[1]/span")
-                            .get_attribute("innerHTML")
-                            .split("%")[0]
-                        )
-                        my1_elements = elem.find_elements(By.CLASS_NAME, "my-1")
-                        if len(my1_elements) < 7:
-                            logger.warning(
-                                "Insufficient my-1 elements for %s synergy (%d). Skipping.",
-                                ally,
-                                len(my1_elements),
-                            )
-                            continue
-                        delta1 = float(my1_elements[4].get_attribute("innerHTML"))
-                        delta2 = float(my1_elements[5].get_attribute("innerHTML"))
-                        pickrate = float(my1_elements[6].get_attribute("innerHTML"))
-                        games = int(
-                            "".join(
-                                elem.find_element(By.CLASS_NAME, r"text-\[9px\]")
-                                .get_attribute("innerHTML")
-                                .split()
-                            ).replace(",", "")
-                        )
-                        if not self.contains(
-                            result, ally, winrate, delta1, delta2, pickrate, games
-                        ):
-                            result.append((ally, winrate, delta1, delta2, pickrate, games))
-                    except StaleElementReferenceException:
-                        break
-                    except (IndexError, ValueError, NoSuchElementException) as e:
-                        logger.warning(
-                            "Failed to parse synergy element: %s: %s. Skipping.",
-                            type(e).__name__,
-                            e,
-                        )
-                        continue
-
-                if pickrate < config.MIN_PICKRATE or len(result) == prev_count:
-                    break
 
-                self.webdriver.execute_script(
-                    "arguments[0].scrollLeft += arguments[1];",
-                    container,
-                    scraping_config.MATCHUP_CAROUSEL_SCROLL_X,
-                )
-                sleep(0.5)
-
-        return result
+# Quit pooled headless browsers left by Parser.close()
+atexit.register(Parser.close_pool)
@@ -1,6 +1,8 @@
+import heapq
 import json
 import os
 import sys
+import tempfile
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, asdict, field
 from .config import get_resource_path
@@ -34,14 +36,9 @@ class ChampionPool:
     tags: List[str] = field(default_factory=list)
 
     def __post_init__(self):
-        # Ensure no duplicates and maintain order
-        seen = set()
-        unique_champs = []
-        for champ in self.champions:
-            if champ not in seen:
-                seen.add(champ)
-                unique_champs.append(champ)
-        self.champions = unique_champs
+        # Ensure no duplicates and maintain order. Always a copy: system pools are
+        # built from the role lists in constants, which must not be mutated.
+        self.champions = list(dict.fromkeys(self.champions))
 
     def add_champion(self, champion: str) -> bool:
         """Add a champion to the pool if not already present."""
@@ -182,8 +179,22 @@ class PoolManager:
             # Créer le répertoire parent si nécessaire
             os.makedirs(os.path.dirname(self.pools_file), exist_ok=True)
 
-            with open(self.pools_file, "w", encoding="utf-8") as f:
-                json.dump({"custom_pools": custom_pools}, f, indent=2, ensure_ascii=False)
+            payload = json.dumps({"custom_pools": custom_pools}, indent=2, ensure_ascii=False)
+            # Write-then-rename: a crash mid-save never leaves a truncated pools file.
+            # A unique temp name keeps two concurrent saves from sharing one file.
+            fd, tmp_file = tempfile.mkstemp(
+                dir=os.path.dirname(self.pools_file),
+                prefix=f"{os.path.basename(self.pools_file)}.",
+                suffix=".tmp",
+            )
+            os.close(fd)
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.pools_file)
+            except Exception:
+                os.remove(tmp_file)
+                raise
 
             print(f"[INFO] Saved {len(custom_pools)} custom pools to {self.pools_file}")
 
@@ -322,14 +333,14 @@ class PoolManager:
 
     def get_pool_stats(self) -> Dict[str, int]:
         """Get statistics about pools."""
-        stats = {
-            "total_pools": len(self.pools),
-            "custom_pools": sum(1 for p in self.pools.values() if p.created_by == "user"),
-            "system_pools": sum(1 for p in self.pools.values() if p.created_by == "system"),
-        }
+        stats = {"total_pools": len(self.pools), "custom_pools": 0, "system_pools": 0}
 
-        # Count by role
+        # Owner and role counts in a single pass
         for pool in self.pools.values():
+            if pool.created_by == "user":
+                stats["custom_pools"] += 1
+            elif pool.created_by == "system":
+                stats["system_pools"] += 1
             role_key = f"{pool.role}_pools"
             stats[role_key] = stats.get(role_key, 0) + 1
 
@@ -344,12 +355,7 @@ def validate_champion_name(champion: str, available_champions: Set[str]) -> bool
 def suggest_champions(partial: str, available_champions: Set[str], limit: int = 5) -> List[str]:
     """Suggest champion names based on partial input."""
     partial_lower = partial.lower()
-    matches = []
-
-    for champion in available_champions:
-        if champion.lower().startswith(partial_lower):
-            matches.append(champion)
-        elif partial_lower in champion.lower():
-            matches.append(champion)
-
-    return sorted(matches)[:limit]
+    # A prefix match is also a substring match: one lowercase + test per name,
+    # and only the `limit` first names in alphabetical order are kept sorted.
+    matches = (champion for champion in available_champions if partial_lower in champion.lower())
+    return heapq.nsmallest(limit, matches)
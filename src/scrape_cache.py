@@ -0,0 +1,77 @@
+"""On-disk cache of scraped champion pages.
+
+A full scrape loads one lolalytics page per champion (and per lane), which takes
+30-60 minutes sequentially. Most runs repeat the same patch, so each page's parsed
+rows are kept as a small JSON file: re-running after a crash or a partial failure
+only scrapes the champions that are missing or older than the TTL.
+
+Usage:
+    cache = ScrapeCache("data/scrape_cache", ttl_seconds=24 * 3600)
+    key = ScrapeCache.key("matchups", champion_url("15.24", "aatrox", "top"))
+    rows = cache.get(key)
+    if rows is None:
+        rows = scrape()
+        cache.put(key, rows)
+"""
+
+from hashlib import blake2b
+from typing import List, Optional
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeCache:
+    """JSON file per scraped page, valid for ttl_seconds after it was written."""
+
+    def __init__(self, directory: str, ttl_seconds: float) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(kind: str, url: str) -> str:
+        """Cache key of one page: kind ("matchups"/"synergies") and the URL it was loaded from.
+
+        Keying on the URL (see parser.champion_url) means any change to the loaded
+        page (champion, lane, patch, rank filter) also changes the key.
+        """
+        page = f"{kind}:{url}"
+        return blake2b(page.encode(), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[List[tuple]]:
+        """Cached rows for key, or None if missing, expired or unreadable."""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, encoding="utf-8") as f:
+                return [tuple(row) for row in json.load(f)]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable scrape cache entry {path}: {e}")
+            return None
+
+    def put(self, key: str, rows: List[tuple]) -> None:
+        """Store rows for key. Failures are logged: the cache is best-effort."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(rows, f)
+            # Atomic rename: concurrent readers never see a half-written file
+            os.replace(tmp_path, path)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not write scrape cache entry {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -16,13 +16,40 @@ Created: 2026-02-06
 Sprint: 2 - API Integration (Adapter Pattern Implementation)
 """
 
-from typing import List, Optional, Dict, Union, Tuple
+from typing import Callable, Generic, List, Optional, Dict, TypeVar, Union, Tuple
 
 from .data_source import DataSource
 from .db import Database
 from .models import Matchup, MatchupDraft, Synergy
 
 
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class _HitCache(Generic[K, V]):
+    """Memoizes a one-argument lookup, except misses (a later insert may fill them).
+
+    A miss is None, or the lookup's no-data default when given as `miss`.
+    """
+
+    def __init__(self, lookup: Callable[[K], V], miss: Optional[V] = None) -> None:
+        self._lookup = lookup
+        self._miss = miss
+        self._hits: Dict[K, V] = {}
+
+    def __call__(self, key: K) -> V:
+        if key in self._hits:
+            return self._hits[key]
+        value = self._lookup(key)
+        if value is not None and value != self._miss:
+            self._hits[key] = value
+        return value
+
+    def cache_clear(self) -> None:
+        self._hits.clear()
+
+
 class SQLiteDataSource(DataSource):
     """
     Adapter for SQLite database access via Database class.
@@ -55,11 +82,24 @@ class SQLiteDataSource(DataSource):
             database_path = config.DATABASE_PATH
         self._db = Database(database_path)
 
+        # The draft coach looks up the same ~170 champions on every tick: memoize per
+        # instance (a method-level lru_cache would share entries and keep instances alive).
+        # Unknown names/IDs and the no-data winrate (50.0) are not memoized, so
+        # champions and matchups added later are picked up.
+        self._champion_id = _HitCache(self._db.get_champion_id)
+        self._champion_by_id = _HitCache(self._db.get_champion_by_id)
+        self._champion_base_winrate = _HitCache(self._db.get_champion_base_winrate, miss=50.0)
+
+        # Pair delta2 lookups served from memory once preload_delta2_cache() has run
+        self._matchup_delta2: Optional[Dict[Tuple[str, str], float]] = None
+        self._synergy_delta2: Optional[Dict[Tuple[str, str], float]] = None
+
     # ==================== Connection Management ====================
 
     def connect(self) -> None:
         """Establish connection to SQLite database."""
         self._db.connect()
+        self.clear_champion_cache()
 
     def close(self) -> None:
         """Close SQLite database connection."""
@@ -67,13 +107,19 @@ class SQLiteDataSource(DataSource):
 
     # ==================== Champion Queries ====================
 
+    def clear_champion_cache(self) -> None:
+        """Forget memoized champion lookups (call after the champions table changes)."""
+        self._champion_id.cache_clear()
+        self._champion_by_id.cache_clear()
+        self._champion_base_winrate.cache_clear()
+
     def get_champion_id(self, champion: str) -> Optional[int]:
-        """Get champion ID by name (delegates to Database)."""
-        return self._db.get_champion_id(champion)
+        """Get champion ID by name (delegates to Database, memoized)."""
+        return self._champion_id(champion)
 
     def get_champion_by_id(self, id: int) -> Optional[str]:
-        """Get champion name by ID (delegates to Database)."""
-        return self._db.get_champion_by_id(id)
+        """Get champion name by ID (delegates to Database, memoized)."""
+        return self._champion_by_id(id)
 
     def get_all_champion_names(self) -> Dict[int, str]:
         """Get mapping of all champion IDs to names (delegates to Database)."""
@@ -103,8 +149,16 @@ class SQLiteDataSource(DataSource):
         """Get reverse matchups for draft analysis (delegates to Database)."""
         return self._db.get_reverse_matchups_for_draft(champion_name, as_dataclass)
 
+    def get_matchups_bidirectional(
+        self, champion_name: str
+    ) -> Tuple[List[MatchupDraft], List[MatchupDraft]]:
+        """Get direct and reverse draft matchups in one query (delegates to Database)."""
+        return self._db.get_matchups_bidirectional(champion_name)
+
     def get_matchup_delta2(self, champion_name: str, enemy_name: str) -> Optional[float]:
-        """Get delta2 value for specific matchup (delegates to Database)."""
+        """Get delta2 value for specific matchup (preloaded cache, else delegates to Database)."""
+        if self._matchup_delta2 is not None:
+            return self._matchup_delta2.get((champion_name.lower(), enemy_name.lower()))
         return self._db.get_matchup_delta2(champion_name, enemy_name)
 
     def get_all_matchups_bulk(self) -> Dict[Tuple[str, str], float]:
@@ -112,8 +166,8 @@ class SQLiteDataSource(DataSource):
         return self._db.get_all_matchups_bulk()
 
     def get_champion_base_winrate(self, champion_name: str) -> float:
-        """Calculate champion base winrate (delegates to Database)."""
-        return self._db.get_champion_base_winrate(champion_name)
+        """Calculate champion base winrate (delegates to Database, memoized)."""
+        return self._champion_base_winrate(champion_name)
 
     # ==================== Synergy Queries ====================
 
@@ -124,13 +178,28 @@ class SQLiteDataSource(DataSource):
         return self._db.get_champion_synergies_by_name(champion_name, as_dataclass)
 
     def get_synergy_delta2(self, champion_name: str, ally_name: str) -> Optional[float]:
-        """Get delta2 value for specific synergy (delegates to Database)."""
+        """Get delta2 value for specific synergy (preloaded cache, else delegates to Database)."""
+        if self._synergy_delta2 is not None:
+            return self._synergy_delta2.get((champion_name.lower(), ally_name.lower()))
         return self._db.get_synergy_delta2(champion_name, ally_name)
 
     def get_all_synergies_bulk(self) -> Dict[Tuple[str, str], float]:
         """Load all valid synergies in single query (delegates to Database)."""
         return self._db.get_all_synergies_bulk()
 
+    # ==================== Pair Delta2 Cache ====================
+
+    def preload_delta2_cache(self) -> Tuple[int, int]:
+        """Load every matchup/synergy delta2 once and serve pair lookups from memory."""
+        self._matchup_delta2 = self._db.get_all_matchup_delta2_aggregated()
+        self._synergy_delta2 = self._db.get_all_synergy_delta2_aggregated()
+        return len(self._matchup_delta2), len(self._synergy_delta2)
+
+    def clear_delta2_cache(self) -> None:
+        """Go back to per-pair SQL lookups."""
+        self._matchup_delta2 = None
+        self._synergy_delta2 = None
+
     # ==================== Champion Scores ====================
 
     def get_champion_scores_by_name(self, champion_name: str) -> Optional[Dict[str, float]]:
@@ -166,6 +235,10 @@ class SQLiteDataSource(DataSource):
             target_ratio=target_ratio,
         )
 
+    def save_champion_scores_bulk(self, rows: List[tuple]) -> int:
+        """Save scores of many champions in one transaction (delegates to Database)."""
+        return self._db.save_champion_scores_bulk(rows)
+
     # ==================== Ban Recommendations ====================
 
     def get_pool_ban_recommendations(self, pool_name: str, limit: int = 5) -> List[tuple]:
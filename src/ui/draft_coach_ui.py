@@ -44,6 +44,9 @@ def run_draft_coach(
             auto_ban_hover=auto_ban_hover,
             open_onetricks=open_onetricks,
         )
+        # Every candidate pick scores matchups/synergies pair by pair: pull them once
+        matchup_pairs, synergy_pairs = monitor.assistant.db.preload_delta2_cache()
+        print(f"[INFO] Loaded {matchup_pairs:,} matchups and {synergy_pairs:,} synergies")
         monitor.start_monitoring()
     except KeyboardInterrupt:
         print("\n[INFO] Draft Coach stopped by user")
@@ -164,6 +164,9 @@ def run_draft_coach(
             auto_ban_hover=auto_ban_hover,
             open_onetricks=open_onetricks,
         )
+        # Every candidate pick scores matchups/synergies pair by pair: pull them once
+        matchup_pairs, synergy_pairs = monitor.assistant.db.preload_delta2_cache()
+        print(f"[INFO] Loaded {matchup_pairs:,} matchups and {synergy_pairs:,} synergies")
         monitor.start_monitoring()
     except KeyboardInterrupt:
         print("\n[INFO] Draft Coach stopped by user")
@@ -384,13 +387,12 @@ def parse_champion_pool(patch_version=None):
 
         start_time = time.time()
         parallel_parser = ParallelParser(
-            max_workers=scraping_config.DEFAULT_MAX_WORKERS,
             patch_version=patch_version,
             headless=scraping_config.HEADLESS,
         )
 
         print(
-            f"\n[INFO] Starting parallel scraping with {scraping_config.DEFAULT_MAX_WORKERS} workers (patch {patch_version or config.CURRENT_PATCH})..."
+            f"\n[INFO] Starting parallel scraping with {parallel_parser.max_workers} workers (patch {patch_version or config.CURRENT_PATCH})..."
         )
         stats = parallel_parser.parse_champions_by_role(
             db, pool_champions, "top", normalize_champion_name_for_url
@@ -471,13 +473,12 @@ def parse_all_champions(patch_version=None):
 
         start_time = time.time()
         parallel_parser = ParallelParser(
-            max_workers=scraping_config.DEFAULT_MAX_WORKERS,
             patch_version=patch_version,
             headless=scraping_config.HEADLESS,
         )
 
         print(
-            f"\n[INFO] Starting parallel scraping with {scraping_config.DEFAULT_MAX_WORKERS} workers (patch {patch_version or config.CURRENT_PATCH})..."
+            f"\n[INFO] Starting parallel scraping with {parallel_parser.max_workers} workers (patch {patch_version or config.CURRENT_PATCH})..."
         )
         print(f"[INFO] Parsing champions from Riot API...")
 
@@ -577,13 +578,12 @@ def parse_synergies_pool(patch_version=None):
 
         start_time = time.time()
         parallel_parser = ParallelParser(
-            max_workers=scraping_config.DEFAULT_MAX_WORKERS,
             patch_version=patch_version,
             headless=scraping_config.HEADLESS,
         )
 
         print(
-            f"\n[INFO] Starting parallel synergy scraping with {scraping_config.DEFAULT_MAX_WORKERS} workers (patch {patch_version or config.CURRENT_PATCH})..."
+            f"\n[INFO] Starting parallel synergy scraping with {parallel_parser.max_workers} workers (patch {patch_version or config.CURRENT_PATCH})..."
         )
         stats = parallel_parser.parse_synergies_by_role(
             db, pool_champions, "top", normalize_champion_name_for_url
@@ -651,13 +651,12 @@ def parse_synergies_all(patch_version=None):
 
         start_time = time.time()
         parallel_parser = ParallelParser(
-            max_workers=scraping_config.DEFAULT_MAX_WORKERS,
             patch_version=patch_version,
             headless=scraping_config.HEADLESS,
         )
 
         print(
-            f"\n[INFO] Starting parallel synergy scraping with {scraping_config.DEFAULT_MAX_WORKERS} workers (patch {patch_version or config.CURRENT_PATCH})..."
+            f"\n[INFO] Starting parallel synergy scraping with {parallel_parser.max_workers} workers (patch {patch_version or config.CURRENT_PATCH})..."
         )
         print(f"[INFO] Parsing champions from Riot API...")
 
@@ -754,14 +753,13 @@ def parse_all_data_pool(patch_version=None):
         from src.config_constants import scraping_config
 
         parallel_parser = ParallelParser(
-            max_workers=scraping_config.DEFAULT_MAX_WORKERS,
             patch_version=patch_version,
             headless=scraping_config.HEADLESS,
         )
 
         # Parse matchups
         print(
-            f"\n[INFO] Step 1/2: Starting matchup scraping with {scraping_config.DEFAULT_MAX_WORKERS} workers..."
+            f"\n[INFO] Step 1/2: Starting matchup scraping with {parallel_parser.max_workers} workers..."
         )
         start_time = time.time()
         matchup_stats = parallel_parser.parse_champions_by_role(
@@ -771,7 +769,7 @@ def parse_all_data_pool(patch_version=None):
 
         # Parse synergies
         print(
-            f"\n[INFO] Step 2/2: Starting synergy scraping with {scraping_config.DEFAULT_MAX_WORKERS} workers..."
+            f"\n[INFO] Step 2/2: Starting synergy scraping with {parallel_parser.max_workers} workers..."
         )
         start_time = time.time()
         synergy_stats = parallel_parser.parse_synergies_by_role(
@@ -862,14 +860,13 @@ def parse_all_data_all(patch_version=None):
         from src.config_constants import scraping_config
 
         parallel_parser = ParallelParser(
-            max_workers=scraping_config.DEFAULT_MAX_WORKERS,
             patch_version=patch_version,
             headless=scraping_config.HEADLESS,
         )
 
         # Parse matchups
         print(
-            f"\n[INFO] Step 1/2: Starting matchup scraping with {scraping_config.DEFAULT_MAX_WORKERS} workers..."
+            f"\n[INFO] Step 1/2: Starting matchup scraping with {parallel_parser.max_workers} workers..."
         )
         print(f"[INFO] Parsing champions from Riot API...")
         start_time = time.time()
@@ -878,7 +875,7 @@ def parse_all_data_all(patch_version=None):
 
         # Parse synergies
         print(
-            f"\n[INFO] Step 2/2: Starting synergy scraping with {scraping_config.DEFAULT_MAX_WORKERS} workers..."
+            f"\n[INFO] Step 2/2: Starting synergy scraping with {parallel_parser.max_workers} workers..."
         )
         print(f"[INFO] Parsing champions from Riot API...")
         start_time = time.time()
@@ -218,7 +218,7 @@ class TestSynergiesRetryOnCloudflareException:
             # Patch _get_parser so no real Firefox is created
             with patch.object(pp, "_get_parser", return_value=mock_inner_parser):
                 with pytest.raises(CloudflareException):
-                    pp._scrape_champion_synergies_with_retry("Aatrox", lambda x: x)
+                    pp._scrape_champion_synergies_with_retry("Aatrox", "aatrox")
 
             # THEN: the scrape was attempted more than once (tenacity retried)
             call_count = mock_inner_parser.get_champion_synergies_on_patch.call_count
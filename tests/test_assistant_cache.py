@@ -30,12 +30,11 @@ class TestAssistantCacheBidirectional:
 
     @pytest.fixture
     def mock_db(self):
-        """Mock database with get_champion_matchups_for_draft and get_reverse_matchups_for_draft."""
+        """Mock database with get_matchups_bidirectional and get_matchup_delta2."""
         db = Mock()
 
         # Mock methods that warm_cache() will call
-        db.get_champion_matchups_for_draft = Mock(return_value=[])
-        db.get_reverse_matchups_for_draft = Mock(return_value=[])
+        db.get_matchups_bidirectional = Mock(return_value=([], []))
         db.get_matchup_delta2 = Mock(return_value=None)
 
         # Mock close method
@@ -73,20 +72,19 @@ class TestAssistantCacheBidirectional:
     def test_warm_cache_direct(self, assistant, mock_db):
         """Test direct cache loading (champion as picker -> enemies).
 
-        Scenario: warm_cache(["Darius"]) should call:
-        1. db.get_champion_matchups_for_draft("Darius")
-        2. db.get_reverse_matchups_for_draft("Darius")
+        Scenario: warm_cache(["Darius"]) should call
+        db.get_matchups_bidirectional("Darius") once (direct + reverse in one query)
 
         Result: Direct cache contains Darius with 2 matchups
         """
-        # Setup: Mock direct matchups (Darius picks against Jax and Fiora)
-        mock_db.get_champion_matchups_for_draft.return_value = [
-            MatchupDraft(enemy_name="Jax", delta2=2.5, pickrate=5.0, games=500),
-            MatchupDraft(enemy_name="Fiora", delta2=-1.2, pickrate=3.0, games=300),
-        ]
-
-        # Setup: Mock reverse matchups (empty for this test)
-        mock_db.get_reverse_matchups_for_draft.return_value = []
+        # Setup: Mock direct matchups (Darius picks against Jax and Fiora), no reverse
+        mock_db.get_matchups_bidirectional.return_value = (
+            [
+                MatchupDraft(enemy_name="Jax", delta2=2.5, pickrate=5.0, games=500),
+                MatchupDraft(enemy_name="Fiora", delta2=-1.2, pickrate=3.0, games=300),
+            ],
+            [],
+        )
 
         # Execute: Warm cache for Darius
         assistant.warm_cache(["Darius"])
@@ -98,9 +96,8 @@ class TestAssistantCacheBidirectional:
         # Verify: Cache enabled
         assert assistant._cache_enabled is True
 
-        # Verify: DB methods called once each
-        mock_db.get_champion_matchups_for_draft.assert_called_once_with("Darius")
-        mock_db.get_reverse_matchups_for_draft.assert_called_once_with("Darius")
+        # Verify: One DB round-trip for both directions
+        mock_db.get_matchups_bidirectional.assert_called_once_with("Darius")
 
     # ==================== Reverse Cache Tests ====================
 
@@ -112,14 +109,14 @@ class TestAssistantCacheBidirectional:
 
         Result: Reverse cache contains Darius with 2 champions that counter him
         """
-        # Setup: Mock direct matchups (empty for this test)
-        mock_db.get_champion_matchups_for_draft.return_value = []
-
-        # Setup: Mock reverse matchups (Jax and Camille pick against Darius)
-        mock_db.get_reverse_matchups_for_draft.return_value = [
-            MatchupDraft(enemy_name="Jax", delta2=3.0, pickrate=6.0, games=600),
-            MatchupDraft(enemy_name="Camille", delta2=2.0, pickrate=4.0, games=400),
-        ]
+        # Setup: No direct matchups; Jax and Camille pick against Darius
+        mock_db.get_matchups_bidirectional.return_value = (
+            [],
+            [
+                MatchupDraft(enemy_name="Jax", delta2=3.0, pickrate=6.0, games=600),
+                MatchupDraft(enemy_name="Camille", delta2=2.0, pickrate=4.0, games=400),
+            ],
+        )
 
         # Execute: Warm cache for Darius
         assistant.warm_cache(["Darius"])
@@ -139,20 +136,18 @@ class TestAssistantCacheBidirectional:
 
         Result: Both caches contain both champions
         """
-        # Setup: Mock direct matchups
-        mock_db.get_champion_matchups_for_draft.side_effect = [
-            # Darius direct matchups
-            [MatchupDraft(enemy_name="Jax", delta2=2.5, pickrate=5.0, games=500)],
-            # Garen direct matchups
-            [MatchupDraft(enemy_name="Teemo", delta2=-3.0, pickrate=4.0, games=400)],
-        ]
-
-        # Setup: Mock reverse matchups
-        mock_db.get_reverse_matchups_for_draft.side_effect = [
-            # Darius reverse matchups (who picks against Darius)
-            [MatchupDraft(enemy_name="Fiora", delta2=2.0, pickrate=3.0, games=300)],
-            # Garen reverse matchups (who picks against Garen)
-            [MatchupDraft(enemy_name="Quinn", delta2=1.5, pickrate=2.5, games=250)],
+        # Setup: (direct, reverse) matchups per champion
+        mock_db.get_matchups_bidirectional.side_effect = [
+            # Darius: picks against Jax / Fiora picks against Darius
+            (
+                [MatchupDraft(enemy_name="Jax", delta2=2.5, pickrate=5.0, games=500)],
+                [MatchupDraft(enemy_name="Fiora", delta2=2.0, pickrate=3.0, games=300)],
+            ),
+            # Garen: picks against Teemo / Quinn picks against Garen
+            (
+                [MatchupDraft(enemy_name="Teemo", delta2=-3.0, pickrate=4.0, games=400)],
+                [MatchupDraft(enemy_name="Quinn", delta2=1.5, pickrate=2.5, games=250)],
+            ),
         ]
 
         # Execute: Warm cache for both champions
@@ -466,8 +461,7 @@ class TestAssistantCacheBidirectional:
         Expected: DB methods called but caches remain empty for that champion
         """
         # Setup: Mock returns empty lists
-        mock_db.get_champion_matchups_for_draft.return_value = []
-        mock_db.get_reverse_matchups_for_draft.return_value = []
+        mock_db.get_matchups_bidirectional.return_value = ([], [])
 
         # Execute: Warm cache for champion with no data
         assistant.warm_cache(["Darius"])
@@ -479,9 +473,8 @@ class TestAssistantCacheBidirectional:
         assert "Darius" not in assistant._matchups_cache
         assert "Darius" not in assistant._reverse_cache
 
-        # Verify: DB methods called
-        mock_db.get_champion_matchups_for_draft.assert_called_once_with("Darius")
-        mock_db.get_reverse_matchups_for_draft.assert_called_once_with("Darius")
+        # Verify: DB method called
+        mock_db.get_matchups_bidirectional.assert_called_once_with("Darius")
 
     def test_get_cached_matchup_delta2_multiple_entries_finds_correct_one(self, assistant):
         """Test that lookup finds correct matchup when cache has multiple entries.
@@ -95,6 +95,7 @@ class TestAssistantWithMockedDataSource:
         mock_ds = Mock()
         mock_ds.get_champion_id.return_value = 42
         mock_ds.get_champion_matchups_for_draft.return_value = []
+        mock_ds.get_matchups_bidirectional.return_value = ([], [])
         mock_ds.get_champion_matchups_by_name.return_value = []
         mock_ds.get_all_matchups_bulk.return_value = {}
         mock_ds.build_champion_cache.return_value = {"Jinx": 42}
@@ -108,7 +109,7 @@ class TestAssistantWithMockedDataSource:
         assistant.warm_cache(["Jinx"])
 
         # Verify data source was used
-        mock_data_source.get_champion_matchups_for_draft.assert_called()
+        mock_data_source.get_matchups_bidirectional.assert_called()
 
     def test_assistant_delegates_to_specialized_modules(self, mock_data_source):
         """Test that Assistant initializes specialized modules with data source."""
@@ -17,7 +17,12 @@ from unittest.mock import MagicMock, patch, PropertyMock
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException as SeleniumTimeoutException
 
-from src.cloudflare_detector import CloudflareException, detect_cloudflare
+from src.cloudflare_detector import (
+    CloudflareException,
+    RateLimitedException,
+    detect_cloudflare,
+    detect_rate_limit,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -393,3 +398,46 @@ class TestDetectCloudflareLogging:
         with pytest.raises(CloudflareException):
             detect_cloudflare(driver, url="https://lolalytics.com/lol/aatrox/", wait_timeout=0)
         assert any(r.levelno >= logging.WARNING for r in caplog.records)
+
+
+# ---------------------------------------------------------------------------
+# Class — Rate-limit pages (HTTP 429 / Cloudflare 1015)
+# ---------------------------------------------------------------------------
+
+
+class TestDetectRateLimit:
+    """Verify detect_rate_limit() raises only on confirmed rate-limit pages."""
+
+    def test_normal_page_no_exception_and_no_body_read(self):
+        driver = make_mock_driver(title="LoLAlytics - Aatrox Build")
+        detect_rate_limit(driver)
+        driver.execute_script.assert_not_called()
+
+    def test_cloudflare_1015_page_raises_without_retry_after(self):
+        driver = make_mock_driver(
+            title="Access denied | lolalytics.com used Cloudflare to restrict access"
+        )
+        driver.execute_script.return_value = "Error 1015\nYou are being rate limited"
+
+        with pytest.raises(RateLimitedException) as exc_info:
+            detect_rate_limit(driver, url="https://lolalytics.com/lol/aatrox/build/")
+
+        assert exc_info.value.retry_after is None
+
+    def test_retry_after_hint_is_parsed_from_page_text(self):
+        driver = make_mock_driver(title="429 Too Many Requests")
+        driver.execute_script.return_value = "Too Many Requests. Retry-After: 45"
+
+        with pytest.raises(RateLimitedException) as exc_info:
+            detect_rate_limit(driver)
+
+        assert exc_info.value.retry_after == 45.0
+
+    def test_access_denied_without_rate_limit_marker_does_not_raise(self):
+        driver = make_mock_driver(title="Access denied")
+        driver.execute_script.return_value = "You do not have permission to view this page"
+        detect_rate_limit(driver)
+
+    def test_title_error_returns_silently(self):
+        driver = make_mock_driver(title_raises=Exception("session lost"))
+        detect_rate_limit(driver)
@@ -0,0 +1,35 @@
+"""Tests for the SQLite journal settings applied by Database.connect()."""
+
+import sqlite3
+
+from src.db import Database
+
+
+def _pragma(db, name):
+    return db.connection.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def test_connect_enables_wal(tmp_path):
+    db = Database(str(tmp_path / "wal.db"))
+    db.connect()
+
+    assert _pragma(db, "journal_mode") == "wal"
+    assert _pragma(db, "synchronous") == 1  # NORMAL
+    assert _pragma(db, "foreign_keys") == 1
+    db.close()
+
+
+def test_reader_not_blocked_by_open_write_transaction(tmp_path):
+    path = str(tmp_path / "wal.db")
+    writer = Database(path)
+    writer.connect()
+    writer.connection.execute("CREATE TABLE t (x INTEGER)")
+    writer.connection.execute("INSERT INTO t VALUES (1)")
+    writer.connection.commit()
+
+    writer.connection.execute("INSERT INTO t VALUES (2)")  # Uncommitted write
+    reader = sqlite3.connect(path, timeout=0)
+
+    assert reader.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+    reader.close()
+    writer.close()
@@ -87,6 +87,21 @@ class TestLaneColumn:
         cursor.execute("SELECT lane FROM synergies")
         assert cursor.fetchone()[0] == "support"
 
+    def test_synergies_batch_resolves_ids_from_champion_cache(self, full_db):
+        cache = full_db.build_champion_cache()
+        full_db.add_synergies_batch(
+            [
+                ("aatrox", "GAREN", 52.0, 1.0, 1.5, 4.0, 800),
+                ("Aatrox", "Unknown", 50.0, 0, 0, 1, 10),
+            ],
+            lane="top",
+            champion_cache=cache,
+        )
+
+        cursor = full_db.connection.cursor()
+        cursor.execute("SELECT champion, ally, lane FROM synergies")
+        assert cursor.fetchall() == [(1, 3, "top")]
+
     def test_lane_indexes_created(self, full_db):
         cursor = full_db.connection.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
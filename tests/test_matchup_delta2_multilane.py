@@ -265,3 +265,13 @@ def test_database_error_returns_none_gracefully(db_with_multilane_matchups):
     result = db_with_multilane_matchups.get_matchup_delta2("Ahri", "Zed")
 
     assert result is None  # Should not crash, return None instead
+
+
+def test_aggregated_bulk_matches_per_pair_lookup(db_with_multilane_matchups):
+    """Test that the aggregated bulk load gives the same answer as get_matchup_delta2()."""
+    bulk = db_with_multilane_matchups.get_all_matchup_delta2_aggregated()
+
+    assert set(bulk) == {("ahri", "zed"), ("ahri", "yasuo"), ("zed", "ahri")}
+    for champion, enemy in [("Ahri", "Zed"), ("Ahri", "Yasuo"), ("Zed", "Ahri")]:
+        expected = db_with_multilane_matchups.get_matchup_delta2(champion, enemy)
+        assert bulk[(champion.lower(), enemy.lower())] == pytest.approx(expected)
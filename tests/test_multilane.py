@@ -42,6 +42,10 @@ class TestScrapeAllMultilane:
         parser.patch_version = "14"
         parser.parse_champions_by_role.return_value = {"success": 1, "failed": 0, "total": 1}
         parser.parse_synergies_by_role.return_value = {"success": 1, "failed": 0, "total": 1}
+        parser.parse_matchups_and_synergies_by_role.return_value = (
+            {"success": 1, "failed": 0, "total": 1},
+            {"success": 1, "failed": 0, "total": 1},
+        )
         return parser
 
     def test_tables_initialized_once_then_per_lane_scrapes(self):
@@ -57,11 +61,12 @@ class TestScrapeAllMultilane:
         db.init_matchups_table.assert_called_once()
         db.init_synergies_table.assert_called_once()
 
-        # One scrape pass per non-empty lane, never re-initializing tables
-        matchup_calls = parser.parse_champions_by_role.call_args_list
-        assert call(db, ["Aatrox"], "top", str.lower, init_tables=False) in matchup_calls
-        assert call(db, ["Caitlyn"], "bottom", str.lower, init_tables=False) in matchup_calls
-        assert all(c.kwargs["init_tables"] is False for c in matchup_calls)
+        # One matchups+synergies pass per non-empty lane (each page loaded once)
+        lane_calls = parser.parse_matchups_and_synergies_by_role.call_args_list
+        assert call(db, ["Aatrox"], "top", str.lower) in lane_calls
+        assert call(db, ["Caitlyn"], "bottom", str.lower) in lane_calls
+        parser.parse_champions_by_role.assert_not_called()
+        parser.parse_synergies_by_role.assert_not_called()
 
         assert stats["success"] == 4  # 2 lanes x (matchups + synergies)
         assert stats["failed"] == 0
@@ -74,8 +79,8 @@ class TestScrapeAllMultilane:
         with patch("src.multilane.discover_lanes_for_champions", return_value={"Broken": []}):
             stats = scrape_all_multilane(db, parser, str.lower)
 
-        parser.parse_champions_by_role.assert_called_once_with(
-            db, ["Broken"], None, str.lower, init_tables=False
+        parser.parse_matchups_and_synergies_by_role.assert_called_once_with(
+            db, ["Broken"], None, str.lower
         )
         assert stats["discovery_failures"] == ["Broken"]
 
@@ -88,6 +93,7 @@ class TestScrapeAllMultilane:
 
         db.init_synergies_table.assert_not_called()
         parser.parse_synergies_by_role.assert_not_called()
+        parser.parse_matchups_and_synergies_by_role.assert_not_called()
         assert stats["synergies"] == {}
         assert stats["pages_total"] == 1
 
@@ -0,0 +1,556 @@
+"""Tests for src/parallel_parser.py worker plumbing.
+
+All tests mock Parser so no Firefox/geckodriver process is ever started.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from selenium.common.exceptions import WebDriverException
+
+from src.cloudflare_detector import RateLimitedException
+from src.config_constants import ScrapingConfig, scraping_config
+from src.parallel_parser import (
+    ParallelParser,
+    TokenBucket,
+    _completed_batches,
+    _wait_before_retry,
+    normalize_champion_names,
+    resolve_max_workers,
+)
+
+
+class TestGetParserThreadLocalReuse:
+    def test_same_thread_reuses_parser(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()) as parser_cls:
+            pp = ParallelParser(max_workers=2)
+
+            first = pp._get_parser()
+            second = pp._get_parser()
+
+        assert first is second
+        assert parser_cls.call_count == 1
+        assert pp.parsers == [first]
+
+    def test_one_parser_per_worker_thread(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()) as parser_cls:
+            pp = ParallelParser(max_workers=3)
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                parsers = list(executor.map(lambda _: pp._get_parser(), range(30)))
+
+        assert parser_cls.call_count <= 3
+        assert len(pp.parsers) == parser_cls.call_count
+        assert set(map(id, parsers)) == set(map(id, pp.parsers))
+
+    def test_instances_do_not_share_thread_local_parsers(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp_a = ParallelParser(max_workers=1)
+            pp_b = ParallelParser(max_workers=1)
+
+            assert pp_a._get_parser() is not pp_b._get_parser()
+
+    def test_cleanup_forgets_closed_parser_for_current_thread(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp = ParallelParser(max_workers=1)
+            old_parser = pp._get_parser()
+
+            pp._cleanup_existing_resources()
+            new_parser = pp._get_parser()
+
+        old_parser.close.assert_called_once()
+        assert new_parser is not old_parser
+        assert pp.parsers == [new_parser]
+
+
+class TestParsePool:
+    def test_no_parse_pool_by_default(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp = ParallelParser(max_workers=1)
+
+            assert pp._get_parser().parse_pool is None
+
+    def test_parsers_share_configured_parse_pool_until_close(self):
+        with (
+            patch.object(scraping_config, "PARSE_PROCESSES", 2),
+            patch("src.parallel_parser.ProcessPoolExecutor") as pool_cls,
+            patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()),
+        ):
+            pp = ParallelParser(max_workers=1)
+            parser = pp._get_parser()
+            pp.close()
+
+        pool_cls.assert_called_once_with(max_workers=2)
+        assert parser.parse_pool is pool_cls.return_value
+        pool_cls.return_value.shutdown.assert_called_once_with(wait=True)
+        assert pp._parse_pool is None
+
+
+class TestWaitBeforeRetry:
+    @staticmethod
+    def _retry_state(exc, attempt=1):
+        state = Mock()
+        state.attempt_number = attempt
+        state.outcome.exception.return_value = exc
+        return state
+
+    def test_honours_retry_after_hint(self):
+        wait = _wait_before_retry(self._retry_state(RateLimitedException("429", retry_after=40)))
+
+        assert 40 <= wait <= 40 + scraping_config.RETRY_JITTER
+
+    def test_bare_rate_limit_waits_at_least_minimum(self):
+        wait = _wait_before_retry(self._retry_state(RateLimitedException("1015")))
+
+        assert wait >= scraping_config.RATE_LIMIT_MIN_WAIT
+
+    def test_other_errors_use_jittered_exponential_backoff(self):
+        waits = [
+            _wait_before_retry(self._retry_state(WebDriverException("crash"), attempt=n))
+            for n in (1, 2, 3)
+        ]
+
+        assert 2 <= waits[0] <= 2 + scraping_config.RETRY_JITTER
+        assert 4 <= waits[1] <= 4 + scraping_config.RETRY_JITTER
+        assert 8 <= waits[2] <= 8 + scraping_config.RETRY_JITTER
+
+    def test_rate_limited_scrape_is_retried(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp = ParallelParser(max_workers=1)
+            inner = Mock()
+            inner.get_champion_data_on_patch.side_effect = [
+                RateLimitedException("429", retry_after=0.01),
+                [("ahri", 50.0, 1.0, 1.0, 2.0, 100)],
+            ]
+
+            with patch.object(pp, "_get_parser", return_value=inner):
+                champion, matchups = pp._scrape_champion_with_retry("Aatrox", "aatrox")
+
+        assert champion == "Aatrox"
+        assert matchups == [("ahri", 50.0, 1.0, 1.0, 2.0, 100)]
+        assert inner.get_champion_data_on_patch.call_count == 2
+
+
+class TestBufferedWrites:
+    MATCHUP = ("Darius", 51.0, 1.0, 2.0, 5.0, 1000)
+
+    def _parser(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp = ParallelParser(max_workers=1)
+        pp._champion_cache = {}
+        return pp
+
+    def test_rows_are_buffered_until_batch_size(self):
+        pp = self._parser()
+        db = Mock()
+
+        with patch.object(scraping_config, "DB_WRITE_BATCH_SIZE", 3):
+            pp._write_matchups_thread_safe(db, "Aatrox", [self.MATCHUP], lane="top")
+            db.add_matchups_batch.assert_not_called()
+
+            pp._write_matchups_thread_safe(db, "Garen", [self.MATCHUP, self.MATCHUP], lane="top")
+
+        db.add_matchups_batch.assert_called_once()
+        rows = db.add_matchups_batch.call_args.args[0]
+        assert [row[0] for row in rows] == ["Aatrox", "Garen", "Garen"]
+        assert db.add_matchups_batch.call_args.kwargs["lane"] == "top"
+
+    def test_flush_writes_remainder_per_lane(self):
+        pp = self._parser()
+        db = Mock()
+
+        pp._write_matchups_thread_safe(db, "Aatrox", [self.MATCHUP], lane="top")
+        pp._write_matchups_thread_safe(db, "Aatrox", [self.MATCHUP], lane="middle")
+        pp._write_synergies_thread_safe(db, "Aatrox", [self.MATCHUP])
+        pp._flush_pending_writes(db)
+        pp._flush_pending_writes(db)
+
+        lanes = sorted(call.kwargs["lane"] for call in db.add_matchups_batch.call_args_list)
+        assert lanes == ["middle", "top"]
+        db.add_synergies_batch.assert_called_once()
+        assert db.add_synergies_batch.call_args.kwargs["champion_cache"] == {}
+
+    def test_parse_run_flushes_buffer_at_the_end(self):
+        pp = self._parser()
+        db = Mock()
+        pp._get_parser = Mock(
+            return_value=Mock(**{"get_champion_data_on_patch.return_value": [self.MATCHUP]})
+        )
+
+        stats = pp.parse_champions_by_role(
+            db, ["Aatrox", "Garen"], "top", lambda x: x, init_tables=False
+        )
+        pp.close()
+
+        assert stats["success"] == 2
+        rows = [row for call in db.add_matchups_batch.call_args_list for row in call.args[0]]
+        assert sorted(row[0] for row in rows) == ["Aatrox", "Garen"]
+
+
+class TestResolveMaxWorkers:
+    GB = 1_000_000_000
+
+    def _host(self, cpus=16, available=64 * GB):
+        memory = Mock(available=available)
+        return (
+            patch("src.parallel_parser.os.cpu_count", return_value=cpus),
+            patch("src.parallel_parser.psutil.virtual_memory", return_value=memory),
+        )
+
+    def test_explicit_request_within_capacity_is_kept(self):
+        cpu, mem = self._host()
+        with cpu, mem:
+            assert resolve_max_workers(6) == 6
+
+    def test_default_comes_from_env_then_config(self, monkeypatch):
+        cpu, mem = self._host()
+        with cpu, mem:
+            monkeypatch.delenv("LEAGUESTATS_WORKERS", raising=False)
+            assert resolve_max_workers() == scraping_config.DEFAULT_MAX_WORKERS
+
+            monkeypatch.setenv("LEAGUESTATS_WORKERS", "7")
+            assert resolve_max_workers() == 7
+
+    def test_default_capped_by_cpu_count(self, monkeypatch):
+        monkeypatch.setenv("LEAGUESTATS_WORKERS", "10")
+        cpu, mem = self._host(cpus=4)
+        with cpu, mem:
+            assert resolve_max_workers() == 4
+
+    def test_default_capped_by_available_memory_with_warning(self, monkeypatch, caplog):
+        monkeypatch.setenv("LEAGUESTATS_WORKERS", "10")
+        cpu, mem = self._host(available=int(4.6 * self.GB))
+        with cpu, mem:
+            assert resolve_max_workers() == 3
+
+        assert "Using 3 workers instead of 10" in caplog.text
+
+    def test_explicit_request_above_capacity_is_kept_with_warning(self, caplog):
+        cpu, mem = self._host(cpus=4)
+        with cpu, mem:
+            assert resolve_max_workers(10) == 10
+
+        assert "Requested 10 workers" in caplog.text
+
+    def test_invalid_env_value_falls_back_to_default(self, monkeypatch, caplog):
+        monkeypatch.setenv("LEAGUESTATS_WORKERS", "eight")
+        cpu, mem = self._host()
+        with cpu, mem:
+            assert resolve_max_workers() == scraping_config.DEFAULT_MAX_WORKERS
+
+        assert "Invalid LEAGUESTATS_WORKERS='eight'" in caplog.text
+
+    def test_never_below_one_worker(self, monkeypatch):
+        monkeypatch.delenv("LEAGUESTATS_WORKERS", raising=False)
+        cpu, mem = self._host(available=0)
+        with cpu, mem:
+            assert resolve_max_workers() == 1
+        with cpu, mem:
+            assert resolve_max_workers(0) == 1
+
+
+class TestNormalizeChampionNames:
+    def test_normalizes_each_champion_once(self):
+        normalize = Mock(side_effect=lambda name: name.lower().replace("'", ""))
+
+        assert normalize_champion_names(["Kai'Sa", "Ahri"], normalize) == {
+            "Kai'Sa": "kaisa",
+            "Ahri": "ahri",
+        }
+        assert normalize.call_count == 2
+
+    def test_slug_collisions_are_logged(self, caplog):
+        normalize_champion_names(["Nunu", "Nunu & Willump"], lambda name: "nunu")
+
+        assert "both normalize to 'nunu'" in caplog.text
+
+    def test_parse_run_normalizes_before_scraping(self):
+        pp = TestBufferedWrites()._parser()
+        inner = Mock(**{"get_champion_data_on_patch.return_value": []})
+        pp._get_parser = Mock(return_value=inner)
+        normalize = Mock(side_effect=str.lower)
+
+        pp.parse_champions_by_role(Mock(), ["Aatrox"], "top", normalize, init_tables=False)
+        pp.close()
+
+        normalize.assert_called_once_with("Aatrox")
+        inner.get_champion_data_on_patch.assert_called_once_with(pp.patch_version, "aatrox", "top")
+
+
+class TestSharedBrowser:
+    def test_workers_share_first_parser_browser(self):
+        with (
+            patch.object(scraping_config, "SHARED_BROWSER", True),
+            patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock(kw=kw)),
+        ):
+            pp = ParallelParser(max_workers=2)
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(lambda _: pp._get_parser(), range(20)))
+
+        owner, *tabs = pp.parsers
+        assert owner.kw["share_driver_of"] is None
+        assert all(tab.kw["share_driver_of"] is owner for tab in tabs)
+
+
+class TestHeadlessDefault:
+    def test_headless_defaults_to_config(self):
+        with patch.object(scraping_config, "HEADLESS", True):
+            assert ParallelParser(max_workers=1).headless is True
+
+    def test_explicit_gui_mode_overrides_config(self):
+        with patch.object(scraping_config, "HEADLESS", True):
+            assert ParallelParser(max_workers=1, headless=False).headless is False
+
+
+class TestTokenBucket:
+    @pytest.fixture
+    def clock(self):
+        """Fake monotonic clock that sleep() advances instantly."""
+        now = [0.0]
+
+        def fake_sleep(seconds):
+            now[0] += seconds
+
+        with (
+            patch("src.parallel_parser.monotonic", side_effect=lambda: now[0]),
+            patch("src.parallel_parser.sleep", side_effect=fake_sleep),
+        ):
+            yield now
+
+    def test_burst_is_served_without_waiting(self, clock):
+        bucket = TokenBucket(rate=4.0, capacity=8)
+
+        for _ in range(8):
+            bucket.acquire()
+
+        assert clock[0] == 0.0
+
+    def test_steady_rate_after_burst(self, clock):
+        bucket = TokenBucket(rate=4.0, capacity=2)
+
+        for _ in range(6):
+            bucket.acquire()
+
+        assert clock[0] == pytest.approx(1.0)
+
+    def test_zero_rate_disables_pacing(self, clock):
+        bucket = TokenBucket(rate=0, capacity=0)
+
+        for _ in range(100):
+            bucket.acquire()
+
+        assert clock[0] == 0.0
+
+    def test_each_scrape_takes_a_token(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp = ParallelParser(max_workers=1)
+        pp.rate_limiter = Mock()
+        pp._get_parser = Mock(return_value=Mock())
+
+        pp._scrape_champion_with_retry("Aatrox", "aatrox")
+        pp._scrape_champion_synergies_with_retry("Aatrox", "aatrox")
+
+        assert pp.rate_limiter.acquire.call_count == 2
+
+
+class TestCloseParsers:
+    def test_parsers_are_closed_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        parsers = [Mock(**{"close.side_effect": barrier.wait}) for _ in range(3)]
+        with patch("src.parallel_parser.Parser", side_effect=parsers):
+            pp = ParallelParser(max_workers=3)
+        pp.parsers = list(parsers)
+
+        # Each close() blocks until all three run at once: sequential closing would deadlock
+        pp.close()
+
+        assert all(parser.close.call_count == 1 for parser in parsers)
+        assert pp.parsers == []
+
+    def test_hung_driver_does_not_block_shutdown(self, caplog):
+        release = threading.Event()
+        hung = Mock(**{"close.side_effect": lambda: release.wait(5)})
+        with patch("src.parallel_parser.Parser"):
+            pp = ParallelParser(max_workers=1)
+        pp.parsers = [hung, Mock()]
+
+        with patch.object(scraping_config, "PARSER_CLOSE_TIMEOUT", 0.05):
+            pp.close()
+        release.set()
+
+        assert pp.parsers == []
+        assert "still closing" in caplog.text
+
+    def test_close_quits_pooled_browsers(self):
+        with patch("src.parallel_parser.Parser") as parser_cls:
+            pp = ParallelParser(max_workers=1)
+            pp.close()
+
+        parser_cls.close_pool.assert_called_once()
+
+
+class TestScrapeCacheIntegration:
+    MATCHUP = ("Darius", 51.0, 1.0, 2.0, 5.0, 1000)
+
+    @pytest.fixture(autouse=True)
+    def enabled_scrape_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(scraping_config, "SCRAPE_CACHE_TTL", 3600)
+        monkeypatch.setattr(scraping_config, "SCRAPE_CACHE_DIR", str(tmp_path / "scrape_cache"))
+
+    def test_second_run_reuses_cached_pages(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            first = ParallelParser(max_workers=1)
+            second = ParallelParser(max_workers=1)
+        inner = Mock(**{"get_champion_data_on_patch.return_value": [self.MATCHUP]})
+        first._get_parser = Mock(return_value=inner)
+        second._get_parser = Mock(return_value=inner)
+
+        assert first._scrape_champion_with_retry("Aatrox", "aatrox") == ("Aatrox", [self.MATCHUP])
+        assert second._scrape_champion_with_retry("Aatrox", "aatrox") == ("Aatrox", [self.MATCHUP])
+
+        inner.get_champion_data_on_patch.assert_called_once()
+        second._get_parser.assert_not_called()
+
+    def test_empty_results_are_not_cached(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp = ParallelParser(max_workers=1)
+        inner = Mock(**{"get_champion_synergies_on_patch.return_value": []})
+        pp._get_parser = Mock(return_value=inner)
+
+        pp._scrape_page("synergies", "aatrox", "top")
+        pp._scrape_page("synergies", "aatrox", "top")
+
+        assert inner.get_champion_synergies_on_patch.call_count == 2
+
+    def test_cached_pages_are_logged(self, caplog):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp = ParallelParser(max_workers=1)
+        pp._get_parser = Mock(
+            return_value=Mock(**{"get_champion_data_on_patch.return_value": [self.MATCHUP]})
+        )
+
+        with caplog.at_level(logging.INFO, logger="src.parallel_parser"):
+            pp._scrape_page("matchups", "aatrox", "top")
+            pp._scrape_page("matchups", "aatrox", "top")
+
+        assert "Using cached matchups for aatrox (top)" in caplog.text
+
+    def test_disabled_by_default(self):
+        assert ScrapingConfig().SCRAPE_CACHE_TTL == 0
+
+    def test_disabled_with_zero_ttl(self):
+        with (
+            patch.object(scraping_config, "SCRAPE_CACHE_TTL", 0),
+            patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()),
+        ):
+            pp = ParallelParser(max_workers=1)
+
+        assert pp.scrape_cache is None
+
+
+class TestExecutorReuse:
+    def test_lane_passes_reuse_pool_and_browsers(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()) as parser_cls:
+            pp = ParallelParser(max_workers=1)
+            pp.scrape_cache = None
+            db = Mock()
+
+            for lane in ("top", "jungle", "middle"):
+                pp.parse_champions_by_role(db, ["Aatrox"], lane, str.lower, init_tables=False)
+                executor = pp.executor
+            pp.parse_synergies_by_role(db, ["Aatrox"], "top", str.lower, init_tables=False)
+
+            assert pp.executor is executor
+            assert parser_cls.call_count == 1
+            pp.close()
+
+        assert pp.executor is None
+
+    def test_standalone_role_run_starts_fresh(self):
+        with patch("src.parallel_parser.Parser", side_effect=lambda **kw: Mock()):
+            pp = ParallelParser(max_workers=1)
+        old_executor = pp._ensure_executor()
+
+        with patch.object(pp, "_cleanup_existing_resources", wraps=pp._cleanup_existing_resources):
+            pp.parse_synergies_by_role(Mock(), [], "top", str.lower, init_tables=True)
+            pp._cleanup_existing_resources.assert_called_once()
+
+        assert pp.executor is not old_executor
+        pp.close()
+
+
+class TestMatchupsAndSynergiesPass:
+    def test_one_parser_scrapes_both_tabs_of_each_champion(self):
+        browser = Mock()
+        browser.get_champion_data_on_patch.return_value = [("ahri", 51.0, 1.0, 1.0, 5.0, 900)]
+        browser.get_champion_synergies_on_patch.return_value = [("lux", 53.0, 2.0, 2.0, 4.0, 700)]
+        pp = ParallelParser(max_workers=1)
+        pp.scrape_cache = None
+        db = Mock()
+
+        with (
+            patch("src.parallel_parser.Parser", return_value=browser),
+            patch.object(pp, "_write_matchups_thread_safe") as write_matchups,
+            patch.object(pp, "_write_synergies_thread_safe") as write_synergies,
+        ):
+            matchup_stats, synergy_stats = pp.parse_matchups_and_synergies_by_role(
+                db, ["Aatrox"], "top", str.lower
+            )
+
+        browser.get_champion_data_on_patch.assert_called_once_with(
+            pp.patch_version, "aatrox", "top"
+        )
+        browser.get_champion_synergies_on_patch.assert_called_once_with(
+            pp.patch_version, "aatrox", "top"
+        )
+        write_matchups.assert_called_once_with(
+            db, "Aatrox", browser.get_champion_data_on_patch.return_value, lane="top"
+        )
+        write_synergies.assert_called_once_with(
+            db, "Aatrox", browser.get_champion_synergies_on_patch.return_value, lane="top"
+        )
+        assert matchup_stats["success"] == synergy_stats["success"] == 1
+        db.init_matchups_table.assert_not_called()
+        pp.close()
+
+    def test_failed_synergies_are_retried_and_counted_separately(self):
+        browser = Mock()
+        browser.get_champion_data_on_patch.return_value = [("ahri", 51.0, 1.0, 1.0, 5.0, 900)]
+        browser.get_champion_synergies_on_patch.side_effect = RateLimitedException(
+            "429", retry_after=0.01
+        )
+        pp = ParallelParser(max_workers=1)
+        pp.scrape_cache = None
+
+        with (
+            patch("src.parallel_parser.Parser", return_value=browser),
+            patch.object(scraping_config, "RETRY_JITTER", 0.0),
+            patch.object(pp, "_write_matchups_thread_safe"),
+            patch.object(pp, "_write_synergies_thread_safe") as write_synergies,
+        ):
+            matchup_stats, synergy_stats = pp.parse_matchups_and_synergies_by_role(
+                Mock(), ["Aatrox"], "top", str.lower
+            )
+
+        assert browser.get_champion_synergies_on_patch.call_count == 3
+        write_synergies.assert_not_called()
+        assert (matchup_stats["success"], matchup_stats["failed"]) == (1, 0)
+        assert (synergy_stats["success"], synergy_stats["failed"]) == (0, 1)
+        pp.close()
+
+
+class TestCompletedBatches:
+    def test_yields_every_future_once(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {executor.submit(lambda n=n: n): n for n in range(20)}
+
+            batches = list(_completed_batches(futures))
+
+        finished = [future for batch in batches for future in batch]
+        assert sorted(futures[f] for f in finished) == list(range(20))
+        assert all(batches)
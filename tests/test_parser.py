@@ -0,0 +1,560 @@
+"""Tests for src/parser.py webdriver setup and scraping helpers.
+
+The Firefox webdriver is always mocked: no browser process is started.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import lxml.html
+import pytest
+import requests
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from src.config_constants import scraping_config
+from src.parser import (
+    Parser,
+    champion_url,
+    fetch_matchup_data,
+    matchup_name_from_href,
+    parse_carousel_html,
+    parse_carousel_row,
+    synergy_name_from_href,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_matchup_http():
+    """Single-matchup lookups fall back to the (mocked) browser, never the network."""
+    with patch("src.parser.fetch_matchup_data", return_value=None) as fetch:
+        yield fetch
+
+
+@pytest.fixture
+def mock_firefox():
+    with patch("src.parser.webdriver.Firefox") as firefox_cls, patch("src.parser.sleep"):
+        firefox_cls.return_value = MagicMock()
+        yield firefox_cls
+
+
+class TestParserDriverSetup:
+    def test_driver_uses_keep_alive_connection(self, mock_firefox):
+        Parser(headless=True)
+
+        assert mock_firefox.call_args.kwargs["keep_alive"] is True
+
+    def test_driver_uses_configured_page_load_strategy(self, mock_firefox):
+        Parser(headless=True)
+
+        options = mock_firefox.call_args.kwargs["options"]
+        assert options.page_load_strategy == scraping_config.PAGE_LOAD_STRATEGY
+
+    def test_images_blocked_by_default(self, mock_firefox):
+        Parser(headless=True)
+
+        options = mock_firefox.call_args.kwargs["options"]
+        assert options.preferences["permissions.default.image"] == 2
+
+    def test_images_allowed_when_disabled_in_config(self, mock_firefox):
+        with patch.object(scraping_config, "BLOCK_IMAGES", False):
+            Parser(headless=True)
+
+        options = mock_firefox.call_args.kwargs["options"]
+        assert "permissions.default.image" not in options.preferences
+
+    def test_trackers_blocked_by_default(self, mock_firefox):
+        Parser(headless=True)
+
+        options = mock_firefox.call_args.kwargs["options"]
+        assert options.preferences["privacy.trackingprotection.enabled"] is True
+
+    def test_trackers_allowed_when_disabled_in_config(self, mock_firefox):
+        with patch.object(scraping_config, "BLOCK_TRACKERS", False):
+            Parser(headless=True)
+
+        options = mock_firefox.call_args.kwargs["options"]
+        assert "privacy.trackingprotection.enabled" not in options.preferences
+
+    def test_headless_startup_does_not_sleep(self, mock_firefox):
+        with patch("src.parser.sleep") as sleep:
+            Parser(headless=True)
+
+        sleep.assert_not_called()
+
+    def test_gui_startup_waits_for_window_manager(self, mock_firefox):
+        with patch("src.parser.sleep") as sleep:
+            Parser(headless=False)
+
+        sleep.assert_called_once_with(scraping_config.FIREFOX_STARTUP_DELAY)
+
+    def test_video_and_webgl_disabled(self, mock_firefox):
+        Parser(headless=True)
+
+        options = mock_firefox.call_args.kwargs["options"]
+        assert options.preferences["media.autoplay.default"] == 5
+        assert options.preferences["webgl.disabled"] is True
+
+
+def _carousel_item(href, winrate, delta1, delta2, pickrate, games, my1_count=7):
+    my1 = ["0"] * my1_count
+    if my1_count >= 7:
+        my1[4], my1[5], my1[6] = delta1, delta2, pickrate
+    my1_html = "".join(f'<div class="my-1 text-center">{v}</div>' for v in my1)
+    return (
+        f'<div><div><span>{winrate}%</span></div><a href="{href}"><img></a>'
+        f'{my1_html}<div class="text-[9px] mt-1">\n {games} </div></div>'
+    )
+
+
+def _champion_page(rows):
+    """Minimal page matching xpath_config.MATCHUP_ROW_BASE for tier rows 2..N."""
+    tier_rows = "<div></div>" + "".join(
+        f"<div><div></div><div><div>{''.join(items)}</div></div></div>" for items in rows
+    )
+    return (
+        "<html><body><main>" + "<div></div>" * 5 + f"<div><div>{tier_rows}</div></div>"
+        "</main></body></html>"
+    )
+
+
+class TestParseCarouselRow:
+    def test_extracts_matchup_tuples(self):
+        page = _champion_page(
+            [
+                [
+                    _carousel_item(
+                        "/lol/aatrox/vs/ahri/build/", "52.3", "1.5", "-2.1", "3.2", "1,234"
+                    ),
+                    _carousel_item("/lol/aatrox/vs/zed/build/", "47.0", "-0.5", "2", "0.4", "98"),
+                ]
+            ]
+        )
+
+        tree = lxml.html.fromstring(page)
+
+        assert parse_carousel_row(tree, 2, matchup_name_from_href) == [
+            ("ahri", 52.3, 1.5, -2.1, 3.2, 1234),
+            ("zed", 47.0, -0.5, 2.0, 0.4, 98),
+        ]
+
+    def test_synergy_names_come_from_build_link(self):
+        page = _champion_page(
+            [[_carousel_item("/lol/malphite/build/", "55", "1", "2", "15", "1200")]]
+        )
+
+        tree = lxml.html.fromstring(page)
+
+        assert parse_carousel_row(tree, 2, synergy_name_from_href, "synergy") == [
+            ("malphite", 55.0, 1.0, 2.0, 15.0, 1200)
+        ]
+
+    def test_skips_incomplete_and_malformed_items(self):
+        page = _champion_page(
+            [
+                [
+                    _carousel_item("/lol/a/vs/b/build/", "50", "1", "1", "1", "10", my1_count=3),
+                    _carousel_item("/lol/a/vs/c/build/", "n/a", "1", "1", "1", "10"),
+                    _carousel_item("/lol/a/vs/d/build/", "51", "1", "1", "1", "10"),
+                ]
+            ]
+        )
+
+        tree = lxml.html.fromstring(page)
+
+        assert parse_carousel_row(tree, 2, matchup_name_from_href) == [
+            ("d", 51.0, 1.0, 1.0, 1.0, 10)
+        ]
+
+    def test_missing_row_returns_empty(self):
+        tree = lxml.html.fromstring(_champion_page([]))
+
+        assert parse_carousel_row(tree, 4, matchup_name_from_href) == []
+
+    def test_html_parsing_is_picklable_for_process_pools(self):
+        page = _champion_page([[_carousel_item("/lol/a/vs/b/build/", "50", "1", "2", "3", "4")]])
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(parse_carousel_html, page, 2, matchup_name_from_href).result()
+
+        assert result == [("b", 50.0, 1.0, 2.0, 3.0, 4)]
+
+
+class TestScrapeCarouselRows:
+    def test_reads_page_source_once_per_frame_and_dedups(self, mock_firefox):
+        parser = Parser(headless=True)
+        item = _carousel_item("/lol/a/vs/b/build/", "50", "1", "1", "0.1", "10")
+        parser.webdriver.page_source = _champion_page([[item, item]])
+
+        result = parser._scrape_carousel_rows("a", range(2, 3), matchup_name_from_href, "matchup")
+
+        assert result == [("b", 50.0, 1.0, 1.0, 0.1, 10)]
+        # Only the row lookup goes through find_element; no per-entry commands
+        parser.webdriver.find_element.assert_called_once()
+
+    def test_script_extraction_uses_one_execute_script_per_frame(self, mock_firefox):
+        parser = Parser(headless=True)
+        raw = ["/lol/a/vs/b/build/", "50%", ["0", "0", "0", "0", "1", "1", "0.1"], " 1,010 "]
+        parser.webdriver.execute_script.side_effect = lambda script, *args: (
+            [raw, raw, [None, None, [], None]] if "Array.from" in script else [3, 0]
+        )
+
+        with patch.object(scraping_config, "CAROUSEL_EXTRACTION", "script"):
+            result = parser._scrape_carousel_rows(
+                "a", range(2, 3), matchup_name_from_href, "matchup"
+            )
+
+        assert result == [("b", 50.0, 1.0, 1.0, 0.1, 1010)]
+
+
+class TestExplicitWaits:
+    def test_row_settles_once_two_reads_agree(self, mock_firefox):
+        parser = Parser(headless=True)
+        parser.webdriver.execute_script.side_effect = [[2, 0], [4, 460], [4, 460]]
+
+        with patch.object(scraping_config, "CAROUSEL_SETTLE_POLL", 0.001):
+            parser._wait_for_row_to_settle(MagicMock())
+
+        assert parser.webdriver.execute_script.call_count == 3
+
+    def test_unsettled_row_times_out_quietly(self, mock_firefox):
+        parser = Parser(headless=True)
+        offsets = iter(range(10_000))
+        parser.webdriver.execute_script.side_effect = lambda *args: [4, next(offsets)]
+
+        with (
+            patch.object(scraping_config, "CAROUSEL_SETTLE_TIMEOUT", 0.02),
+            patch.object(scraping_config, "CAROUSEL_SETTLE_POLL", 0.001),
+        ):
+            parser._wait_for_row_to_settle(MagicMock())
+
+    def test_scroll_returns_once_target_is_reached(self, mock_firefox):
+        parser = Parser(headless=True)
+        target = scraping_config.MATCHUP_SCROLL_Y
+        parser.webdriver.execute_script.side_effect = [None, 0, target]
+
+        parser._scroll_to_matchup_section()
+
+        scripts = [call.args[0] for call in parser.webdriver.execute_script.call_args_list]
+        assert scripts == [f"window.scrollTo(0, {target})"] + ["return window.scrollY"] * 2
+
+    def test_scroll_timeout_is_not_fatal(self, mock_firefox):
+        parser = Parser(headless=True)
+        parser.webdriver.execute_script.return_value = 0
+
+        with patch.object(scraping_config, "SCROLL_TIMEOUT", 0.01):
+            parser._scroll_to_matchup_section()
+
+    def test_page_ready_timeout_logs_and_continues(self, mock_firefox, caplog):
+        parser = Parser(headless=True)
+        parser.webdriver.find_element.side_effect = NoSuchElementException()
+
+        with patch.object(scraping_config, "PAGE_LOAD_TIMEOUT", 0.01):
+            parser._wait_for_page_ready()
+
+        assert "Page not ready" in caplog.text
+
+
+class TestSharedBrowserTabs:
+    def test_shared_parser_opens_tab_instead_of_browser(self, mock_firefox):
+        owner = Parser(headless=True)
+        owner.webdriver.current_window_handle = "tab-2"
+
+        tab = Parser(headless=True, share_driver_of=owner)
+
+        assert mock_firefox.call_count == 1
+        assert tab.webdriver is owner.webdriver
+        assert tab.window_handle == "tab-2"
+        owner.webdriver.switch_to.new_window.assert_called_once_with("tab")
+
+    def test_scrape_switches_back_to_own_tab_only_when_needed(self, mock_firefox):
+        owner = Parser(headless=True)
+        owner.window_handle = owner.session.active_handle = "tab-1"
+        owner.webdriver.current_window_handle = "tab-2"
+        tab = Parser(headless=True, share_driver_of=owner)
+        switch = owner.webdriver.switch_to.window
+
+        owner.get_matchup_data_on_patch("14.23", "aatrox", "ahri")
+        owner.get_matchup_data_on_patch("14.23", "aatrox", "zed")
+        tab.get_matchup_data_on_patch("14.23", "garen", "ahri")
+
+        assert [call.args[0] for call in switch.call_args_list] == ["tab-1", "tab-2"]
+
+    def test_close_only_closes_shared_tab(self, mock_firefox):
+        owner = Parser(headless=True)
+        tab = Parser(headless=True, share_driver_of=owner)
+
+        tab.close()
+
+        owner.webdriver.close.assert_called_once()
+        owner.webdriver.quit.assert_not_called()
+
+
+class TestBrowserPool:
+    @pytest.fixture
+    def pool(self):
+        with patch.object(scraping_config, "BROWSER_POOL_SIZE", 2):
+            yield
+        Parser._pool.clear()
+
+    def test_closed_headless_browser_is_reused(self, mock_firefox, pool):
+        first = Parser(headless=True)
+        first.close()
+
+        second = Parser(headless=True)
+
+        assert mock_firefox.call_count == 1
+        assert second.webdriver is first.webdriver
+        first.webdriver.quit.assert_not_called()
+
+    def test_gui_browser_is_never_pooled(self, mock_firefox, pool):
+        parser = Parser(headless=False)
+        parser.close()
+
+        parser.webdriver.quit.assert_called_once()
+        assert Parser._pool == []
+
+    def test_full_pool_quits_browser(self, mock_firefox, pool):
+        mock_firefox.side_effect = lambda **kwargs: MagicMock()
+        parsers = [Parser(headless=True) for _ in range(3)]
+
+        for parser in parsers:
+            parser.close()
+
+        assert len(Parser._pool) == 2
+        parsers[2].webdriver.quit.assert_called_once()
+
+    def test_dead_pooled_browser_is_replaced(self, mock_firefox, pool):
+        dead = MagicMock(window_handles=["tab-1"])
+        dead.switch_to.window.side_effect = WebDriverException("gone")
+        Parser._pool.append(dead)
+
+        parser = Parser(headless=True)
+
+        dead.quit.assert_called_once()
+        assert parser.webdriver is mock_firefox.return_value
+
+    def test_browser_with_shared_tabs_is_never_pooled(self, mock_firefox, pool):
+        owner = Parser(headless=True)
+        tab = Parser(headless=True, share_driver_of=owner)
+
+        owner.close()
+        tab.close()
+
+        owner.webdriver.quit.assert_called_once()
+        assert Parser._pool == []
+
+    def test_close_pool_quits_idle_browsers(self, mock_firefox, pool):
+        parser = Parser(headless=True)
+        parser.close()
+
+        Parser.close_pool()
+
+        parser.webdriver.quit.assert_called_once()
+        assert Parser._pool == []
+
+
+class TestGetMatchupData:
+    @staticmethod
+    def _matchup_page(winrate, games):
+        """Minimal page matching xpath_config.WINRATE_XPATH / GAMES_XPATH."""
+        stats = f"<div><div>{winrate}</div></div>"
+        if games is not None:
+            stats += f"<div><div>{games}</div></div>"
+        block = f"<div></div><div></div><div><div><div>{stats}</div></div></div>"
+        section = f"<div><div><div></div><div>{block}</div></div></div>"
+        return "<html><body><main>" + "<div></div>" * 4 + section + "</main></body></html>"
+
+    @staticmethod
+    def _serve(parser, page):
+        """Answer the outerHTML script like the browser would for `page`."""
+
+        def execute_script(script, path):
+            found = lxml.html.fromstring(page).xpath(path)
+            return lxml.html.tostring(found[0], encoding="unicode") if found else None
+
+        parser.webdriver.execute_script.side_effect = execute_script
+
+    def test_reads_winrate_and_games_from_section_only(self, mock_firefox):
+        parser = Parser(headless=True)
+        self._serve(parser, self._matchup_page("52.5", "12,345"))
+
+        assert parser.get_matchup_data_on_patch("14.23", "aatrox", "ahri") == (52.5, 12345)
+        assert parser.webdriver.execute_script.call_args.args[1] == "/html/body/main/div[5]"
+
+    def test_missing_games_defaults_to_zero(self, mock_firefox):
+        parser = Parser(headless=True)
+        self._serve(parser, self._matchup_page("48", None))
+
+        assert parser.get_matchup_data_on_patch("14.23", "aatrox", "ahri") == (48.0, 0)
+
+    def test_missing_section_returns_none(self, mock_firefox):
+        parser = Parser(headless=True)
+        self._serve(parser, "<html><body><main></main></body></html>")
+
+        assert parser.get_matchup_data_on_patch("14.23", "aatrox", "ahri") == (None, None)
+
+
+class TestAcceptCookiesOnce:
+    def test_dismissed_banner_is_not_probed_again(self, mock_firefox):
+        parser = Parser(headless=True)
+        parser.webdriver.execute_script.return_value = "#didomi-notice-agree-button"
+
+        parser._accept_cookies()
+        parser._accept_cookies()
+
+        parser.webdriver.execute_script.assert_called_once()
+        assert parser.cookies_accepted is True
+
+    def test_missing_banner_is_probed_on_next_page(self, mock_firefox):
+        parser = Parser(headless=True)
+        parser.webdriver.execute_script.return_value = None
+
+        parser._accept_cookies()
+        parser._accept_cookies()
+
+        assert parser.webdriver.execute_script.call_count == 2
+        assert parser.cookies_accepted is False
+
+
+class TestMatchupHttpFetch:
+    PAGE = TestGetMatchupData._matchup_page("52.5", "12,345")
+
+    @staticmethod
+    def _session(text="", status=200, error=None):
+        session = MagicMock()
+        session.get.return_value = MagicMock(status_code=status, text=text)
+        if error:
+            session.get.side_effect = error
+        return session
+
+    def test_reads_stats_from_server_html(self):
+        session = self._session(self.PAGE)
+
+        assert fetch_matchup_data("14.23", "aatrox", "ahri", session) == (52.5, 12345)
+        assert session.get.call_args.args[0] == (
+            "https://lolalytics.com/lol/aatrox/vs/ahri/build/?tier=diamond_plus&patch=14.23"
+        )
+
+    def test_unusable_responses_return_none(self):
+        missing = "<html><body><main></main></body></html>"
+
+        assert fetch_matchup_data("14.23", "a", "b", self._session(missing)) is None
+        assert fetch_matchup_data("14.23", "a", "b", self._session(status=403)) is None
+        error = requests.ConnectionError("offline")
+        assert fetch_matchup_data("14.23", "a", "b", self._session(error=error)) is None
+
+    def test_http_result_skips_the_browser(self, mock_firefox, no_matchup_http):
+        parser = Parser(headless=True)
+        parser.http_first = True
+        parser.rate_limiter = MagicMock()
+        no_matchup_http.return_value = (51.0, 800)
+
+        assert parser.get_matchup_data_on_patch("14.23", "aatrox", "ahri") == (51.0, 800)
+        parser.webdriver.get.assert_not_called()
+        assert no_matchup_http.call_args.args[3:] == (
+            parser.http_session,
+            parser.rate_limiter,
+        )
+
+    def test_http_is_opt_in(self, mock_firefox, no_matchup_http):
+        parser = Parser(headless=True)
+
+        with patch.object(Parser, "_browse_matchup_data", return_value=(49.0, 300)):
+            parser.get_matchup_data_on_patch("14.23", "aatrox", "ahri")
+
+        no_matchup_http.assert_not_called()
+
+    def test_http_is_disabled_after_first_miss(self, mock_firefox, no_matchup_http):
+        parser = Parser(headless=True)
+        parser.http_first = True
+
+        with patch.object(Parser, "_browse_matchup_data", return_value=(49.0, 300)) as browse:
+            parser.get_matchup_data_on_patch("14.23", "aatrox", "ahri")
+            parser.get_matchup_data_on_patch("14.23", "aatrox", "zed")
+
+        no_matchup_http.assert_called_once()
+        assert browse.call_count == 2
+        assert parser.http_first is False
+
+    def test_rate_limiter_paces_http_fetches(self):
+        limiter = MagicMock()
+        session = self._session(self.PAGE)
+
+        fetch_matchup_data("14.23", "aatrox", "ahri", session, limiter)
+
+        limiter.acquire.assert_called_once()
+
+    def test_bulk_falls_back_to_browser_per_missing_pair(self, mock_firefox):
+        parser = Parser(headless=True)
+        parser.http_first = True
+        http_results = {("aatrox", "ahri"): (51.0, 800), ("aatrox", "zed"): None}
+
+        with (
+            patch("src.parser.fetch_matchups_bulk", return_value=dict(http_results)),
+            patch.object(Parser, "_browse_matchup_data", return_value=(49.0, 300)) as browse,
+        ):
+            results = parser.get_matchups_bulk("14.23", list(http_results))
+
+        assert results == {("aatrox", "ahri"): (51.0, 800), ("aatrox", "zed"): (49.0, 300)}
+        browse.assert_called_once_with("14.23", "aatrox", "zed")
+
+
+class TestPageReuse:
+    def test_synergies_reuse_page_loaded_for_matchups(self, mock_firefox):
+        parser = Parser(headless=True)
+        parser.webdriver.execute_script.return_value = scraping_config.MATCHUP_SCROLL_Y
+
+        with patch.object(Parser, "_scrape_carousel_rows", return_value=[]):
+            parser.get_champion_data_on_patch("14.23", "aatrox", "top")
+            parser.get_champion_synergies_on_patch("14.23", "aatrox", "top")
+            parser.get_champion_synergies_on_patch("14.23", "aatrox", "top")
+
+        urls = [call.args[0] for call in parser.webdriver.get.call_args_list]
+        assert urls == [champion_url("14.23", "aatrox", "top")] * 2
+
+    def test_rate_limited_page_is_not_reused(self, mock_firefox):
+        parser = Parser(headless=True)
+        parser.webdriver.execute_script.return_value = scraping_config.MATCHUP_SCROLL_Y
+
+        with (
+            patch.object(Parser, "_scrape_carousel_rows", return_value=[]),
+            patch("src.parser.detect_rate_limit", side_effect=[RuntimeError("429"), None]),
+        ):
+            with pytest.raises(RuntimeError):
+                parser.get_champion_data_on_patch("14.23", "aatrox", "top")
+            parser.get_champion_synergies_on_patch("14.23", "aatrox", "top")
+
+        assert parser.webdriver.get.call_count == 2
+
+    def test_matchup_page_in_between_is_not_reused(self, mock_firefox):
+        parser = Parser(headless=True)
+        parser.webdriver.execute_script.return_value = scraping_config.MATCHUP_SCROLL_Y
+
+        with patch.object(Parser, "_scrape_carousel_rows", return_value=[]):
+            parser.get_champion_data_on_patch("14.23", "aatrox", "top")
+            parser._browse_matchup_data("14.23", "aatrox", "ahri")
+            parser.get_champion_synergies_on_patch("14.23", "aatrox", "top")
+
+        urls = [call.args[0] for call in parser.webdriver.get.call_args_list]
+        assert urls[-1] == champion_url("14.23", "aatrox", "top")
+        assert len(urls) == 3
+
+    def test_matchup_stats_are_memoized(self, mock_firefox, no_matchup_http):
+        parser = Parser(headless=True)
+        parser.http_first = True
+        no_matchup_http.return_value = (51.0, 800)
+
+        parser.get_matchup_data_on_patch("14.23", "aatrox", "ahri")
+        parser.get_matchup_data_on_patch("14.23", "aatrox", "ahri")
+        results = parser.get_matchups_bulk("14.23", [("aatrox", "ahri")])
+
+        assert results == {("aatrox", "ahri"): (51.0, 800)}
+        no_matchup_http.assert_called_once()
+
+    def test_champion_url(self):
+        assert champion_url("14.23", "ahri") == (
+            "https://lolalytics.com/lol/ahri/build/?tier=diamond_plus&patch=14.23"
+        )
+        assert champion_url("14.23", "ahri", "middle") == (
+            "https://lolalytics.com/lol/ahri/build/?lane=middle&tier=diamond_plus&patch=14.23"
+        )
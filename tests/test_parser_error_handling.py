@@ -2,10 +2,10 @@
 Tests for Parser Exception Handling.
 
 Validates that _accept_cookies() handles exceptions properly:
-- Catches specific exceptions (NoSuchElementException, ElementNotInteractableException)
-- Logs unexpected exceptions with error IDs
-- Continues to next strategy when expected exceptions occur
-- Reports unexpected errors without crashing
+- Probes every DOM strategy in a single execute_script call
+- Logs probe script and unexpected errors with error IDs
+- Falls back to the coordinate click (GUI mode) when nothing matched
+- Aborts on a lost WebDriver session
 
 Author: @pj35 - LeagueStats Coach
 """
@@ -14,13 +14,12 @@ import pytest
 import logging
 from unittest.mock import MagicMock, patch
 from selenium.common.exceptions import (
-    NoSuchElementException,
-    ElementNotInteractableException,
     InvalidSessionIdException,
+    JavascriptException,
     WebDriverException,
 )
 
-from src.parser import Parser
+from src.parser import Parser, _COOKIE_BANNER_JS, _COOKIE_SELECTORS
 
 
 class TestCookieBannerExceptionHandling:
@@ -38,147 +37,75 @@ class TestCookieBannerExceptionHandling:
 
             yield parser
 
-    def test_strategy1_handles_no_such_element_gracefully(self, mock_parser, caplog):
-        """Test that NoSuchElementException in Strategy 1 doesn't crash."""
-        caplog.set_level(logging.INFO)
-
-        # Mock ID selector to raise NoSuchElementException
-        mock_parser.webdriver.find_element.side_effect = NoSuchElementException()
-
-        # Should not raise, should try other strategies
-        mock_parser._accept_cookies()
-
-        # Should not log error (expected exception)
-        assert "[ERR_COOKIE_001]" not in caplog.text
-
-    def test_strategy1_logs_element_not_interactable(self, mock_parser, caplog):
-        """Test that ElementNotInteractableException is logged with error ID."""
-        caplog.set_level(logging.WARNING)
-
-        # Mock element that exists but is not clickable
-        mock_element = MagicMock()
-        mock_element.click.side_effect = ElementNotInteractableException()
-        mock_parser.webdriver.find_element.return_value = mock_element
+    def test_all_dom_strategies_run_in_one_script(self, mock_parser):
+        """Test that ID, CSS and XPath strategies are probed in a single round-trip."""
+        mock_parser.webdriver.execute_script.return_value = None
 
         mock_parser._accept_cookies()
 
-        # Should log warning with error ID
-        assert "[ERR_COOKIE_004]" in caplog.text
-        assert "not clickable" in caplog.text
-
-    def test_strategy1_logs_unexpected_exceptions(self, mock_parser, caplog):
-        """Test that unexpected exceptions are logged with error ID."""
-        caplog.set_level(logging.ERROR)
-
-        # Mock unexpected exception
-        mock_parser.webdriver.find_element.side_effect = RuntimeError("Unexpected error")
-
-        mock_parser._accept_cookies()
+        first_call = mock_parser.webdriver.execute_script.call_args_list[0]
+        assert first_call.args == (_COOKIE_BANNER_JS, list(_COOKIE_SELECTORS))
+        assert _COOKIE_SELECTORS[0] == "#didomi-notice-agree-button"
+        assert any(selector.startswith("//") for selector in _COOKIE_SELECTORS)
+        mock_parser.webdriver.find_element.assert_not_called()
 
-        # Should log error with error ID
-        assert "[ERR_COOKIE_001]" in caplog.text
-        assert "RuntimeError" in caplog.text
-
-    def test_strategy2_css_continues_on_no_such_element(self, mock_parser, caplog):
-        """Test that CSS strategy continues through all selectors."""
+    def test_no_match_is_not_an_error(self, mock_parser, caplog):
+        """Test that a page without banner doesn't log an error."""
         caplog.set_level(logging.INFO)
-
-        # All CSS selectors fail with NoSuchElementException
-        mock_parser.webdriver.find_element.side_effect = NoSuchElementException()
+        mock_parser.webdriver.execute_script.return_value = None
 
         mock_parser._accept_cookies()
 
-        # Should try multiple selectors (no crash)
-        assert mock_parser.webdriver.find_element.call_count >= 4  # ID + CSS selectors
+        assert "[ERR_COOKIE_001]" not in caplog.text
+        assert mock_parser.cookies_accepted is False
 
-    def test_strategy2_css_logs_unexpected_error(self, mock_parser, caplog):
-        """Test that CSS strategy logs unexpected errors."""
+    def test_logs_probe_script_error(self, mock_parser, caplog):
+        """Test that a failing probe script is logged and the fallback still runs."""
         caplog.set_level(logging.ERROR)
-
-        # First call (ID) fails, then CSS raises unexpected error
-        mock_parser.webdriver.find_element.side_effect = [
-            NoSuchElementException(),  # ID fails
-            ValueError("Unexpected CSS error"),  # First CSS selector fails unexpectedly
+        mock_parser.webdriver.execute_script.side_effect = [
+            JavascriptException("SyntaxError"),
+            None,  # Coordinate click
         ]
 
         mock_parser._accept_cookies()
 
-        # Should log with ERR_COOKIE_002
-        assert "[ERR_COOKIE_002]" in caplog.text
-        assert "ValueError" in caplog.text
-
-    def test_strategy3_xpath_continues_on_failure(self, mock_parser, caplog):
-        """Test that XPath strategy continues through patterns."""
-        caplog.set_level(logging.INFO)
-
-        # All XPath patterns fail
-        mock_parser.webdriver.find_element.side_effect = NoSuchElementException()
-
-        mock_parser._accept_cookies()
-
-        # Should try multiple XPath patterns (no crash)
-        # ID + CSS (4) + XPath (3) = at least 8 calls
-        assert mock_parser.webdriver.find_element.call_count >= 8
+        assert "[ERR_COOKIE_001]" in caplog.text
+        assert "SyntaxError" in caplog.text
+        assert mock_parser.webdriver.execute_script.call_count == 2
 
-    def test_strategy3_xpath_logs_unexpected_error(self, mock_parser, caplog):
-        """Test that XPath strategy logs unexpected errors."""
+    def test_logs_unexpected_exceptions(self, mock_parser, caplog):
+        """Test that unexpected exceptions are logged with error ID."""
         caplog.set_level(logging.ERROR)
-
-        # Make all ID/CSS fail normally, then XPath raises unexpected
-        call_count = 0
-
-        def side_effect_func(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 5:  # ID + CSS selectors
-                raise NoSuchElementException()
-            else:  # XPath
-                raise AttributeError("Unexpected XPath error")
-
-        mock_parser.webdriver.find_element.side_effect = side_effect_func
+        mock_parser.webdriver.execute_script.side_effect = [RuntimeError("Unexpected"), None]
 
         mock_parser._accept_cookies()
 
-        # Should log with ERR_COOKIE_003
-        assert "[ERR_COOKIE_003]" in caplog.text
-        assert "AttributeError" in caplog.text
+        assert "[ERR_COOKIE_001]" in caplog.text
+        assert "RuntimeError" in caplog.text
 
     def test_strategy4_coordinate_logs_javascript_failure(self, mock_parser, caplog):
         """Test that coordinate strategy logs JavaScript execution failures."""
         caplog.set_level(logging.ERROR)
 
-        # All DOM strategies fail
-        mock_parser.webdriver.find_element.side_effect = NoSuchElementException()
-
-        # JavaScript execution fails
-        mock_parser.webdriver.execute_script.side_effect = RuntimeError("JS failed")
+        # DOM probe finds nothing, then the coordinate click fails
+        mock_parser.webdriver.execute_script.side_effect = [None, RuntimeError("JS failed")]
 
-        # ActionChains also fails
-        with patch("src.parser.ActionChains") as mock_actions:
-            mock_chain = MagicMock()
-            mock_chain.move_by_offset.return_value = mock_chain
-            mock_chain.click.return_value = mock_chain
-            mock_chain.perform.side_effect = RuntimeError("ActionChains failed")
-            mock_actions.return_value = mock_chain
-
-            mock_parser._accept_cookies()
+        mock_parser._accept_cookies()
 
-        # Should log with ERR_COOKIE_006
+        # Should log with ERR_COOKIE_006, after a single coordinate-click attempt
         assert "[ERR_COOKIE_006]" in caplog.text
+        assert mock_parser.webdriver.execute_script.call_count == 2
 
-    def test_success_logs_info_message(self, mock_parser, caplog):
-        """Test that successful cookie dismissal logs info message."""
+    def test_success_logs_matched_selector(self, mock_parser, caplog):
+        """Test that successful cookie dismissal logs which selector matched."""
         caplog.set_level(logging.INFO)
-
-        # Mock successful ID selector click
-        mock_element = MagicMock()
-        mock_parser.webdriver.find_element.return_value = mock_element
+        mock_parser.webdriver.execute_script.return_value = "#didomi-notice-agree-button"
 
         mock_parser._accept_cookies()
 
-        # Should log success
-        assert "Cookie banner dismissed" in caplog.text
-        assert "ID selector" in caplog.text
+        assert "Cookie banner dismissed via selector: #didomi-notice-agree-button" in caplog.text
+        assert mock_parser.cookies_accepted is True
+        mock_parser.webdriver.execute_script.assert_called_once()
 
     def test_headless_mode_skips_coordinates(self, mocker, caplog):
         """Test that headless mode skips coordinate-based fallback."""
@@ -191,13 +118,13 @@ class TestCookieBannerExceptionHandling:
             parser = Parser(headless=True)
             parser.webdriver = mock_driver
 
-            # All DOM strategies fail
-            parser.webdriver.find_element.side_effect = NoSuchElementException()
+            # No DOM strategy matched
+            parser.webdriver.execute_script.return_value = None
 
             parser._accept_cookies()
 
-            # Should NOT call execute_script (coordinate strategy)
-            parser.webdriver.execute_script.assert_not_called()
+            # Only the probe script ran, not the coordinate strategy
+            parser.webdriver.execute_script.assert_called_once()
 
 
 class TestWebDriverCrashHandling:
@@ -215,12 +142,11 @@ class TestWebDriverCrashHandling:
 
             yield parser
 
-    def test_accept_cookies_webdriver_crash_id_strategy_raises(self, mock_parser, caplog):
-        """Regression test: WebDriver crash in ID strategy raises exception."""
+    def test_accept_cookies_invalid_session_raises(self, mock_parser, caplog):
+        """Regression test: lost session during the probe raises exception."""
         caplog.set_level(logging.CRITICAL)
 
-        # Mock find_element to raise InvalidSessionIdException
-        mock_parser.webdriver.find_element.side_effect = InvalidSessionIdException(
+        mock_parser.webdriver.execute_script.side_effect = InvalidSessionIdException(
             "Session not found"
         )
 
@@ -232,44 +158,14 @@ class TestWebDriverCrashHandling:
         assert "[ERR_COOKIE_007]" in caplog.text
         assert "FATAL: WebDriver session lost" in caplog.text
 
-    def test_accept_cookies_webdriver_exception_css_strategy_raises(self, mock_parser, caplog):
-        """Regression test: WebDriverException in CSS strategy raises exception."""
+    def test_accept_cookies_webdriver_exception_raises(self, mock_parser, caplog):
+        """Regression test: WebDriverException during the probe raises exception."""
         caplog.set_level(logging.CRITICAL)
 
-        # ID strategy fails (expected), then CSS crashes
-        mock_parser.webdriver.find_element.side_effect = [
-            NoSuchElementException(),  # ID fails (expected)
-            WebDriverException("Browser crashed"),  # CSS crashes
-        ]
+        mock_parser.webdriver.execute_script.side_effect = WebDriverException("Browser crashed")
 
-        # Should raise exception (not continue silently)
         with pytest.raises(WebDriverException):
             mock_parser._accept_cookies()
 
-        # Should log ERR_COOKIE_007
-        assert "[ERR_COOKIE_007]" in caplog.text
-        assert "FATAL: WebDriver session lost" in caplog.text
-
-    def test_accept_cookies_webdriver_crash_xpath_strategy_raises(self, mock_parser, caplog):
-        """Regression test: WebDriver crash in XPath strategy raises exception."""
-        caplog.set_level(logging.CRITICAL)
-
-        # ID and CSS fail (expected), XPath crashes
-        call_count = [0]
-
-        def side_effect_fn(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] <= 5:  # ID + 4 CSS selectors
-                raise NoSuchElementException()
-            else:  # XPath crashes
-                raise InvalidSessionIdException("Session lost")
-
-        mock_parser.webdriver.find_element.side_effect = side_effect_fn
-
-        # Should raise exception
-        with pytest.raises(InvalidSessionIdException):
-            mock_parser._accept_cookies()
-
-        # Should log ERR_COOKIE_007
         assert "[ERR_COOKIE_007]" in caplog.text
         assert "FATAL: WebDriver session lost" in caplog.text
@@ -5,7 +5,7 @@ Validates that headless mode:
 - Skips coordinate-based cookie fallback
 - Verifies page structure after cookie handling
 - Logs critical error if page fails to load
-- Handles NoSuchElementException gracefully
+- Folds the page check into the cookie banner probe script
 
 Author: @pj35 - LeagueStats Coach
 """
@@ -13,7 +13,6 @@ Author: @pj35 - LeagueStats Coach
 import pytest
 import logging
 from unittest.mock import MagicMock, patch
-from selenium.common.exceptions import NoSuchElementException
 
 from src.parser import Parser
 
@@ -35,32 +34,20 @@ class TestParserHeadlessMode:
 
     def test_headless_mode_skips_coordinate_fallback(self, headless_parser):
         """Test that headless mode does NOT use coordinate-based fallback."""
-        # All DOM strategies fail
-        headless_parser.webdriver.find_element.side_effect = NoSuchElementException()
+        # No DOM strategy matched
+        headless_parser.webdriver.execute_script.return_value = None
 
         headless_parser._accept_cookies()
 
-        # Should NOT call execute_script (coordinate strategy is GUI-only)
-        headless_parser.webdriver.execute_script.assert_not_called()
+        # Only the probe ran (coordinate strategy is GUI-only)
+        headless_parser.webdriver.execute_script.assert_called_once()
 
     def test_headless_mode_verifies_page_load_success(self, headless_parser, caplog):
         """Test that headless mode verifies page structure when loaded successfully."""
         caplog.set_level(logging.INFO)
 
-        # Simulate all DOM strategies fail, but body element exists (page loaded)
-        call_count = 0
-
-        def find_element_side_effect(by, value):
-            nonlocal call_count
-            call_count += 1
-            if value == "body":
-                # Last call is verification - return mock body
-                return MagicMock()
-            else:
-                # Cookie banner searches fail
-                raise NoSuchElementException()
-
-        headless_parser.webdriver.find_element.side_effect = find_element_side_effect
+        # No banner, but the page has a <body> (probe returns null)
+        headless_parser.webdriver.execute_script.return_value = None
 
         headless_parser._accept_cookies()
 
@@ -73,8 +60,8 @@ class TestParserHeadlessMode:
         """Test that headless mode logs CRITICAL error if page fails to load."""
         caplog.set_level(logging.CRITICAL)
 
-        # All elements fail (including body verification)
-        headless_parser.webdriver.find_element.side_effect = NoSuchElementException()
+        # Probe reports a document without <body>
+        headless_parser.webdriver.execute_script.return_value = False
 
         headless_parser._accept_cookies()
 
@@ -86,17 +73,7 @@ class TestParserHeadlessMode:
     def test_headless_mode_logs_skip_message(self, headless_parser, caplog):
         """Test that headless mode logs why coordinate fallback is skipped."""
         caplog.set_level(logging.INFO)
-
-        # Make all cookie banner searches fail, but body verification succeeds
-        def find_element_side_effect(by, value):
-            if value == "body":
-                # Body verification succeeds
-                return MagicMock()
-            else:
-                # Cookie banner searches fail
-                raise NoSuchElementException()
-
-        headless_parser.webdriver.find_element.side_effect = find_element_side_effect
+        headless_parser.webdriver.execute_script.return_value = None
 
         headless_parser._accept_cookies()
 
@@ -104,16 +81,13 @@ class TestParserHeadlessMode:
         assert "Skipping coordinate-based cookie fallback in headless mode" in caplog.text
         assert "DOM strategies sufficient" in caplog.text
 
-    def test_headless_mode_returns_after_skip(self, headless_parser):
-        """Test that headless mode returns early (doesn't execute GUI strategies)."""
-        # Body exists
-        mock_body = MagicMock()
-        headless_parser.webdriver.find_element.return_value = mock_body
+    def test_headless_mode_needs_no_extra_round_trip(self, headless_parser):
+        """Test that headless mode checks the page within the probe (no find_element)."""
+        headless_parser.webdriver.execute_script.return_value = None
 
         headless_parser._accept_cookies()
 
-        # Should NOT attempt JavaScript or ActionChains (GUI strategies)
-        headless_parser.webdriver.execute_script.assert_not_called()
+        headless_parser.webdriver.find_element.assert_not_called()
 
 
 class TestParserGUIMode:
@@ -135,36 +109,23 @@ class TestParserGUIMode:
         """Test that GUI mode still tries coordinate-based fallback."""
         caplog.set_level(logging.INFO)
 
-        # All DOM strategies fail
-        gui_parser.webdriver.find_element.side_effect = NoSuchElementException()
-
-        # Mock successful JavaScript click
+        # No DOM strategy matched, then the JavaScript click succeeds
         gui_parser.webdriver.execute_script.return_value = None
 
         gui_parser._accept_cookies()
 
-        # Should attempt JavaScript coordinate click (not skip it)
-        gui_parser.webdriver.execute_script.assert_called_once()
+        # Should attempt JavaScript coordinate click after the probe (not skip it)
+        assert gui_parser.webdriver.execute_script.call_count == 2
+        assert "elementFromPoint" in gui_parser.webdriver.execute_script.call_args.args[0]
 
         # Should NOT log headless skip message
         assert "Skipping coordinate-based cookie fallback" not in caplog.text
 
-    def test_gui_mode_does_not_verify_body(self, gui_parser):
-        """Test that GUI mode doesn't verify body element (only headless does)."""
-        # All DOM strategies fail
-        gui_parser.webdriver.find_element.side_effect = NoSuchElementException()
-
-        # Mock successful JavaScript click
+    def test_gui_mode_does_not_verify_body(self, gui_parser, caplog):
+        """Test that GUI mode doesn't verify the page (only headless does)."""
+        caplog.set_level(logging.INFO)
         gui_parser.webdriver.execute_script.return_value = None
 
         gui_parser._accept_cookies()
 
-        # Should only call find_element for cookie banner searches + coordinate strategies
-        # Should NOT call find_element with "body" argument
-        find_element_calls = gui_parser.webdriver.find_element.call_args_list
-
-        # Check that "body" was not searched for (only cookie banner elements)
-        body_calls = [
-            call for call in find_element_calls if len(call[0]) > 1 and call[0][1] == "body"
-        ]
-        assert len(body_calls) == 0, "GUI mode should not verify body element"
+        assert "Page structure verified" not in caplog.text
@@ -6,7 +6,7 @@ import sys
 from unittest.mock import Mock, patch, MagicMock, call
 import pytest
 
-from src.pool_manager import PoolManager, ChampionPool
+from src.pool_manager import PoolManager, ChampionPool, suggest_champions
 
 
 class TestPoolManagerBanRecalculation:
@@ -316,3 +316,97 @@ class TestPoolManagerBanRecalculation:
                 for call_str in print_calls
             )
             assert error_found, "Expected error log for filesystem failure not found"
+
+
+class TestChampionPoolDedup:
+    def test_duplicates_removed_in_order(self):
+        pool = ChampionPool("Test", ["Garen", "Aatrox", "Garen", "Darius", "Aatrox"])
+
+        assert pool.champions == ["Garen", "Aatrox", "Darius"]
+
+    def test_source_list_is_not_shared(self):
+        source = ["Aatrox", "Darius"]
+        pool = ChampionPool("Test", source)
+
+        pool.add_champion("Garen")
+
+        assert source == ["Aatrox", "Darius"]
+
+
+class TestSuggestChampions:
+    CHAMPIONS = {"Aatrox", "Ahri", "Akali", "Kalista", "Zed", "Talon"}
+
+    def test_prefix_and_substring_matches_sorted(self):
+        assert suggest_champions("al", self.CHAMPIONS) == ["Akali", "Kalista", "Talon"]
+
+    def test_case_insensitive_and_limited(self):
+        assert suggest_champions("A", self.CHAMPIONS, limit=2) == ["Aatrox", "Ahri"]
+
+    def test_no_match(self):
+        assert suggest_champions("xyz", self.CHAMPIONS) == []
+
+
+class TestSaveCustomPoolsAtomic:
+    @patch("builtins.print")
+    def test_save_replaces_file_without_leftover_tmp(self, mock_print, tmp_path):
+        pools_file = tmp_path / "champion_pools.json"
+        pools_file.write_text('{"custom_pools": []}', encoding="utf-8")
+
+        with patch("src.pool_manager.get_user_pools_path", return_value=str(pools_file)):
+            manager = PoolManager()
+            manager.create_pool("Mine", ["Aatrox"])
+            assert manager.save_custom_pools(recalculate_bans=False) is True
+
+        saved = json.loads(pools_file.read_text(encoding="utf-8"))
+        assert [pool["name"] for pool in saved["custom_pools"]] == ["Mine"]
+        assert list(tmp_path.iterdir()) == [pools_file]
+
+    @patch("builtins.print")
+    def test_failed_write_keeps_previous_file(self, mock_print, tmp_path):
+        pools_file = tmp_path / "champion_pools.json"
+        previous = '{"custom_pools": []}'
+        pools_file.write_text(previous, encoding="utf-8")
+
+        with patch("src.pool_manager.get_user_pools_path", return_value=str(pools_file)):
+            manager = PoolManager()
+            manager.create_pool("Mine", ["Aatrox"])
+            with patch("src.pool_manager.os.replace", side_effect=OSError("disk full")):
+                assert manager.save_custom_pools(recalculate_bans=False) is False
+
+        assert pools_file.read_text(encoding="utf-8") == previous
+        assert list(tmp_path.iterdir()) == [pools_file]
+
+    @patch("builtins.print")
+    def test_concurrent_saves_use_distinct_temp_files(self, mock_print, tmp_path):
+        pools_file = tmp_path / "champion_pools.json"
+        temp_names = []
+        real_replace = os.replace
+
+        def record_replace(src, dst):
+            temp_names.append(src)
+            real_replace(src, dst)
+
+        with patch("src.pool_manager.get_user_pools_path", return_value=str(pools_file)):
+            manager = PoolManager()
+            manager.create_pool("Mine", ["Aatrox"])
+            with patch("src.pool_manager.os.replace", side_effect=record_replace):
+                manager.save_custom_pools(recalculate_bans=False)
+                manager.save_custom_pools(recalculate_bans=False)
+
+        assert len(set(temp_names)) == 2
+        assert all(os.path.dirname(name) == str(tmp_path) for name in temp_names)
+
+
+class TestPoolStats:
+    @patch("builtins.print")
+    def test_counts_owners_and_roles(self, mock_print, tmp_path):
+        pools_file = tmp_path / "champion_pools.json"
+        with patch("src.pool_manager.get_user_pools_path", return_value=str(pools_file)):
+            manager = PoolManager()
+        manager.pools = {}
+        manager.pools["Top"] = ChampionPool("Top", ["Aatrox"], role="top", created_by="system")
+        manager.create_pool("Mine", ["Garen"], role="top")
+
+        stats = manager.get_pool_stats()
+
+        assert stats == {"total_pools": 2, "custom_pools": 1, "system_pools": 1, "top_pools": 2}
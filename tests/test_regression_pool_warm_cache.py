@@ -18,8 +18,9 @@ Updated: 2026-06-14 (Horizon 2)
 
 Test approach:
     Verify that warm_cache() can successfully pre-load matchups for all champions
-    in a custom pool without raising AttributeError, and that the reverse matchup
-    method is properly called for each champion.
+    in a custom pool without raising AttributeError, and that the reverse matchups
+    are fetched for each champion (now together with the direct ones, through
+    get_matchups_bidirectional()).
 """
 
 import pytest
@@ -34,19 +35,19 @@ def mock_data_source():
     """Mock data source with all required methods for warm_cache()."""
     mock_db = Mock()
 
-    # Mock direct matchups method (champion as picker)
+    # Mock bidirectional matchups method: (direct, reverse)
+    # direct = champion as picker, reverse = champion as enemy (was missing before fix)
     # MatchupDraft signature: (enemy_name, delta2, pickrate, games)
-    mock_db.get_champion_matchups_for_draft.return_value = [
-        MatchupDraft("Enemy1", 150.0, 10.0, 1000),
-        MatchupDraft("Enemy2", -100.0, 8.0, 800),
-    ]
-
-    # Mock reverse matchups method (champion as enemy) - This was missing before fix
-    # MatchupDraft signature: (enemy_name, delta2, pickrate, games)
-    mock_db.get_reverse_matchups_for_draft.return_value = [
-        MatchupDraft("Picker1", 120.0, 9.0, 900),
-        MatchupDraft("Picker2", -60.0, 7.0, 700),
-    ]
+    mock_db.get_matchups_bidirectional.return_value = (
+        [
+            MatchupDraft("Enemy1", 150.0, 10.0, 1000),
+            MatchupDraft("Enemy2", -100.0, 8.0, 800),
+        ],
+        [
+            MatchupDraft("Picker1", 120.0, 9.0, 900),
+            MatchupDraft("Picker2", -60.0, 7.0, 700),
+        ],
+    )
 
     mock_db.connect.return_value = None
     mock_db.close.return_value = None
@@ -75,9 +76,8 @@ class TestWarmCacheWithCustomPool:
         Scenario:
             - User selects a custom pool with 3 champions
             - DraftMonitor calls assistant.warm_cache(pool)
-            - Assistant should call both:
-              * get_champion_matchups_for_draft() for direct matchups
-              * get_reverse_matchups_for_draft() for reverse matchups
+            - Assistant should call get_matchups_bidirectional() for each champion,
+              fetching direct and reverse matchups together
             - No AttributeError should be raised
         """
         # GIVEN: A custom pool with 3 champions (like pool #9 in real scenario)
@@ -87,26 +87,19 @@ class TestWarmCacheWithCustomPool:
         # This should NOT raise AttributeError
         assistant_with_mock_db.warm_cache(custom_pool)
 
-        # THEN: get_champion_matchups_for_draft() should be called for each champion
-        assert assistant_with_mock_db.db.get_champion_matchups_for_draft.call_count == 3
-
-        # THEN: get_reverse_matchups_for_draft() should be called for each champion (CRITICAL FIX)
-        assert assistant_with_mock_db.db.get_reverse_matchups_for_draft.call_count == 3
+        # THEN: get_matchups_bidirectional() should be called for each champion (CRITICAL FIX)
+        assert assistant_with_mock_db.db.get_matchups_bidirectional.call_count == 3
 
         # THEN: Verify called with correct champion names
-        expected_calls_direct = ["Aatrox", "Darius", "Garen"]
-        actual_calls_direct = [
+        expected_calls = ["Aatrox", "Darius", "Garen"]
+        actual_calls = [
             call[0][0]
-            for call in assistant_with_mock_db.db.get_champion_matchups_for_draft.call_args_list
+            for call in assistant_with_mock_db.db.get_matchups_bidirectional.call_args_list
         ]
-        assert actual_calls_direct == expected_calls_direct
+        assert actual_calls == expected_calls
 
-        expected_calls_reverse = ["Aatrox", "Darius", "Garen"]
-        actual_calls_reverse = [
-            call[0][0]
-            for call in assistant_with_mock_db.db.get_reverse_matchups_for_draft.call_args_list
-        ]
-        assert actual_calls_reverse == expected_calls_reverse
+        # THEN: Reverse matchups were cached for each champion
+        assert set(assistant_with_mock_db._reverse_cache) == set(expected_calls)
 
     def test_warm_cache_empty_pool(self, assistant_with_mock_db):
         """
@@ -124,8 +117,7 @@ class TestWarmCacheWithCustomPool:
         assistant_with_mock_db.warm_cache(empty_pool)
 
         # THEN: No database calls should be made (early return)
-        assistant_with_mock_db.db.get_champion_matchups_for_draft.assert_not_called()
-        assistant_with_mock_db.db.get_reverse_matchups_for_draft.assert_not_called()
+        assistant_with_mock_db.db.get_matchups_bidirectional.assert_not_called()
 
     def test_warm_cache_single_champion(self, assistant_with_mock_db):
         """
@@ -141,13 +133,8 @@ class TestWarmCacheWithCustomPool:
         # WHEN: warm_cache() is called
         assistant_with_mock_db.warm_cache(single_champion_pool)
 
-        # THEN: Both methods should be called exactly once
-        assert assistant_with_mock_db.db.get_champion_matchups_for_draft.call_count == 1
-        assert assistant_with_mock_db.db.get_reverse_matchups_for_draft.call_count == 1
-
-        # THEN: Called with correct champion
-        assistant_with_mock_db.db.get_champion_matchups_for_draft.assert_called_with("Aatrox")
-        assistant_with_mock_db.db.get_reverse_matchups_for_draft.assert_called_with("Aatrox")
+        # THEN: One bidirectional query for that champion
+        assistant_with_mock_db.db.get_matchups_bidirectional.assert_called_once_with("Aatrox")
 
     def test_warm_cache_cache_population(self, assistant_with_mock_db):
         """
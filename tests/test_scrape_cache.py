@@ -0,0 +1,61 @@
+"""Tests for src/scrape_cache.py."""
+
+import os
+import time
+
+from src.parser import champion_url
+from src.scrape_cache import ScrapeCache
+
+ROWS = [("ahri", 52.3, 1.5, -2.1, 3.2, 1234), ("zed", 47.0, -0.5, 2.0, 0.4, 98)]
+
+
+class TestScrapeCacheKey:
+    def test_key_depends_on_every_page_parameter(self):
+        base = ScrapeCache.key("matchups", champion_url("15.24", "aatrox", "top"))
+
+        assert ScrapeCache.key("matchups", champion_url("15.24", "aatrox", "top")) == base
+        assert ScrapeCache.key("synergies", champion_url("15.24", "aatrox", "top")) != base
+        assert ScrapeCache.key("matchups", champion_url("15.24", "garen", "top")) != base
+        assert ScrapeCache.key("matchups", champion_url("15.23", "aatrox", "top")) != base
+        assert ScrapeCache.key("matchups", champion_url("15.24", "aatrox")) != base
+
+    def test_key_follows_the_loaded_url(self):
+        url = champion_url("15.24", "aatrox", "top")
+
+        assert ScrapeCache.key("matchups", url.replace("diamond_plus", "emerald_plus")) != (
+            ScrapeCache.key("matchups", url)
+        )
+
+
+class TestScrapeCacheStorage:
+    def test_round_trip_returns_tuples(self, tmp_path):
+        cache = ScrapeCache(str(tmp_path / "cache"), ttl_seconds=60)
+
+        cache.put("k", ROWS)
+
+        assert cache.get("k") == ROWS
+
+    def test_missing_entry_is_none(self, tmp_path):
+        assert ScrapeCache(str(tmp_path), ttl_seconds=60).get("missing") is None
+
+    def test_expired_entry_is_none(self, tmp_path):
+        cache = ScrapeCache(str(tmp_path), ttl_seconds=60)
+        cache.put("k", ROWS)
+        old = time.time() - 120
+        os.utime(tmp_path / "k.json", (old, old))
+
+        assert cache.get("k") is None
+
+    def test_corrupt_entry_is_ignored(self, tmp_path, caplog):
+        (tmp_path / "k.json").write_text("{not json")
+
+        assert ScrapeCache(str(tmp_path), ttl_seconds=60).get("k") is None
+        assert "unreadable" in caplog.text
+
+    def test_unserializable_rows_are_not_written(self, tmp_path, caplog):
+        cache = ScrapeCache(str(tmp_path), ttl_seconds=60)
+
+        cache.put("k", [object()])
+
+        assert os.listdir(tmp_path) == []
+        assert "Could not write" in caplog.text
@@ -10,6 +10,7 @@ Sprint: 2 - API Integration (Adapter Pattern Implementation)
 """
 
 import pytest
+from unittest.mock import patch
 from src.sqlite_data_source import SQLiteDataSource
 from src.models import Matchup, MatchupDraft, Synergy
 
@@ -80,6 +81,35 @@ class TestSQLiteDataSourceChampionQueries:
         champion_name = data_source_with_champions.get_champion_by_id(9999)
         assert champion_name is None
 
+    def test_champion_lookups_are_memoized_until_cleared(self, data_source_with_champions):
+        """Test repeat lookups skip the database and clear_champion_cache() refreshes them."""
+        data_source = data_source_with_champions
+        aatrox_id = data_source.get_champion_id("Aatrox")
+
+        with patch.object(data_source._db, "get_champion_id") as sql_lookup:
+            assert data_source.get_champion_id("Aatrox") == aatrox_id
+        sql_lookup.assert_not_called()
+
+        assert data_source.get_champion_by_id(aatrox_id) == "Aatrox"
+        data_source._db.connection.execute(
+            "UPDATE champions SET name = ? WHERE id = ?", ("Renamed", aatrox_id)
+        )
+        data_source._db.connection.commit()
+        assert data_source.get_champion_by_id(aatrox_id) == "Aatrox"  # Memoized hit
+        data_source.clear_champion_cache()
+        assert data_source.get_champion_by_id(aatrox_id) == "Renamed"
+
+    def test_champion_lookup_misses_are_not_memoized(self, data_source_with_champions):
+        """Test a champion inserted after a failed lookup is found without clearing."""
+        data_source = data_source_with_champions
+        assert data_source.get_champion_id("Newchamp") is None
+
+        cursor = data_source._db.connection.cursor()
+        cursor.execute("INSERT INTO champions (name) VALUES (?)", ("Newchamp",))
+        data_source._db.connection.commit()
+
+        assert data_source.get_champion_id("Newchamp") is not None
+
     def test_get_all_champion_names_returns_dict(self, data_source_with_champions):
         """Test get_all_champion_names() returns complete mapping."""
         champion_names = data_source_with_champions.get_all_champion_names()
@@ -151,6 +181,20 @@ class TestSQLiteDataSourceMatchupQueries:
             assert hasattr(m, "pickrate")
             assert hasattr(m, "games")
 
+    def test_get_matchups_bidirectional_matches_per_direction_queries(
+        self, data_source_with_matchups, insert_matchup
+    ):
+        """Test get_matchups_bidirectional() returns the same rows as the two draft queries."""
+        insert_matchup("Darius", "Aatrox", 51.0, 50, 80, 6.0, 900)
+        insert_matchup("Riven", "Aatrox", 50.0, 20, 30, 4.0, 150)  # Below reverse games floor
+
+        direct, reverse = data_source_with_matchups.get_matchups_bidirectional("Aatrox")
+
+        assert direct == data_source_with_matchups.get_champion_matchups_for_draft("Aatrox")
+        assert reverse == data_source_with_matchups.get_reverse_matchups_for_draft("Aatrox")
+        assert [m.enemy_name for m in reverse] == ["Darius"]
+        assert data_source_with_matchups.get_matchups_bidirectional("Unknown") == ([], [])
+
     def test_get_matchup_delta2_returns_float(self, data_source_with_matchups):
         """Test get_matchup_delta2() returns correct delta2 value."""
         delta2 = data_source_with_matchups.get_matchup_delta2("Aatrox", "Garen")
@@ -190,6 +234,21 @@ class TestSQLiteDataSourceMatchupQueries:
         assert winrate == 50.0
         data_source.close()
 
+    def test_base_winrate_default_is_not_memoized(self, data_source_with_matchups, insert_matchup):
+        """Test the no-data 50.0 is recomputed once matchups exist, real values are memoized."""
+        data_source = data_source_with_matchups
+        db = data_source._db
+        db.connection.execute("INSERT INTO champions (name) VALUES (?)", ("Newchamp",))
+        db.connection.commit()
+        assert data_source.get_champion_base_winrate("Newchamp") == 50.0
+
+        insert_matchup("Newchamp", "Darius", 60.0, 0, 0, 5.0, 100)
+        assert data_source.get_champion_base_winrate("Newchamp") == 60.0
+
+        db.connection.execute("DELETE FROM matchups WHERE winrate = 60.0")
+        db.connection.commit()
+        assert data_source.get_champion_base_winrate("Newchamp") == 60.0  # Memoized hit
+
 
 class TestSQLiteDataSourceSynergyQueries:
     """Test synergy-related queries delegation."""
@@ -271,6 +330,49 @@ class TestSQLiteDataSourceSynergyQueries:
         delta2 = data_source_with_synergies.get_synergy_delta2("Yasuo", "InvalidChamp")
         assert delta2 is None
 
+    def test_preload_delta2_cache_serves_pairs_from_memory(self, data_source_with_synergies):
+        """Test pair lookups skip SQL after preload_delta2_cache() and match the SQL answer."""
+        data_source = data_source_with_synergies
+        expected = data_source.get_synergy_delta2("Yasuo", "Malphite")
+
+        matchup_pairs, synergy_pairs = data_source.preload_delta2_cache()
+        assert synergy_pairs == 2
+
+        with patch.object(data_source._db, "get_synergy_delta2") as sql_lookup:
+            assert data_source.get_synergy_delta2("yasuo", "MALPHITE") == expected
+            assert data_source.get_synergy_delta2("Yasuo", "InvalidChamp") is None
+        sql_lookup.assert_not_called()
+
+        data_source.clear_delta2_cache()
+        assert data_source.get_synergy_delta2("Yasuo", "Malphite") == expected
+
+    def test_preloaded_synergies_match_direct_lookup_on_multilane_data(
+        self, data_source_with_synergies
+    ):
+        """Test preloaded and SQL synergy lookups agree when a pair has several lane rows."""
+        data_source = data_source_with_synergies
+        yasuo_id = data_source.get_champion_id("Yasuo")
+        gragas_id = data_source.get_champion_id("Gragas")
+        data_source._db.connection.execute(
+            """
+            INSERT INTO synergies (champion, ally, winrate, delta1, delta2, pickrate, games)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            (yasuo_id, gragas_id, 51.0, 80, 60, 2.1, 300),
+        )
+        data_source._db.connection.commit()
+
+        expected = (120 * 600 + 60 * 300) / (600 + 300)
+        direct = {
+            pair: data_source.get_synergy_delta2(*pair)
+            for pair in [("Yasuo", "Malphite"), ("Yasuo", "Gragas")]
+        }
+        assert direct[("Yasuo", "Gragas")] == pytest.approx(expected)
+
+        data_source.preload_delta2_cache()
+        for pair, delta2 in direct.items():
+            assert data_source.get_synergy_delta2(*pair) == pytest.approx(delta2)
+
     def test_get_all_synergies_bulk_returns_dict(self, data_source_with_synergies):
         """Test get_all_synergies_bulk() returns complete synergy cache."""
         synergies_bulk = data_source_with_synergies.get_all_synergies_bulk()
@@ -354,6 +456,27 @@ class TestSQLiteDataSourceChampionScores:
         if len(all_scores) > 0:
             assert isinstance(all_scores[0], tuple)
 
+    def test_save_champion_scores_bulk_upserts_all_rows(self, data_source_with_scores):
+        """Test save_champion_scores_bulk() inserts new rows and replaces existing ones."""
+        data_source = data_source_with_scores
+        cursor = data_source._db.connection.cursor()
+        cursor.execute("INSERT INTO champions (name) VALUES (?)", ("Vayne",))
+        data_source._db.connection.commit()
+        jinx_id = data_source.get_champion_id("Jinx")
+        vayne_id = data_source.get_champion_id("Vayne")
+
+        saved = data_source.save_champion_scores_bulk(
+            [
+                (jinx_id, 1.0, 2.0, 0.5, 3.0, 2.0, 0.4),
+                (vayne_id, -1.0, 4.0, 0.3, 1.0, 4.0, 0.2),
+            ]
+        )
+
+        assert saved == 2
+        assert data_source.get_champion_scores_by_name("Jinx")["avg_delta2"] == 1.0
+        assert data_source.get_champion_scores_by_name("Vayne")["avg_delta2"] == -1.0
+        assert data_source.save_champion_scores_bulk([]) == 0
+
     def test_champion_scores_table_exists_returns_true_with_data(self, data_source_with_scores):
         """Test champion_scores_table_exists() returns True when data exists."""
         exists = data_source_with_scores.champion_scores_table_exists()